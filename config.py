@@ -4,11 +4,29 @@ from dotenv import load_dotenv
 load_dotenv()
 
 # Screen Configuration - Vertical Mounting
-SCREEN_WIDTH = 480   # Rotated from 800
-SCREEN_HEIGHT = 800  # Rotated from 600
+# App canvas size; the panel is mounted rotated, so a 1024x600 panel gives a 600x1024 canvas
+SCREEN_WIDTH = int(os.getenv('SCREEN_WIDTH', '600'))
+SCREEN_HEIGHT = int(os.getenv('SCREEN_HEIGHT', '1024'))
 FPS = 60
 MASCOT_FPS = 30  # FPS for mascot and UI updates
 BRICK_GAME_FPS = 60  # FPS for brick game (ball, paddle, etc.)
+IDLE_FPS = 10  # sensor polls per second once nothing has moved for IDLE_AFTER seconds; keyframes still land on time
+IDLE_AFTER = 5.0  # seconds without input or motion before dropping to IDLE_FPS
+SLEEP_AFTER = 600  # seconds without a button press or drink before the display sleeps
+SLEEP_SENSOR_RATE = 5  # Hz, accelerometer checks for motion while asleep
+# How full-rate frames are timed: 'hybrid' sleeps to just before each frame deadline and
+# spins the rest, 'tick' and 'busy' use pygame's Clock.tick and Clock.tick_busy_loop
+FRAME_PACING = os.getenv('FRAME_PACING', 'hybrid')
+PACER_MAX_SPIN = 0.004  # seconds; the spin covers how late recent sleeps woke, up to this
+VSYNC = os.getenv('VSYNC', '0') == '1'  # renderer backend: presents wait for the display refresh
+DISPLAY_REFRESH_RATE = 60  # Hz, used to line frame deadlines up with refreshes when VSYNC is on
+# 'surface' rotates on the CPU and flips the display, 'renderer' uploads the canvas
+# to an SDL2 texture and rotates it in the renderer (GPU on the Pi when available),
+# 'framebuffer' writes the rotated canvas straight into FRAMEBUFFER_DEVICE
+DISPLAY_BACKEND = os.getenv('DISPLAY_BACKEND', 'surface')
+FRAMEBUFFER_DEVICE = os.getenv('FRAMEBUFFER_DEVICE', '/dev/fb0')
+# Composite the mascot screen on an 8-bit grayscale canvas (surface backend only)
+PALETTE_MODE = os.getenv('PALETTE_MODE', '0') == '1'
 
 # Colors - Black and White Theme
 WHITE = (255, 255, 255)
@@ -40,6 +58,13 @@ BUTTON_RIGHT = 'd'   # Start game button
 BUTTON_LEFT_PI = 'yellow button'
 BUTTON_RIGHT_PI = 'blue button' 
 
+# Touch Input (distances in canvas pixels at the 600x1024 design size)
+TOUCH_TAP_SLOP = 15  # movement still counted as a tap or long press
+TOUCH_SWIPE_DISTANCE = 80  # movement that makes a swipe
+TOUCH_LONG_PRESS_TIME = 0.6  # seconds held in place for a long press
+TOUCH_GRID_CELL = 64  # hit-test grid cell size
+TOUCH_LATENCY_SAMPLES = 200  # recent touch-to-screen latencies kept for percentiles
+
 # Button Function Modes
 BUTTON_MODE_MAIN = 'main'      # Main screen
 BUTTON_MODE_BRICK = 'brick'    # Brick breaker game controls
@@ -83,6 +108,23 @@ HEALTH_STATES = {
     'critical': {'min': 0, 'emotion': 'dying', 'color': BLACK}
 }
 
+# Health Decay
+HEALTH_DECAY_INTERVAL = 2  # seconds between health_decay_rate steps
+
+# Mascot Animation
+LOW_RES_FACTOR = 4  # mascot layer is drawn at 1/N resolution and upscaled once (1 disables)
+DIZZY_ROTATION_STEPS = 24  # pre-rendered angles for the dizzy spin (15 degrees apart)
+KEYFRAME_TIME = 1 / 3  # seconds each frame of the 2-frame idle, sad and drinking loops shows
+
+# Sprite Effects
+EFFECT_STEPS = 8  # opacity levels pre-rendered for the fade and dither effects
+SPRITE_EFFECT_CACHE_KB = 4096  # memory kept for effect variants, least recently used go first
+HURT_FLASH_TIME = 0.6  # seconds the mascot blinks inverted when shaken or turning sad
+HURT_FLASH_RATE = 10  # inverted/plain switches per second while hurt
+DEATH_FADE_TIME = 2.0  # seconds the mascot fades out over when it dies
+DEATH_FADE_FLOOR = 2  # fade step (of EFFECT_STEPS) a dead mascot stays at
+APPEAR_TIME = 0.5  # seconds a new or woken mascot dissolves in over
+
 # Drinking Detection
 DRINKING_THRESHOLD = 45  # degrees
 DRINKING_DURATION = 2.0  # seconds
@@ -91,6 +133,7 @@ WATER_PER_DRINK = 10  # ml
 # Local AI Response Configuration
 AI_UPDATE_INTERVAL = 300  # 5 minutes
 SPEECH_DURATION = 4.0  # seconds to show speech bubble
+SPEECH_BUBBLE_CACHE_SIZE = 16  # rendered speech bubbles kept for repeated lines
 
 # Game Configuration
 BRICK_GAME_LIVES = 3
@@ -103,15 +146,38 @@ ASSETS_DIR = 'assets'
 SAVE_FILE = 'mascot_save.json'
 CALIBRATION_FILE = 'sensor_calibration.json'
 
+# Frame Recording
+RECORD_MODE = os.getenv('RECORD_MODE', '')  # 'png' or 'raw' records every presented frame, empty disables
+RECORD_DIR = 'recordings'  # each run records into a timestamped folder here
+RECORD_POOL_SIZE = 8  # frame buffers; frames are dropped when all are waiting on the encoder
+RECORD_PNG_COMPRESSION = 1  # zlib level, low keeps the encoder ahead of the frame rate
+
+# Display Mirroring
+MIRROR_ADDRESS = os.getenv('MIRROR_ADDRESS', '')  # 'tcp:0.0.0.0:5900' or 'unix:/tmp/bottle-mirror.sock' streams the display, empty disables
+MIRROR_TILE_SIZE = 32  # frames are diffed and sent in squares of this many pixels
+MIRROR_MAX_FPS = 15  # frames sent per second at most; changes in between are merged
+MIRROR_MAX_KBPS = 2048  # bandwidth cap, big updates pause the stream to stay under it
+MIRROR_COMPRESSION = 1  # zlib level for changed tiles
+MIRROR_SEND_TIMEOUT = 5  # seconds a viewer may stall a send before it is dropped
+
 # Sensor Configuration
 SENSOR_UPDATE_RATE = 60  # Hz
 SENSOR_SIMULATION_MODE = True  # Set to False on Raspberry Pi
 MPU6050_ADDRESS = 0x68
 SMBUS_BUS = 1
+MOTION_WAKE_THRESHOLD = 0.5  # g of change between sleep checks that counts as a pickup
+SHAKE_WINDOW = 0.25  # seconds of accelerometer readings compared to detect a shake
+SHAKE_DURATION = 3.0  # seconds a detected shake stays active
+DRINK_STABLE_TIME = 0.25  # seconds the tilt must hold steady before drinking counts
+
+# Text Rendering
+FONT_FILE = os.path.join(ASSETS_DIR, 'fonts', 'Delicatus-e9OLl.ttf')
+FONT_PRELOAD_SIZES = [18, 20, 24, 28]  # design sizes, scaled to the canvas and loaded in the background at startup
+TEXT_CACHE_SIZE = 128  # rendered strings kept in the shared text cache
 
 # Particle Effects
-MAX_PARTICLES = 20
-PARTICLE_LIFETIME = 60  # frames
+MAX_PARTICLES = 2000  # per particle system, arrays are preallocated
+PARTICLE_LIFETIME = 2.0  # seconds
 PARTICLE_SPEED = 3
 
 # Achievement System
@@ -0,0 +1,322 @@
+import math
+import time
+from collections import deque
+import pygame
+from config import *
+
+# ========================================
+# FRAME GOVERNOR - ADAPTIVE FRAME RATE
+# Full rate while something moves; when idle, frames wait for the next animation
+# keyframe or sensor poll, and input wakes them at once
+# ========================================
+
+# Posted by GPIO button callbacks; like any input event it ends an idle wait
+BUTTON_EVENT = pygame.USEREVENT + 1
+
+# Events that count as the user doing something
+INPUT_EVENTS = [
+    pygame.KEYDOWN, pygame.KEYUP,
+    pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+    pygame.FINGERDOWN, pygame.FINGERUP,
+    pygame.QUIT, pygame.WINDOWCLOSE,
+    BUTTON_EVENT
+]
+
+# Events that end a press; GPIO buttons are only reported on release
+RELEASE_EVENTS = [pygame.KEYUP, pygame.MOUSEBUTTONUP, pygame.FINGERUP, BUTTON_EVENT]
+
+class FrameGovernor:
+    def __init__(self, idle_fps=IDLE_FPS, idle_after=IDLE_AFTER, pacer=None):
+        """Pick each frame's rate and wait for it, waking early when an event arrives"""
+        self.clock = pygame.time.Clock()
+        self.pacer = pacer or FramePacer()
+        self.idle_fps = idle_fps
+        self.idle_after = idle_after
+        self.last_activity = time.monotonic()
+        self.last_frame_time = self.last_activity
+        self.idle = False
+
+        # Statistics
+        self.frames = 0
+        self.idle_frames = 0
+        self.early_wakeups = 0
+        self.idle_time = 0.0
+
+    def note_activity(self):
+        """Something is moving or the user did something, run at full rate"""
+        self.last_activity = time.monotonic()
+
+    def tick(self, fps, next_keyframe=None):
+        """Wait for the next frame and return the seconds since the last one
+
+        Runs at fps while active. After idle_after seconds without activity a frame waits
+        until the next animation keyframe (next_keyframe seconds from now) or the next
+        sensor poll at idle_fps, whichever is first; input ends the wait at once.
+        """
+        now = time.monotonic()
+        self.idle = now - self.last_activity >= self.idle_after
+
+        if self.idle:
+            deadline = self.last_frame_time + 1.0 / self.idle_fps
+            if next_keyframe is not None:
+                deadline = min(deadline, now + next_keyframe)
+            if self.wait_until(deadline):
+                self.early_wakeups += 1
+                self.note_activity()
+            # Keep the clock's reference frame current for when we go back to full rate
+            self.clock.tick()
+            self.idle_frames += 1
+        else:
+            self.pacer.wait(fps)
+
+        now = time.monotonic()
+        dt = now - self.last_frame_time
+        if self.idle:
+            self.idle_time += dt
+        self.last_frame_time = now
+        self.frames += 1
+        return dt
+
+    def wait_until(self, deadline):
+        """Block on SDL's event queue until deadline, return True if input cut the wait short
+
+        Events the wait takes off the queue are put back in order for handle_events.
+        """
+        woken = False
+        taken = []
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            # Rounded up so the wait never ends before a keyframe is due
+            event = pygame.event.wait(math.ceil(remaining * 1000))
+            if event.type == pygame.NOEVENT:
+                continue
+            taken.append(event)
+            if event.type in INPUT_EVENTS:
+                woken = True
+                break
+        if taken:
+            queued = pygame.event.get()
+            for event in taken + queued:
+                pygame.event.post(event)
+        # Frames after this wait start a new deadline grid
+        self.pacer.reset()
+        return woken
+
+    def note_present(self):
+        """A frame reached the screen, for the pacer's interval measurements"""
+        self.pacer.note_present()
+
+    def get_stats(self):
+        """Get how much of the run was spent at the idle rate"""
+        return {
+            'frames': self.frames,
+            'idle_frames': self.idle_frames,
+            'idle_seconds': self.idle_time,
+            'early_wakeups': self.early_wakeups
+        }
+
+# ========================================
+# DISPLAY SLEEP - BLANK WHEN NOBODY IS AROUND
+# No button press or drink for SLEEP_AFTER seconds puts the display to sleep
+# ========================================
+
+class DisplaySleep:
+    def __init__(self, sleep_after=SLEEP_AFTER, clock=time.monotonic):
+        """Track user activity and decide when to sleep; clock is replaceable to fast-forward time"""
+        self.sleep_after = sleep_after
+        self.clock = clock
+        self.last_activity = clock()
+        self.sleeping = False
+        self.sleep_started = 0.0
+
+        # Statistics
+        self.sleep_count = 0
+        self.sleep_time = 0.0
+        self.last_wake_time = 0.0
+
+    def note_activity(self):
+        """A button was pressed or the user drank, stay awake"""
+        self.last_activity = self.clock()
+
+    def should_sleep(self):
+        """Check if the awake display has gone unused for sleep_after seconds"""
+        return not self.sleeping and self.clock() - self.last_activity >= self.sleep_after
+
+    def enter(self):
+        """Mark the display asleep"""
+        self.sleeping = True
+        self.sleep_started = self.clock()
+        self.sleep_count += 1
+
+    def exit(self):
+        """Mark the display awake again, return how many seconds it slept"""
+        slept = self.clock() - self.sleep_started
+        self.sleeping = False
+        self.sleep_time += slept
+        self.note_activity()
+        return slept
+
+    def record_wake_time(self, seconds):
+        """Record how long the first frame after waking took"""
+        self.last_wake_time = seconds
+
+    def get_stats(self):
+        """Get how often and how long the display slept"""
+        return {
+            'sleep_count': self.sleep_count,
+            'sleep_seconds': self.sleep_time,
+            'last_wake_ms': self.last_wake_time * 1000
+        }
+
+# ========================================
+# FRAME PACER - EVEN FRAME INTERVALS
+# Frames are due on a fixed grid of deadlines; the wait sleeps most of the way
+# and spins the last stretch, so sleep granularity doesn't become judder
+# ========================================
+
+FRAME_PACING_MODES = ('hybrid', 'tick', 'busy')
+
+# Overshoots of recent sleeps the hybrid spin is sized from
+PACER_OVERSHOOT_SAMPLES = 60
+# Present-to-present intervals kept for the jitter percentiles
+PACER_INTERVAL_SAMPLES = 600
+
+def percentile(sorted_values, fraction):
+    """Get the value at fraction (0-1) of an ascending list, 0.0 when it is empty"""
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+class FramePacer:
+    def __init__(self, mode=FRAME_PACING, max_spin=PACER_MAX_SPIN, vsync=False, clock=time.perf_counter):
+        """Wait for frame deadlines and measure how evenly frames are presented
+
+        With vsync the present itself waits for the refresh, so the wait only sleeps
+        until half a refresh before the deadline and never spins.
+        """
+        if mode not in FRAME_PACING_MODES:
+            raise ValueError(f"unknown frame pacing mode: {mode}")
+        self.mode = mode
+        self.max_spin = max_spin
+        self.vsync = vsync
+        self.clock = clock
+        self.pygame_clock = pygame.time.Clock()
+        self.deadline = None
+        self.period = 0.0
+        self.spin_margin = max_spin
+        self.overshoots = deque(maxlen=PACER_OVERSHOOT_SAMPLES)
+
+        # Present timing: an interval only counts between presents of consecutive frames at
+        # the same rate; jitter is its distance from that rate's period
+        self.frame = 0
+        self.last_present = None
+        self.last_present_frame = None
+        self.last_present_period = None
+        self.intervals = deque(maxlen=PACER_INTERVAL_SAMPLES)
+        self.jitter = deque(maxlen=PACER_INTERVAL_SAMPLES)
+        # Wait-to-wait jitter: the pacing alone, without the render time varying on top
+        self.last_start = None
+        self.start_jitter = deque(maxlen=PACER_INTERVAL_SAMPLES)
+
+        # Statistics
+        self.frames = 0
+        self.missed = 0
+        self.spin_time = 0.0
+
+    def wait(self, fps):
+        """Wait until the next frame is due at fps"""
+        self.frame += 1
+        self.frames += 1
+        period = 1.0 / fps
+        same_rate = period == self.period
+        self.pace(period)
+        now = self.clock()
+        if self.last_start is not None and same_rate:
+            self.start_jitter.append(abs(now - self.last_start - period))
+        self.last_start = now
+
+    def pace(self, period):
+        """Wait out one frame period with the configured method"""
+        new_rate = period != self.period
+        self.period = period
+        if self.mode == 'tick':
+            self.pygame_clock.tick(1.0 / period)
+            return
+        if self.mode == 'busy':
+            self.pygame_clock.tick_busy_loop(1.0 / period)
+            return
+
+        now = self.clock()
+        if self.deadline is None or new_rate or now - self.deadline > period:
+            # First frame, new rate, or more than a frame late: start a new grid from now
+            # rather than rushing frames out to catch up
+            if self.deadline is not None and not new_rate:
+                self.missed += 1
+            self.deadline = now + period
+            return
+        if now > self.deadline:
+            self.missed += 1
+        else:
+            self.sleep_until(self.deadline)
+        self.deadline += period
+
+    def sleep_until(self, deadline):
+        """Sleep to shortly before deadline, then spin up to it"""
+        if self.vsync:
+            wake_time = deadline - 0.5 / DISPLAY_REFRESH_RATE
+            remaining = wake_time - self.clock()
+            if remaining > 0:
+                time.sleep(remaining)
+            return
+
+        wake_time = deadline - self.spin_margin
+        remaining = wake_time - self.clock()
+        if remaining > 0:
+            time.sleep(remaining)
+            # How late the sleep woke sizes the spin for the next frames
+            self.overshoots.append(max(0.0, self.clock() - wake_time))
+            self.spin_margin = min(self.max_spin, max(self.overshoots) * 1.25)
+
+        spin_start = self.clock()
+        while self.clock() < deadline:
+            # sleep(0) lets other threads (recorder, mirror) have the GIL while spinning
+            time.sleep(0)
+        self.spin_time += self.clock() - spin_start
+
+    def reset(self):
+        """Forget the deadline grid, e.g. after an idle or sleep wait timed the frame instead"""
+        self.deadline = None
+        self.last_start = None
+        self.last_present_frame = None
+
+    def note_present(self):
+        """A frame reached the screen; call right after presenting"""
+        now = self.clock()
+        if self.last_present_frame == self.frame - 1 and self.last_present_period == self.period:
+            interval = now - self.last_present
+            self.intervals.append(interval)
+            self.jitter.append(abs(interval - self.period))
+        self.last_present = now
+        self.last_present_frame = self.frame
+        self.last_present_period = self.period
+
+    def get_stats(self):
+        """Get present interval and jitter percentiles (ms), missed deadlines and time spent spinning"""
+        intervals = sorted(self.intervals)
+        jitter = sorted(self.jitter)
+        start_jitter = sorted(self.start_jitter)
+        return {
+            'mode': self.mode,
+            'frames': self.frames,
+            'missed': self.missed,
+            'interval_p50_ms': percentile(intervals, 0.5) * 1000,
+            'jitter_p50_ms': percentile(jitter, 0.5) * 1000,
+            'jitter_p95_ms': percentile(jitter, 0.95) * 1000,
+            'jitter_p99_ms': percentile(jitter, 0.99) * 1000,
+            'start_jitter_p95_ms': percentile(start_jitter, 0.95) * 1000,
+            'start_jitter_p99_ms': percentile(start_jitter, 0.99) * 1000,
+            'spin_ms_per_frame': self.spin_time / self.frames * 1000 if self.frames else 0.0,
+            'spin_margin_ms': self.spin_margin * 1000
+        }
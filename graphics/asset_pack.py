@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Sprite asset pack for fast startup
+Packs every UI sprite, already scaled and in display pixel format, into one
+raw pixel file plus a JSON index. At runtime the file is memory-mapped and
+surfaces are created over it without copying.
+
+There is one pack per canvas resolution, since sprite scales follow the layout.
+The app writes the pack for its resolution on first boot; to build ahead of time
+(default: SCREEN_WIDTHxSCREEN_HEIGHT):
+    python -m graphics.asset_pack [WIDTHxHEIGHT ...]
+"""
+
+import os
+import sys
+import json
+import mmap
+import time
+import pygame
+from config import *
+
+PACK_VERSION = 2
+
+def get_pack_files(layout):
+    """Get the (pack, index) file paths for a layout's resolution"""
+    name = f"sprites_{layout.get_name()}"
+    return os.path.join(ASSETS_DIR, f"{name}.pack"), os.path.join(ASSETS_DIR, f"{name}.json")
+
+def get_pixel_format(surface):
+    """Get the frombuffer/tobytes format string matching a 32-bit surface's memory layout"""
+    masks = surface.get_masks()
+    if sys.byteorder == 'little':
+        formats = {
+            (0xff0000, 0xff00, 0xff, 0xff000000): 'BGRA',
+            (0xff, 0xff00, 0xff0000, 0xff000000): 'RGBA',
+        }
+    else:
+        formats = {
+            (0xff0000, 0xff00, 0xff, 0xff000000): 'ARGB',
+            (0xff000000, 0xff0000, 0xff00, 0xff): 'RGBA',
+        }
+    return formats.get(tuple(masks), 'RGBA')
+
+def get_display_pixel_format():
+    """Get the pixel format convert_alpha() produces for the current display"""
+    return get_pixel_format(pygame.Surface((1, 1), pygame.SRCALPHA).convert_alpha())
+
+def get_source_stamps(paths):
+    """Get (mtime, size) for each source file, used to detect a stale pack"""
+    stamps = {}
+    for path in paths:
+        stat = os.stat(path)
+        stamps[path] = [stat.st_mtime_ns, stat.st_size]
+    return stamps
+
+def build_asset_pack(layout):
+    """Load and scale every UI sprite from PNG for a layout and write its pack and index"""
+    from graphics.ui import UIController
+
+    ui_controller = UIController(layout, use_asset_pack=False)
+    return write_asset_pack(ui_controller)
+
+def write_asset_pack(ui_controller):
+    """Write the sprites an already loaded UI controller holds as the pack for its layout"""
+    start_time = time.perf_counter()
+    layout = ui_controller.layout
+    pack_file, index_file = get_pack_files(layout)
+
+    pixel_format = get_display_pixel_format()
+    sprites = {}
+    offset = 0
+
+    # Source images are packed at scale 1 so other scales and rotations can still be built
+    surfaces = {(name, 1, 0): image for name, image in ui_controller.source_images.items()}
+    surfaces.update(ui_controller.scaled_cache)
+
+    with open(pack_file, 'wb') as f:
+        for (asset_name, scale, rotation), surface in sorted(surfaces.items()):
+            if rotation:
+                continue
+            pixels = pygame.image.tobytes(surface, pixel_format)
+            f.write(pixels)
+            sprites[f"{asset_name}@{scale}"] = {
+                'offset': offset,
+                'width': surface.get_width(),
+                'height': surface.get_height()
+            }
+            offset += len(pixels)
+
+    index = {
+        'version': PACK_VERSION,
+        'format': pixel_format,
+        'resolution': layout.get_name(),
+        'scales': layout.get_sprite_scales(),
+        'sources': get_source_stamps(ui_controller.source_paths.values()),
+        'sprites': sprites
+    }
+    with open(index_file, 'w') as f:
+        json.dump(index, f, indent=1)
+
+    elapsed = (time.perf_counter() - start_time) * 1000
+    print(f"📦 Built asset pack for {layout.get_name()}: {len(sprites)} sprites, {offset / 1024:.0f} KB in {elapsed:.0f} ms")
+    return index
+
+class AssetPack:
+    def __init__(self, layout):
+        """Memory-mapped sprite pack for a layout's resolution"""
+        self.layout = layout
+        self.pack_file, self.index_file = get_pack_files(layout)
+        self.index = None
+        self.mapping = None
+        self.stale_reason = None
+
+    def is_fresh(self, source_paths):
+        """Check the pack exists and matches the current sources, layout scales and display format"""
+        try:
+            with open(self.index_file, 'r') as f:
+                self.index = json.load(f)
+        except (FileNotFoundError, ValueError):
+            self.stale_reason = "no pack built"
+            return False
+
+        if self.index.get('version') != PACK_VERSION:
+            self.stale_reason = "pack version changed"
+        elif self.index.get('format') != get_display_pixel_format():
+            self.stale_reason = "display pixel format changed"
+        elif self.index.get('scales') != self.layout.get_sprite_scales():
+            self.stale_reason = "sprite scales changed"
+        else:
+            try:
+                if self.index.get('sources') != get_source_stamps(source_paths):
+                    self.stale_reason = "source images changed"
+            except OSError:
+                self.stale_reason = "source images missing"
+        return self.stale_reason is None
+
+    def load(self):
+        """Map the pack and create surfaces over it, return {(asset, scale, 0): surface}"""
+        with open(self.pack_file, 'rb') as f:
+            # Private copy-on-write mapping - pages are only copied if a surface is written to
+            self.mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+
+        view = memoryview(self.mapping)
+        pixel_format = self.index['format']
+        surfaces = {}
+        for key, sprite in self.index['sprites'].items():
+            asset_name, scale = key.rsplit('@', 1)
+            size = (sprite['width'], sprite['height'])
+            end = sprite['offset'] + size[0] * size[1] * 4
+            surfaces[(asset_name, int(scale), 0)] = pygame.image.frombuffer(
+                view[sprite['offset']:end], size, pixel_format)
+        return surfaces
+
+if __name__ == "__main__":
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    from graphics.layout import Layout
+    for resolution in sys.argv[1:] or [f"{SCREEN_WIDTH}x{SCREEN_HEIGHT}"]:
+        width, height = (int(value) for value in resolution.split('x'))
+        build_asset_pack(Layout(width, height))
+    pygame.quit()
@@ -8,11 +8,14 @@ import pygame
 import random
 import math
 import time
-import os
 from config import *
+from graphics.text_cache import render_text
+from graphics.fonts import get_font
+from graphics.particles import ParticleSystem
+from graphics.layout import Layout
 
 class BrickGame:
-    def __init__(self, screen, sensor_manager, app_width=600, app_height=1024, test_mode=False):
+    def __init__(self, screen, sensor_manager, app_width=None, app_height=None, test_mode=False, layout=None):
         self.screen = screen
         self.sensor_manager = sensor_manager
         self.test_mode = test_mode  # Track if we're in test mode
@@ -20,6 +23,9 @@ class BrickGame:
         # Use provided dimensions or fallback to config
         self.width = app_width if app_width else SCREEN_WIDTH
         self.height = app_height if app_height else SCREEN_HEIGHT
+        # Sizes, margins and font sizes for this canvas; speeds scale by the same factor
+        self.layout = layout or Layout(self.width, self.height)
+        self.speed_scale = self.layout.factor
         
         print(f"🎮 Brick game initialized with dimensions: {self.width}x{self.height}")
         if test_mode:
@@ -41,25 +47,23 @@ class BrickGame:
         self.level = 1
         
         # Paddle settings (horizontal in vertical game)
-        self.paddle_width = 80
-        self.paddle_height = 15
+        self.paddle_width, self.paddle_height = self.layout.paddle_size
         self.paddle_x = self.width // 2 - self.paddle_width // 2
-        self.paddle_y = self.height - 50
-        self.paddle_speed = 5
+        self.paddle_y = self.layout.paddle_y
+        self.paddle_speed = 5 * self.speed_scale
         
         # Ball settings
-        self.ball_size = 8
+        self.ball_size = self.layout.ball_size
         self.ball_x = self.width // 2
-        self.ball_y = self.height - 100
-        self.ball_speed_x = 12
-        self.ball_speed_y = -12
+        self.ball_y = self.layout.ball_start_y
+        self.ball_speed_x = 12 * self.speed_scale
+        self.ball_speed_y = -12 * self.speed_scale
         self.ball_launched = False
         
         # Brick settings - More blocks for better gameplay
-        self.brick_width = 50  # Smaller bricks to fit more
-        self.brick_height = 18
+        self.brick_width, self.brick_height = self.layout.brick_size
         self.brick_rows = 12   # More rows
-        self.brick_cols = 10   # More columns
+        self.brick_cols = self.layout.brick_columns  # As many as fit the canvas width (10 at 600 wide)
         self.bricks = []
         self.setup_bricks()
         
@@ -68,7 +72,8 @@ class BrickGame:
         self.max_lives = 3
         
         # Visual effects
-        self.particles = []
+        self.particles = ParticleSystem(MAX_PARTICLES, radius=2)
+        self.game_over_overlay = None
         self.score_flash_timer = 0
         
         # Tilt control
@@ -82,37 +87,22 @@ class BrickGame:
         self.auto_launch_timer = 2.0
         
     def load_custom_font(self):
-        """Load the custom TTF font from assets/fonts"""
-        try:
-            font_path = os.path.join("assets", "fonts", "Delicatus-e9OLl.ttf")
-            if os.path.exists(font_path):
-                self.custom_font = pygame.font.Font(font_path, 24)
-                self.custom_font_small = pygame.font.Font(font_path, 18)
-                print(f"✅ Loaded custom font for brick game: {font_path}")
-            else:
-                print(f"⚠️  Custom font not found: {font_path}")
-                self.custom_font = pygame.font.Font(None, 24)  # Fallback to default
-                self.custom_font_small = pygame.font.Font(None, 18)  # Fallback to default
-        except Exception as e:
-            print(f"❌ Error loading custom font: {e}")
-            self.custom_font = pygame.font.Font(None, 24)  # Fallback to default
-            self.custom_font_small = pygame.font.Font(None, 18)  # Fallback to default
+        """Get the custom TTF fonts from the shared font registry"""
+        self.custom_font = get_font(self.layout.scale_font(24))
+        self.custom_font_small = get_font(self.layout.scale_font(18))
         
     def setup_bricks(self):
         """Setup brick layout"""
         self.bricks = []
         
-        # Calculate spacing to fit all bricks
-        total_brick_width = self.brick_cols * self.brick_width
-        total_brick_height = self.brick_rows * self.brick_height
+        # Add some spacing between bricks
+        brick_spacing_x = self.layout.brick_spacing
+        brick_spacing_y = self.layout.brick_spacing
         
-        # Calculate margins to center the brick layout
+        # Calculate margins to center the brick layout, spacing included
+        total_brick_width = self.brick_cols * (self.brick_width + brick_spacing_x) - brick_spacing_x
         margin_x = (self.width - total_brick_width) // 2
-        margin_y = 80  # Increased top margin from 50 to 80 to move bricks down
-        
-        # Add some spacing between bricks
-        brick_spacing_x = 2
-        brick_spacing_y = 2
+        margin_y = self.layout.brick_top
         
         for row in range(self.brick_rows):
             for col in range(self.brick_cols):
@@ -133,25 +123,24 @@ class BrickGame:
         colors = [WHITE, LIGHT_GRAY, GRAY, DARK_GRAY]
         return colors[row % len(colors)]
         
-    def handle_events(self):
-        """Handle pygame events"""
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+    def handle_event(self, event):
+        """Handle one pygame event the app read; the app owns the event queue"""
+        if event.type == pygame.QUIT:
+            self.running = False
+            
+        elif event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE or event.key == ord(BUTTON_LEFT):
                 self.running = False
-                
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE or event.key == ord(BUTTON_LEFT):
-                    self.running = False
-                elif event.key == pygame.K_SPACE or event.key == ord(BUTTON_RIGHT):
-                    if not self.ball_launched:
-                        self.launch_ball()
+            elif event.key == pygame.K_SPACE or event.key == ord(BUTTON_RIGHT):
+                if not self.ball_launched:
+                    self.launch_ball()
             
     def launch_ball(self):
         """Launch the ball from paddle"""
         if not self.ball_launched:
             self.ball_launched = True
-            self.ball_speed_y = -4
-            self.ball_speed_x = random.uniform(-3, 3)
+            self.ball_speed_y = -4 * self.speed_scale
+            self.ball_speed_x = random.uniform(-3, 3) * self.speed_scale
             print("🎾 Ball launched!")
             
     def update(self, dt):
@@ -172,7 +161,7 @@ class BrickGame:
         self.update_ball()
         
         # Update particles
-        self.update_particles()
+        self.update_particles(dt)
         
         # Update timers
         self.score_flash_timer -= dt
@@ -187,12 +176,16 @@ class BrickGame:
         
         # Use tilt data to move paddle
         if 'tilt_x' in sensor_data:
-            tilt = sensor_data['tilt_x'] * self.tilt_sensitivity
+            tilt = sensor_data['tilt_x'] * self.tilt_sensitivity * self.speed_scale
             self.paddle_x += tilt
             
             # Keep paddle on screen
             self.paddle_x = max(0, min(self.width - self.paddle_width, self.paddle_x))
             
+    def move_paddle_to(self, x):
+        """Center the paddle on x (e.g. under a finger), kept on screen"""
+        self.paddle_x = max(0, min(self.width - self.paddle_width, x - self.paddle_width // 2))
+
     def update_ball(self):
         """Update ball movement and collisions"""
         if not self.ball_launched:
@@ -225,7 +218,7 @@ class BrickGame:
             angle = (hit_pos - 0.5) * 2  # -1 to 1
             
             self.ball_speed_y = -abs(self.ball_speed_y)  # Always go up
-            self.ball_speed_x = angle * 6  # Angle based on hit position
+            self.ball_speed_x = angle * 6 * self.speed_scale  # Angle based on hit position
             
             self.add_particles(self.ball_x, self.ball_y, 'hit')
             
@@ -291,43 +284,25 @@ class BrickGame:
         self.auto_launch_timer = 2.0
         
         # Increase difficulty
-        self.ball_speed_x = min(8, self.ball_speed_x + 0.5)
-        self.ball_speed_y = min(8, abs(self.ball_speed_y) + 0.5)
+        self.ball_speed_x = min(8 * self.speed_scale, self.ball_speed_x + 0.5 * self.speed_scale)
+        self.ball_speed_y = min(8 * self.speed_scale, abs(self.ball_speed_y) + 0.5 * self.speed_scale)
         
         # Setup new bricks
         self.setup_bricks()
         
     def add_particles(self, x, y, particle_type):
         """Add particle effects"""
-        if len(self.particles) > 20:
-            return
-            
         colors = {
             'bounce': WHITE,
             'hit': LIGHT_GRAY,
             'break': GRAY
         }
-        
-        for _ in range(5):
-            particle = {
-                'x': x + random.uniform(-10, 10),
-                'y': y + random.uniform(-10, 10),
-                'vx': random.uniform(-3, 3),
-                'vy': random.uniform(-3, 3),
-                'life': 30,
-                'color': colors.get(particle_type, WHITE)
-            }
-            self.particles.append(particle)
+        self.particles.emit(x, y, 5, colors.get(particle_type, WHITE), spread=10,
+                            vx_range=(-180, 180), vy_range=(-180, 180), life=0.5)
             
-    def update_particles(self):
+    def update_particles(self, dt):
         """Update particle effects"""
-        for particle in self.particles[:]:
-            particle['x'] += particle['vx']
-            particle['y'] += particle['vy']
-            particle['life'] -= 1
-            
-            if particle['life'] <= 0:
-                self.particles.remove(particle)
+        self.particles.update(dt)
                 
     def draw(self):
         """Draw the game"""
@@ -339,9 +314,6 @@ class BrickGame:
         # Update game state
         self.update(dt)
         
-        # Handle events
-        self.handle_events()
-        
         # Clear screen
         self.screen.fill(BLACK)
         
@@ -388,92 +360,93 @@ class BrickGame:
         
     def draw_particles(self):
         """Draw particle effects"""
-        for particle in self.particles:
-            pygame.draw.circle(self.screen, particle['color'], 
-                             (int(particle['x']), int(particle['y'])), 2)
+        self.particles.draw(self.screen)
                              
     def draw_ui(self):
         """Draw UI elements"""
+        scale = self.layout.scale
         # Use custom font if available, otherwise fallback to default
-        font = self.custom_font if self.custom_font else pygame.font.Font(None, 24)
-        controls_font = self.custom_font_small if self.custom_font_small else pygame.font.Font(None, 18)
+        font = self.custom_font if self.custom_font else pygame.font.Font(None, self.layout.scale_font(24))
+        controls_font = self.custom_font_small if self.custom_font_small else pygame.font.Font(None, self.layout.scale_font(18))
         
         # Draw score, level, and lives in a horizontal row at the top
         score_color = WHITE if self.score_flash_timer <= 0 else LIGHT_GRAY
-        score_text = font.render(f"SCORE: {self.score}", True, score_color)
-        level_text = font.render(f"LEVEL: {self.level}", True, GRAY)
-        lives_text = font.render(f"LIVES: {self.lives}", True, GRAY)
+        score_text = render_text(font, f"SCORE: {self.score}", score_color)
+        level_text = render_text(font, f"LEVEL: {self.level}", GRAY)
+        lives_text = render_text(font, f"LIVES: {self.lives}", GRAY)
         
         # Calculate positions for horizontal layout
-        score_x = 10
-        level_x = score_x + score_text.get_width() + 30
-        lives_x = level_x + level_text.get_width() + 30
+        score_x = scale(10)
+        level_x = score_x + score_text.get_width() + scale(30)
+        lives_x = level_x + level_text.get_width() + scale(30)
         
         # Draw the three elements in a row
-        self.screen.blit(score_text, (score_x, 10))
-        self.screen.blit(level_text, (level_x, 10))
-        self.screen.blit(lives_text, (lives_x, 10))
+        self.screen.blit(score_text, (score_x, scale(10)))
+        self.screen.blit(level_text, (level_x, scale(10)))
+        self.screen.blit(lives_text, (lives_x, scale(10)))
         
         # Draw controls in top-right corner (smaller and out of the way)
-        controls_text = controls_font.render("Tilt bottle to move paddle", True, GRAY)
-        controls_x = self.width - controls_text.get_width() - 10
-        self.screen.blit(controls_text, (controls_x, 10))
+        controls_text = render_text(controls_font, "Tilt bottle to move paddle", GRAY)
+        controls_x = self.width - controls_text.get_width() - scale(10)
+        self.screen.blit(controls_text, (controls_x, scale(10)))
         
         # Draw launch instructions in bottom-left corner (away from paddle)
         if not self.ball_launched:
             if self.test_mode:
-                launch_text = controls_font.render("Press blue button or SPACE to launch ball", True, WHITE)
+                launch_text = render_text(controls_font, "Press blue button or SPACE to launch ball", WHITE)
             else:
-                launch_text = controls_font.render("Press blue button to launch ball", True, WHITE)
-            self.screen.blit(launch_text, (10, self.height - 30))
+                launch_text = render_text(controls_font, "Press blue button to launch ball", WHITE)
+            self.screen.blit(launch_text, (scale(10), self.height - scale(30)))
             
             # Show auto-launch countdown in bottom-left corner
             if self.auto_launch_timer > 0:
-                countdown_text = controls_font.render(f"Auto-launch in {self.auto_launch_timer:.1f}s", True, LIGHT_GRAY)
-                self.screen.blit(countdown_text, (10, self.height - 15))
+                countdown_text = render_text(controls_font, f"Auto-launch in {self.auto_launch_timer:.1f}s", LIGHT_GRAY)
+                self.screen.blit(countdown_text, (scale(10), self.height - scale(15)))
         else:
             # Draw exit instructions in top-left corner (small and out of the way)
             if self.test_mode:
-                exit_text = controls_font.render("Press yellow button or ESC to exit", True, GRAY)
+                exit_text = render_text(controls_font, "Press yellow button or ESC to exit", GRAY)
             else:
-                exit_text = controls_font.render("Press yellow button to exit", True, GRAY)
-            self.screen.blit(exit_text, (10, 35))
+                exit_text = render_text(controls_font, "Press yellow button to exit", GRAY)
+            self.screen.blit(exit_text, (scale(10), scale(35)))
         
     def draw_game_over(self):
         """Draw game over screen"""
+        scale = self.layout.scale
         # Use custom font if available, otherwise fallback to default
-        font_large = self.custom_font if self.custom_font else pygame.font.Font(None, 36)
-        font = self.custom_font if self.custom_font else pygame.font.Font(None, 24)
-        font_small = self.custom_font_small if self.custom_font_small else pygame.font.Font(None, 18)
+        font_large = self.custom_font if self.custom_font else pygame.font.Font(None, self.layout.scale_font(36))
+        font = self.custom_font if self.custom_font else pygame.font.Font(None, self.layout.scale_font(24))
+        font_small = self.custom_font_small if self.custom_font_small else pygame.font.Font(None, self.layout.scale_font(18))
         
-        # Semi-transparent overlay
-        overlay = pygame.Surface((self.width, self.height))
-        overlay.set_alpha(128)
-        overlay.fill(BLACK)
-        self.screen.blit(overlay, (0, 0))
+        # Semi-transparent overlay, built once in display format
+        if self.game_over_overlay is None:
+            self.game_over_overlay = pygame.Surface((self.width, self.height)).convert()
+            self.game_over_overlay.fill(BLACK)
+            self.game_over_overlay.set_alpha(128)
+        self.screen.blit(self.game_over_overlay, (0, 0))
         
         # Game over text
-        game_over_text = font_large.render("GAME OVER", True, WHITE)
-        text_rect = game_over_text.get_rect(center=(self.width // 2, self.height // 2 - 50))
+        game_over_text = render_text(font_large, "GAME OVER", WHITE)
+        text_rect = game_over_text.get_rect(center=(self.width // 2, self.height // 2 - scale(50)))
         self.screen.blit(game_over_text, text_rect)
         
         # Final score
-        score_text = font.render(f"Final Score: {self.score}", True, LIGHT_GRAY)
+        score_text = render_text(font, f"Final Score: {self.score}", LIGHT_GRAY)
         score_rect = score_text.get_rect(center=(self.width // 2, self.height // 2))
         self.screen.blit(score_text, score_rect)
         
         # High score
         if self.score >= self.high_score:
-            high_score_text = font.render("NEW HIGH SCORE!", True, WHITE)
+            high_score_text = render_text(font, "NEW HIGH SCORE!", WHITE)
         else:
-            high_score_text = font.render(f"High Score: {self.high_score}", True, GRAY)
-        high_score_rect = high_score_text.get_rect(center=(self.width // 2, self.height // 2 + 30))
+            high_score_text = render_text(font, f"High Score: {self.high_score}", GRAY)
+        high_score_rect = high_score_text.get_rect(center=(self.width // 2, self.height // 2 + scale(30)))
         self.screen.blit(high_score_text, high_score_rect)
         
         # Instructions
         if self.test_mode:
-            exit_text = font_small.render("Press yellow button or ESC to exit", True, GRAY)
+            exit_text = render_text(font_small, "Press yellow button or ESC to exit", GRAY)
         else:
-            exit_text = font_small.render("Press yellow button to exit", True, GRAY)
-        exit_rect = exit_text.get_rect(center=(self.width // 2, self.height // 2 + 80))
+            exit_text = render_text(font_small, "Press yellow button to exit", GRAY)
+        exit_rect = exit_text.get_rect(center=(self.width // 2, self.height // 2 + scale(80)))
         self.screen.blit(exit_text, exit_rect) 
\ No newline at end of file
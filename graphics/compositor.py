@@ -0,0 +1,169 @@
+import time
+import pygame
+from graphics.dirty_rects import DirtyRectTracker
+from graphics.palette import make_indexed_surface, to_indexed, TRANSPARENT_INDEX
+
+# ========================================
+# LAYER COMPOSITOR - RETAINED MODE SCREEN
+# Each layer keeps its own pixels and only re-renders when its version changes
+# ========================================
+
+class Layer:
+    def __init__(self, name, render, size, opaque=False, pixel_scale=1, pixel_offset=(0, 0),
+                 indexed=False, draws_indexed=False):
+        """A cached layer; render(surface) draws it and returns the rect it covers
+
+        With pixel_scale > 1 the layer renders on a surface 1/pixel_scale the size and the
+        drawn area is upscaled (nearest neighbour) into the layer, shifted by pixel_offset.
+        An indexed layer is composited from an 8-bit grayscale copy of what it rendered;
+        with draws_indexed the render callback draws on that 8-bit surface itself.
+        """
+        self.name = name
+        self.render = render
+        self.opaque = opaque
+        self.version = None
+        self.rect = None
+        self.render_count = 0
+        self.indexed = indexed
+        self.draws_indexed = indexed and draws_indexed
+        if self.draws_indexed:
+            self.surface = make_indexed_surface(size, transparent=not opaque)
+        elif opaque:
+            self.surface = pygame.Surface(size).convert()
+        else:
+            self.surface = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+        self.clear_color = TRANSPARENT_INDEX if self.draws_indexed else (0, 0, 0, 0)
+
+        # What compose() blits onto the canvas
+        if indexed and not self.draws_indexed:
+            self.output = make_indexed_surface(size, transparent=not opaque)
+        else:
+            self.output = self.surface
+
+        self.pixel_scale = pixel_scale
+        self.pixel_offset = pixel_offset
+        self.low_res_rect = None
+        if pixel_scale > 1:
+            low_res_size = (-(-size[0] // pixel_scale), -(-size[1] // pixel_scale))
+            self.low_res_surface = pygame.Surface(low_res_size, self.surface.get_flags() & pygame.SRCALPHA, self.surface)
+
+    def update(self, version):
+        """Re-render the layer if its version changed, return True if it did"""
+        if version == self.version:
+            return False
+
+        # Only the area drawn last time needs clearing
+        old_rect = self.rect
+        if not self.opaque and old_rect:
+            self.surface.fill(self.clear_color, old_rect)
+
+        self.version = version
+        self.rect = None
+        if version is not None:
+            if self.pixel_scale > 1:
+                rect = self.render_low_res()
+            else:
+                rect = self.render(self.surface)
+            if rect:
+                self.rect = pygame.Rect(rect).clip(self.surface.get_rect())
+            self.render_count += 1
+
+        if self.output is not self.surface:
+            if not self.opaque and old_rect:
+                self.output.fill(TRANSPARENT_INDEX, old_rect)
+            if self.rect:
+                to_indexed(self.surface, self.output, self.rect, self.opaque)
+        return True
+
+    def render_low_res(self):
+        """Render on the low-resolution surface and upscale the drawn area, return the layer rect"""
+        if self.low_res_rect:
+            self.low_res_surface.fill((0, 0, 0, 0), self.low_res_rect)
+        rect = self.render(self.low_res_surface)
+        self.low_res_rect = pygame.Rect(rect).clip(self.low_res_surface.get_rect()) if rect else None
+        if not self.low_res_rect:
+            return None
+
+        scale = self.pixel_scale
+        source = self.low_res_surface.subsurface(self.low_res_rect)
+        target = pygame.Rect(self.low_res_rect.x * scale + self.pixel_offset[0],
+                             self.low_res_rect.y * scale + self.pixel_offset[1],
+                             self.low_res_rect.width * scale, self.low_res_rect.height * scale)
+        if self.surface.get_rect().contains(target):
+            # Scale straight into the layer pixels
+            pygame.transform.scale(source, target.size, self.surface.subsurface(target))
+        else:
+            # Partly off the layer; the area around it is clear, so MAX blending copies the pixels
+            scaled = pygame.transform.scale(source, target.size)
+            self.surface.blit(scaled, target, special_flags=pygame.BLEND_RGBA_MAX)
+        return target
+
+class LayerCompositor:
+    def __init__(self, canvas):
+        """Composite cached layers onto the canvas, bottom layer first"""
+        self.canvas = canvas
+        self.size = canvas.get_size()
+        self.layers = []
+        self.dirty_tracker = DirtyRectTracker(*self.size)
+
+        # An 8-bit canvas is composited from 8-bit layers
+        self.indexed = canvas.get_bitsize() == 8
+
+        # Statistics
+        self.frames = 0
+        self.composite_time = 0.0
+        self.last_composite_time = 0.0
+
+    def add_layer(self, name, render, opaque=False, pixel_scale=1, pixel_offset=(0, 0), draws_indexed=False):
+        """Add a layer on top of the existing ones"""
+        layer = Layer(name, render, self.size, opaque, pixel_scale, pixel_offset, self.indexed, draws_indexed)
+        self.layers.append(layer)
+        return layer
+
+    def invalidate(self):
+        """Composite the whole canvas on the next frame (e.g. after something else drew on it)"""
+        self.dirty_tracker.invalidate()
+
+    def compose(self, versions):
+        """Bring every layer up to its version and composite the changed areas
+
+        versions maps layer name to a version stamp; None hides the layer.
+        Returns the canvas rects that changed, empty if nothing did.
+        """
+        start_time = time.perf_counter()
+        self.frames += 1
+
+        visible = {name: version for name, version in versions.items() if version is not None}
+        if not self.dirty_tracker.begin_frame(visible):
+            self.last_composite_time = time.perf_counter() - start_time
+            self.composite_time += self.last_composite_time
+            return []
+
+        for layer in self.layers:
+            layer.update(versions.get(layer.name))
+            self.dirty_tracker.set_rect(layer.name, layer.rect)
+        dirty_rects = self.dirty_tracker.end_frame()
+
+        for rect in dirty_rects:
+            for layer in self.layers:
+                if layer.opaque:
+                    self.canvas.blit(layer.output, rect, rect)
+                elif layer.rect:
+                    area = layer.rect.clip(rect)
+                    if area.width and area.height:
+                        self.canvas.blit(layer.output, area, area)
+
+        self.last_composite_time = time.perf_counter() - start_time
+        self.composite_time += self.last_composite_time
+        return dirty_rects
+
+    def get_stats(self):
+        """Get compositing cost and how often each layer re-rendered"""
+        stats = {
+            'frames': self.frames,
+            'last_composite_ms': self.last_composite_time * 1000,
+            'avg_composite_ms': self.composite_time / self.frames * 1000 if self.frames else 0.0,
+            'layer_renders': {layer.name: layer.render_count for layer in self.layers}
+        }
+        stats.update(self.dirty_tracker.get_stats())
+        return stats
@@ -0,0 +1,97 @@
+import pygame
+
+# ========================================
+# DIRTY RECT TRACKER - CHANGED REGIONS ONLY
+# Tracks which screen elements changed since the last frame
+# ========================================
+
+# Above this many rects it is cheaper to push their bounding box
+MAX_DIRTY_RECTS = 8
+
+class DirtyRectTracker:
+    def __init__(self, width, height):
+        """Track per-element state keys and drawn rects on a canvas"""
+        self.bounds = pygame.Rect(0, 0, width, height)
+        self.keys = {}             # element name -> state key from the last frame
+        self.rects = {}            # element name -> rect drawn this frame
+        self.previous_rects = {}   # element name -> rect drawn last frame
+        self.changed = set()
+        self.full_redraw = True
+
+        # Statistics
+        self.frames = 0
+        self.redrawn_frames = 0
+        self.dirty_pixels = 0
+
+    def invalidate(self):
+        """Force the next frame to redraw and push the whole canvas"""
+        self.full_redraw = True
+
+    def begin_frame(self, keys):
+        """Compare each element's state key with the last frame, return True if a redraw is needed"""
+        self.frames += 1
+        self.changed = {name for name, key in keys.items() if name not in self.keys or self.keys[name] != key}
+        # Elements that disappeared need their old area cleared
+        self.changed.update(name for name in self.keys if name not in keys)
+        self.keys = dict(keys)
+
+        if not self.full_redraw and not self.changed:
+            return False
+
+        self.previous_rects = self.rects
+        self.rects = {}
+        self.redrawn_frames += 1
+        return True
+
+    def set_rect(self, name, rect):
+        """Record the area an element covered this frame"""
+        if not rect:
+            return
+        if name in self.rects:
+            self.rects[name] = self.rects[name].union(rect)
+        else:
+            self.rects[name] = pygame.Rect(rect)
+
+    def end_frame(self):
+        """Get the canvas rects that changed this frame"""
+        if self.full_redraw:
+            self.full_redraw = False
+            self.dirty_pixels += self.bounds.width * self.bounds.height
+            return [self.bounds.copy()]
+
+        dirty = []
+        for name in self.changed:
+            for rect in (self.previous_rects.get(name), self.rects.get(name)):
+                if rect:
+                    clipped = rect.clip(self.bounds)
+                    if clipped.width > 0 and clipped.height > 0:
+                        dirty.append(clipped)
+
+        dirty = self.merge_rects(dirty)
+        self.dirty_pixels += sum(rect.width * rect.height for rect in dirty)
+        return dirty
+
+    def merge_rects(self, rects):
+        """Merge overlapping rects so no pixel is pushed twice"""
+        merged = []
+        for rect in rects:
+            index = rect.collidelist(merged)
+            while index != -1:
+                rect = rect.union(merged.pop(index))
+                index = rect.collidelist(merged)
+            merged.append(rect)
+
+        if len(merged) > MAX_DIRTY_RECTS:
+            merged = [merged[0].unionall(merged[1:])]
+        return merged
+
+    def get_stats(self):
+        """Get dirty region statistics"""
+        canvas_pixels = self.bounds.width * self.bounds.height
+        return {
+            'frames': self.frames,
+            'redrawn_frames': self.redrawn_frames,
+            'skipped_frames': self.frames - self.redrawn_frames,
+            'avg_dirty_pixels': self.dirty_pixels / self.frames if self.frames else 0.0,
+            'avg_dirty_fraction': self.dirty_pixels / (self.frames * canvas_pixels) if self.frames else 0.0
+        }
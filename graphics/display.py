@@ -0,0 +1,451 @@
+import os
+import time
+import mmap
+import pygame
+from config import *
+
+# Try to import numpy for surfarray presentation, fall back gracefully if not available
+try:
+    import numpy
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    print("numpy not available - using single-rotation presentation")
+
+# Try to import the SDL2 render API for texture presentation, fall back gracefully if not available
+try:
+    from pygame._sdl2 import video
+    SDL2_VIDEO_AVAILABLE = True
+except ImportError:
+    SDL2_VIDEO_AVAILABLE = False
+    print("pygame._sdl2 not available - using surface presentation")
+
+# ========================================
+# DISPLAY PRESENTER - CANVAS TO SCREEN
+# Puts the vertical app canvas onto the landscape panel
+# ========================================
+
+def map_canvas_rect(rect, canvas_size, screen_size, rotation):
+    """Map a rect on a canvas to the rect it covers on a screen, rotated and centered"""
+    x, y, width, height = rect
+    canvas_width, canvas_height = canvas_size
+
+    if rotation == 270:
+        mapped = pygame.Rect(canvas_height - y - height, x, height, width)
+    elif rotation == 90:
+        mapped = pygame.Rect(y, canvas_width - x - width, height, width)
+    elif rotation == 180:
+        mapped = pygame.Rect(canvas_width - x - width, canvas_height - y - height, width, height)
+    else:
+        mapped = pygame.Rect(x, y, width, height)
+
+    # Rotated canvas is centered on the screen
+    if rotation in (90, 270):
+        rotated_width, rotated_height = canvas_height, canvas_width
+    else:
+        rotated_width, rotated_height = canvas_width, canvas_height
+    screen_width, screen_height = screen_size
+    mapped.move_ip((screen_width - rotated_width) // 2, (screen_height - rotated_height) // 2)
+    return mapped
+
+def map_screen_point(point, canvas_size, screen_size, rotation):
+    """Map a screen point back to the canvas pixel shown there, None if it is off the canvas"""
+    canvas_width, canvas_height = canvas_size
+    if rotation in (90, 270):
+        rotated_width, rotated_height = canvas_height, canvas_width
+    else:
+        rotated_width, rotated_height = canvas_width, canvas_height
+    screen_width, screen_height = screen_size
+    x = int(point[0]) - (screen_width - rotated_width) // 2
+    y = int(point[1]) - (screen_height - rotated_height) // 2
+    if not (0 <= x < rotated_width and 0 <= y < rotated_height):
+        return None
+
+    # Inverse of map_canvas_rect's rotations
+    if rotation == 270:
+        return y, canvas_height - 1 - x
+    if rotation == 90:
+        return canvas_width - 1 - y, x
+    if rotation == 180:
+        return canvas_width - 1 - x, canvas_height - 1 - y
+    return x, y
+
+class Presenter:
+    """Timing statistics shared by the presenters; subclasses set self.mode and call note_present()"""
+
+    def reset_stats(self):
+        """Start the timing statistics over"""
+        self.frames = 0
+        self.total_present_time = 0.0
+        self.last_present_time = 0.0
+        self.pixels_pushed = 0
+
+    def note_present(self, start_time, pixels):
+        """Record a present that began at start_time (perf_counter) and pushed this many pixels"""
+        self.last_present_time = time.perf_counter() - start_time
+        self.total_present_time += self.last_present_time
+        self.frames += 1
+        self.pixels_pushed += pixels
+
+    def get_stats(self):
+        """Get presentation timing statistics"""
+        return {
+            'mode': self.mode,
+            'frames': self.frames,
+            'last_present_ms': self.last_present_time * 1000,
+            'avg_present_ms': (self.total_present_time / self.frames * 1000) if self.frames else 0.0,
+            'avg_pixels_pushed': self.pixels_pushed / self.frames if self.frames else 0.0
+        }
+
+class DisplayPresenter(Presenter):
+    def __init__(self, screen, canvas, rotation=270):
+        """Present a vertical canvas on the physical screen, rotated by 90 or 270 degrees"""
+        self.screen = screen
+        self.canvas = canvas
+        self.rotation = rotation % 360
+
+        # surfarray is indexed [x, y], so a counter-clockwise pygame rotation
+        # is a clockwise numpy rotation
+        self.rot90_k = (-(self.rotation // 90)) % 4
+
+        self.reset_stats()
+
+        self.mode = self.select_mode()
+        print(f"🖥️  Display presenter using '{self.mode}' mode ({self.rotation}° rotation)")
+
+    def select_mode(self):
+        """Pick the cheapest presentation path that works for these surfaces"""
+        if not NUMPY_AVAILABLE:
+            return "rotate"
+
+        # The rotated canvas must cover the screen exactly and share its pixel format
+        if self.get_rotated_size() != self.screen.get_size():
+            return "rotate"
+        if self.canvas.get_bitsize() == 8 and self.screen.get_bytesize() in (2, 4):
+            # Indexed canvas: dirty areas go through a palette -> screen pixel lookup table
+            lut_type = numpy.uint32 if self.screen.get_bytesize() == 4 else numpy.uint16
+            self.palette_lut = numpy.array([self.screen.map_rgb(color) for color in self.canvas.get_palette()],
+                                           dtype=lut_type)
+            return "palette"
+        if self.canvas.get_bitsize() != self.screen.get_bitsize():
+            return "rotate"
+        if self.canvas.get_masks()[:3] != self.screen.get_masks()[:3]:
+            return "rotate"
+        if self.canvas.get_bytesize() not in (2, 4):
+            return "rotate"
+        return "surfarray"
+
+    def canvas_to_screen_rect(self, rect):
+        """Map a rect on the canvas to the rect it covers on the screen"""
+        return map_canvas_rect(rect, self.canvas.get_size(), self.screen.get_size(), self.rotation)
+
+    def get_rotated_size(self):
+        """Get the canvas size after rotation"""
+        canvas_width, canvas_height = self.canvas.get_size()
+        if self.rotation in (90, 270):
+            return canvas_height, canvas_width
+        return canvas_width, canvas_height
+
+    def present(self, dirty_rects=None):
+        """Copy the canvas to the screen with a single rotation and update the display
+
+        dirty_rects are canvas rects; when given only those areas are copied and pushed.
+        """
+        start_time = time.perf_counter()
+
+        if dirty_rects is None:
+            screen_rects = [self.screen.get_rect()]
+        else:
+            screen_rects = [self.canvas_to_screen_rect(rect) for rect in dirty_rects]
+
+        if self.mode == "palette" and dirty_rects is not None:
+            canvas_pixels = pygame.surfarray.pixels2d(self.canvas)
+            screen_pixels = pygame.surfarray.pixels2d(self.screen)
+            rotated_pixels = numpy.rot90(canvas_pixels, self.rot90_k)
+            for rect in screen_rects:
+                screen_pixels[rect.left:rect.right, rect.top:rect.bottom] = \
+                    self.palette_lut[rotated_pixels[rect.left:rect.right, rect.top:rect.bottom]]
+            del canvas_pixels, screen_pixels, rotated_pixels
+        elif self.mode == "surfarray":
+            # Rotate straight into the screen pixels - no intermediate surfaces
+            canvas_pixels = pygame.surfarray.pixels2d(self.canvas)
+            screen_pixels = pygame.surfarray.pixels2d(self.screen)
+            rotated_pixels = numpy.rot90(canvas_pixels, self.rot90_k)
+            if dirty_rects is None:
+                screen_pixels[...] = rotated_pixels
+            else:
+                for rect in screen_rects:
+                    screen_pixels[rect.left:rect.right, rect.top:rect.bottom] = \
+                        rotated_pixels[rect.left:rect.right, rect.top:rect.bottom]
+            del canvas_pixels, screen_pixels, rotated_pixels
+        else:
+            # Single rotation, centered on the screen (an 8-bit canvas is converted by the blit)
+            rotated = pygame.transform.rotate(self.canvas, self.rotation)
+            rotated_rect = rotated.get_rect(center=self.screen.get_rect().center)
+            if dirty_rects is None:
+                if rotated_rect.size != self.screen.get_size():
+                    self.screen.fill(BLACK)
+                self.screen.blit(rotated, rotated_rect)
+            else:
+                for rect in screen_rects:
+                    self.screen.blit(rotated, rect, rect.move(-rotated_rect.x, -rotated_rect.y))
+
+        self.note_present(start_time, sum(rect.width * rect.height for rect in screen_rects))
+
+        if dirty_rects is None:
+            pygame.display.flip()
+        elif screen_rects:
+            pygame.display.update(screen_rects)
+
+# ========================================
+# TEXTURE PRESENTER - SDL2 RENDERER BACKEND
+# Uploads the canvas to a texture and lets the renderer do the rotation
+# ========================================
+
+# SDL_RENDERER_ACCELERATED
+RENDERER_ACCELERATED = 0x2
+
+class TexturePresenter(Presenter):
+    def __init__(self, canvas, size, rotation=270, fullscreen=False, title="Tamagotchi Water Bottle", vsync=VSYNC):
+        """Present a vertical canvas through an SDL2 renderer, rotated in the texture copy
+
+        Needs its own window, so the pygame display should only be a hidden 1x1 mode
+        used for convert()/convert_alpha(). With vsync each present waits for the refresh.
+        """
+        self.canvas = canvas
+        self.size = size
+        self.rotation = rotation % 360
+        self.vsync = vsync
+
+        self.window = video.Window(title, size=size, fullscreen=fullscreen)
+        self.renderer, self.driver = self.create_renderer()
+        self.renderer.draw_color = (*BLACK, 255)
+        self.texture = video.Texture(self.renderer, canvas.get_size(), streaming=True)
+
+        # SDL rotates clockwise around the destination center, pygame rotates counter-clockwise
+        self.angle = (360 - self.rotation) % 360
+        self.dest_rect = canvas.get_rect(center=(size[0] // 2, size[1] // 2))
+
+        self.reset_stats()
+
+        self.mode = f"texture ({self.driver})"
+        print(f"🖥️  Display presenter using '{self.mode}' mode ({self.rotation}° rotation)")
+
+    def create_renderer(self):
+        """Create a renderer, preferring a hardware accelerated driver over the software one"""
+        drivers = list(enumerate(video.get_drivers()))
+        accelerated = [(index, info) for index, info in drivers if info.flags & RENDERER_ACCELERATED]
+        software = [(index, info) for index, info in drivers if not info.flags & RENDERER_ACCELERATED]
+
+        for index, info in accelerated + software:
+            try:
+                return video.Renderer(self.window, index=index, vsync=self.vsync), info.name
+            except Exception as e:
+                print(f"⚠️  Renderer '{info.name}' unavailable: {e}")
+        # Let SDL pick if none of the listed drivers could be created
+        return video.Renderer(self.window, vsync=self.vsync), "default"
+
+    def present(self, dirty_rects=None):
+        """Upload the canvas (or just its dirty rects) and draw it rotated to the window
+
+        The window back buffer is undefined after a present, so the texture is always
+        drawn in full - only the upload shrinks with dirty rects.
+        """
+        start_time = time.perf_counter()
+
+        if dirty_rects is None:
+            self.texture.update(self.canvas)
+            pixels = self.canvas.get_width() * self.canvas.get_height()
+        else:
+            pixels = 0
+            canvas_rect = self.canvas.get_rect()
+            for rect in dirty_rects:
+                rect = pygame.Rect(rect).clip(canvas_rect)
+                if rect.width and rect.height:
+                    self.texture.update(self.canvas.subsurface(rect), area=rect)
+                    pixels += rect.width * rect.height
+
+        self.renderer.clear()
+        self.texture.draw(dstrect=self.dest_rect, angle=self.angle)
+        self.renderer.present()
+
+        self.note_present(start_time, pixels)
+
+    def read_screen(self):
+        """Read back what the renderer would show, as a surface the size of the window"""
+        self.renderer.clear()
+        self.texture.draw(dstrect=self.dest_rect, angle=self.angle)
+        return self.renderer.to_surface()
+
+# ========================================
+# FRAMEBUFFER PRESENTER - DIRECT /dev/fb0 OUTPUT
+# Writes the rotated canvas straight into the memory-mapped framebuffer
+# ========================================
+
+FRAMEBUFFER_SYSFS_DIR = '/sys/class/graphics'
+
+def read_framebuffer_info(device):
+    """Read (size, bits_per_pixel, stride) of a framebuffer device from sysfs, None if it has none"""
+    sysfs_dir = os.path.join(FRAMEBUFFER_SYSFS_DIR, os.path.basename(device))
+    try:
+        with open(os.path.join(sysfs_dir, 'virtual_size')) as f:
+            width, height = (int(value) for value in f.read().strip().split(','))
+        with open(os.path.join(sysfs_dir, 'bits_per_pixel')) as f:
+            bits_per_pixel = int(f.read())
+        with open(os.path.join(sysfs_dir, 'stride')) as f:
+            stride = int(f.read())
+    except (OSError, ValueError):
+        return None
+    return (width, height), bits_per_pixel, stride
+
+class FramebufferPresenter(Presenter):
+    def __init__(self, canvas, device=FRAMEBUFFER_DEVICE, size=None, bits_per_pixel=32, stride=None, rotation=270):
+        """Present a vertical canvas by writing it into a framebuffer device or a file standing in for it
+
+        Geometry comes from sysfs for real devices, otherwise from size/bits_per_pixel/stride.
+        The framebuffer is assumed to be RGB565 at 16 bpp and XRGB8888 at 32 bpp.
+        """
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("numpy is required for framebuffer presentation")
+        if canvas.get_bytesize() != 4:
+            raise ValueError("framebuffer presentation needs a 32-bit canvas")
+
+        info = read_framebuffer_info(device)
+        if info:
+            size, bits_per_pixel, stride = info
+        if size is None:
+            raise ValueError(f"unknown framebuffer size for {device}")
+        if bits_per_pixel not in (16, 32):
+            raise ValueError(f"unsupported framebuffer depth: {bits_per_pixel} bpp")
+
+        self.canvas = canvas
+        self.device = device
+        self.size = tuple(size)
+        self.bits_per_pixel = bits_per_pixel
+        self.rotation = rotation % 360
+        self.rot90_k = (-(self.rotation // 90)) % 4
+
+        bytes_per_pixel = bits_per_pixel // 8
+        self.stride = stride or self.size[0] * bytes_per_pixel
+        length = self.stride * self.size[1]
+
+        # A regular file stands in for the device in tests, grow it to the framebuffer size
+        self.file = open(device, 'r+b' if os.path.exists(device) else 'w+b')
+        if os.path.isfile(device) and os.path.getsize(device) < length:
+            self.file.truncate(length)
+        self.mapping = mmap.mmap(self.file.fileno(), length)
+
+        # Framebuffer pixels as [row, column], padding past the visible width cut off
+        dtype = numpy.uint16 if bits_per_pixel == 16 else numpy.uint32
+        rows = numpy.frombuffer(self.mapping, dtype=dtype).reshape(self.size[1], self.stride // bytes_per_pixel)
+        self.pixels = rows[:, :self.size[0]]
+
+        # Copy channels as they are when the canvas is already XRGB8888, else repack them
+        self.red_shift, self.green_shift, self.blue_shift = canvas.get_shifts()[:3]
+        self.direct_copy = bits_per_pixel == 32 and (self.red_shift, self.green_shift, self.blue_shift) == (16, 8, 0)
+        if not self.direct_copy:
+            # Preallocated scratch so conversion never allocates per frame
+            self.scratch = numpy.empty((2, self.size[1], self.size[0]), dtype=numpy.uint32)
+
+        self.reset_stats()
+
+        self.mode = f"framebuffer ({bits_per_pixel} bpp{', direct copy' if self.direct_copy else ''})"
+        print(f"🖥️  Display presenter using '{self.mode}' mode on {device} ({self.rotation}° rotation)")
+
+    def canvas_to_screen_rect(self, rect):
+        """Map a rect on the canvas to the rect it covers in the framebuffer"""
+        return map_canvas_rect(rect, self.canvas.get_size(), self.size, self.rotation)
+
+    def get_rotated_offset(self):
+        """Get where the rotated canvas's top left corner sits in the framebuffer"""
+        rotated = self.canvas_to_screen_rect(self.canvas.get_rect())
+        return rotated.left, rotated.top
+
+    def present(self, dirty_rects=None):
+        """Write the canvas (or just its dirty rects) into the framebuffer
+
+        The canvas is read through a rotated, transposed view of its pixels, so the only
+        copy is the one into the framebuffer (plus scratch conversion for other formats).
+        """
+        start_time = time.perf_counter()
+
+        screen_rect = pygame.Rect((0, 0), self.size)
+        if dirty_rects is None:
+            screen_rects = [self.canvas_to_screen_rect(self.canvas.get_rect()).clip(screen_rect)]
+        else:
+            screen_rects = [self.canvas_to_screen_rect(rect).clip(screen_rect) for rect in dirty_rects]
+
+        canvas_pixels = pygame.surfarray.pixels2d(self.canvas)
+        # surfarray is [x, y], the framebuffer is [row, column]
+        rotated_rows = numpy.rot90(canvas_pixels, self.rot90_k).T
+        offset_x, offset_y = self.get_rotated_offset()
+
+        pixels = 0
+        for rect in screen_rects:
+            if not (rect.width and rect.height):
+                continue
+            source = rotated_rows[rect.top - offset_y:rect.bottom - offset_y,
+                                  rect.left - offset_x:rect.right - offset_x]
+            target = self.pixels[rect.top:rect.bottom, rect.left:rect.right]
+            if self.direct_copy:
+                target[...] = source
+            else:
+                self.convert_pixels(source, target)
+            pixels += rect.width * rect.height
+        del canvas_pixels, rotated_rows
+
+        self.note_present(start_time, pixels)
+
+    def convert_pixels(self, source, target):
+        """Repack canvas pixels into the framebuffer's RGB565 or XRGB8888 layout"""
+        height, width = source.shape
+        packed = self.scratch[0, :height, :width]
+        channel = self.scratch[1, :height, :width]
+
+        if self.bits_per_pixel == 16:
+            channels = ((self.red_shift, 5, 11), (self.green_shift, 6, 5), (self.blue_shift, 5, 0))
+        else:
+            channels = ((self.red_shift, 8, 16), (self.green_shift, 8, 8), (self.blue_shift, 8, 0))
+
+        packed.fill(0)
+        for shift, bits, position in channels:
+            # Keep the top bits of each 8-bit channel
+            numpy.right_shift(source, shift + 8 - bits, out=channel)
+            numpy.bitwise_and(channel, (1 << bits) - 1, out=channel)
+            numpy.left_shift(channel, position, out=channel)
+            numpy.bitwise_or(packed, channel, out=packed)
+        target[...] = packed
+
+    def close(self):
+        """Unmap the framebuffer"""
+        self.pixels = None
+        self.mapping.close()
+        self.file.close()
+
+# ========================================
+# DISPLAY POWER - BACKLIGHT CONTROL
+# Blanking the canvas leaves the backlight burning, so sleep switches it off too
+# ========================================
+
+BACKLIGHT_SYSFS_DIR = '/sys/class/backlight'
+
+# bl_power values (FB_BLANK_UNBLANK and FB_BLANK_POWERDOWN)
+BACKLIGHT_ON = '0'
+BACKLIGHT_OFF = '4'
+
+def set_backlight(on):
+    """Switch every backlight sysfs exposes on or off, return True if any was switched"""
+    try:
+        devices = os.listdir(BACKLIGHT_SYSFS_DIR)
+    except OSError:
+        return False
+
+    switched = False
+    for device in devices:
+        try:
+            with open(os.path.join(BACKLIGHT_SYSFS_DIR, device, 'bl_power'), 'w') as f:
+                f.write(BACKLIGHT_ON if on else BACKLIGHT_OFF)
+            switched = True
+        except OSError:
+            pass  # No permission or not a real backlight, the blank canvas still shows black
+    return switched
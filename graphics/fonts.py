@@ -0,0 +1,93 @@
+import os
+import time
+import threading
+import pygame
+from config import *
+
+# ========================================
+# FONT REGISTRY - ONE LOAD PER FACE AND SIZE
+# Every screen gets its fonts from here instead of opening the TTF itself
+# ========================================
+
+class FontRegistry:
+    def __init__(self):
+        """Process-wide cache of loaded fonts keyed by (face, size)"""
+        self.fonts = {}
+        self.lock = threading.Lock()
+        self.preload_thread = None
+        self.missing_faces = set()
+
+        # Statistics
+        self.load_count = 0
+        self.fallback_count = 0
+        self.load_time = 0.0
+
+    def get_font(self, size, face=FONT_FILE):
+        """Get a font, loading it the first time this face and size is asked for"""
+        key = (face, size)
+        font = self.fonts.get(key)
+        if font is None:
+            with self.lock:
+                font = self.fonts.get(key)
+                if font is None:
+                    font = self.load_font(face, size)
+                    self.fonts[key] = font
+        return font
+
+    def load_font(self, face, size):
+        """Load a font from disk, falling back to pygame's default font"""
+        start_time = time.perf_counter()
+        font = None
+        if face and os.path.exists(face):
+            try:
+                font = pygame.font.Font(face, size)
+            except Exception as e:
+                print(f"❌ Error loading custom font: {e}")
+        elif face not in self.missing_faces:
+            print(f"⚠️  Custom font not found: {face}")
+            self.missing_faces.add(face)
+
+        if font is None:
+            font = pygame.font.Font(None, size)  # Fallback to default
+            self.fallback_count += 1
+
+        self.load_count += 1
+        self.load_time += time.perf_counter() - start_time
+        return font
+
+    def preload(self, sizes, face=FONT_FILE, background=True):
+        """Load a face at several sizes, on a background thread during startup by default"""
+        def load_all():
+            start_time = time.perf_counter()
+            for size in sizes:
+                self.get_font(size, face)
+            elapsed = (time.perf_counter() - start_time) * 1000
+            print(f"🔤 Preloaded {len(sizes)} font sizes from {face} in {elapsed:.1f} ms")
+
+        if background:
+            self.preload_thread = threading.Thread(target=load_all, name="font-preload", daemon=True)
+            self.preload_thread.start()
+        else:
+            load_all()
+
+    def wait_for_preload(self):
+        """Block until a background preload has finished"""
+        if self.preload_thread:
+            self.preload_thread.join()
+            self.preload_thread = None
+
+    def get_stats(self):
+        """Get font load count and time spent loading"""
+        return {
+            'fonts': len(self.fonts),
+            'load_count': self.load_count,
+            'fallback_count': self.fallback_count,
+            'load_ms': self.load_time * 1000
+        }
+
+# Shared by all rendering code
+font_registry = FontRegistry()
+
+def get_font(size, face=FONT_FILE):
+    """Get a font from the shared font registry"""
+    return font_registry.get_font(size, face)
@@ -0,0 +1,151 @@
+import pygame
+from config import *
+
+# ========================================
+# LAYOUT ENGINE - ONE LAYOUT PER RESOLUTION
+# The UI was designed on the 600x1024 panel; every anchor, offset and sprite
+# scale for another canvas size is derived from that design once
+# ========================================
+
+# Canvas the design values below were laid out on
+DESIGN_WIDTH = 600
+DESIGN_HEIGHT = 1024
+
+# Sprite scales (whole numbers keep pixel-art pixels square)
+HP_BAR_SCALE = 3
+HEART_SCALE = 3
+MASCOT_SCALE = 4
+
+# Source sprite sizes, in sprite pixels
+MASCOT_SPRITE_SIZE = 70
+HP_BAR_SPRITE_SIZE = (108, 10)
+HEART_SPRITE_SIZE = (9, 8)
+
+# Mascot center, relative to the canvas center
+MASCOT_OFFSET_X = 12
+MASCOT_OFFSET_Y = -35
+
+# HP bar and hearts
+HP_BAR_OFFSET_Y = 180  # Distance below mascot center
+HEART_SPACING_EXTRA = 15  # Extra spacing between hearts
+HEART_OFFSET_Y = 10  # Distance above HP bar
+HEART_X_ADJUSTMENT = 110  # Fine-tune horizontal positioning
+
+# Speech bubble
+SPEECH_BUBBLE_MARGIN = 10  # Closest the bubble gets to the canvas edges
+SPEECH_BUBBLE_OFFSET_Y = 150  # Gap between the bubble and the mascot center
+SPEECH_WRAP_WIDTH = 200  # Lines wrap before reaching this width
+SPEECH_TEXT_INSET = (15, 12)  # First line's offset from the bubble's top left corner
+SPEECH_TEXT_LINE_HEIGHT = 20  # Step between text lines
+SPEECH_BUBBLE_LINE_HEIGHT = 25  # Bubble height per line of text
+SPEECH_BUBBLE_PADDING = 15  # Added once to the bubble's height and on both sides of its width
+SPEECH_TAIL_SIZE = (10, 15)  # Half width and height of the tail under the bubble
+
+# Selection screen instruction lines
+SELECTION_TEXT_Y = (100, 130)
+
+# Brick game touch zone for dragging the paddle, along the bottom edge
+PADDLE_ZONE_HEIGHT = 200
+
+# Achievement popup box (x is centered)
+ACHIEVEMENT_BOX_SIZE = (300, 100)
+ACHIEVEMENT_BOX_Y = 80
+ACHIEVEMENT_TITLE_Y = 20  # Title and text centers, below the top of the box
+ACHIEVEMENT_TEXT_Y = 50
+
+# Brick game
+BRICK_SIZE = (50, 18)
+BRICK_SPACING = 2
+BRICK_TOP = 80  # Top of the first brick row
+BRICK_SIDE_MARGIN = 30  # Least room left and right of the bricks; 10 columns fit the design width
+PADDLE_SIZE = (80, 15)
+PADDLE_BOTTOM = 50  # Paddle top, up from the bottom edge
+BALL_SIZE = 8
+BALL_START_BOTTOM = 100  # Ball top before the first launch, up from the bottom edge
+
+class Layout:
+    def __init__(self, width=SCREEN_WIDTH, height=SCREEN_HEIGHT):
+        """Every anchor, offset and sprite scale for a width x height canvas, computed once"""
+        self.width = width
+        self.height = height
+
+        # The axis with less room decides, so the whole design fits
+        self.factor = min(width / DESIGN_WIDTH, height / DESIGN_HEIGHT)
+
+        self.hp_bar_scale = self.scale_sprite(HP_BAR_SCALE)
+        self.heart_scale = self.scale_sprite(HEART_SCALE)
+        self.mascot_scale = self.scale_sprite(MASCOT_SCALE)
+
+        self.mascot_center = (width // 2 + self.scale(MASCOT_OFFSET_X), height // 2 + self.scale(MASCOT_OFFSET_Y))
+        self.hp_bar_offset_y = self.scale(HP_BAR_OFFSET_Y)
+        self.heart_spacing_extra = self.scale(HEART_SPACING_EXTRA)
+        self.heart_offset_y = self.scale(HEART_OFFSET_Y)
+        self.heart_x_adjustment = self.scale(HEART_X_ADJUSTMENT)
+
+        self.speech_bubble_margin = self.scale(SPEECH_BUBBLE_MARGIN)
+        self.speech_bubble_offset_y = self.scale(SPEECH_BUBBLE_OFFSET_Y)
+        self.speech_wrap_width = self.scale(SPEECH_WRAP_WIDTH)
+        self.speech_text_inset = tuple(self.scale(value) for value in SPEECH_TEXT_INSET)
+        self.speech_text_line_height = self.scale(SPEECH_TEXT_LINE_HEIGHT)
+        self.speech_bubble_line_height = self.scale(SPEECH_BUBBLE_LINE_HEIGHT)
+        self.speech_bubble_padding = self.scale(SPEECH_BUBBLE_PADDING)
+        self.speech_tail_size = tuple(self.scale(value) for value in SPEECH_TAIL_SIZE)
+
+        self.selection_text_y = tuple(self.scale(y) for y in SELECTION_TEXT_Y)
+
+        box_width, box_height = (self.scale(value) for value in ACHIEVEMENT_BOX_SIZE)
+        self.achievement_box = pygame.Rect(width // 2 - box_width // 2, self.scale(ACHIEVEMENT_BOX_Y), box_width, box_height)
+        self.achievement_title_y = self.scale(ACHIEVEMENT_TITLE_Y)
+        self.achievement_text_y = self.scale(ACHIEVEMENT_TEXT_Y)
+
+        # Brick game; as many columns as fit between the side margins
+        self.brick_size = tuple(self.scale(value) for value in BRICK_SIZE)
+        self.brick_spacing = max(1, self.scale(BRICK_SPACING))
+        self.brick_top = self.scale(BRICK_TOP)
+        brick_pitch = self.brick_size[0] + self.brick_spacing
+        self.brick_columns = max(1, (width - 2 * self.scale(BRICK_SIDE_MARGIN) + self.brick_spacing) // brick_pitch)
+        self.paddle_size = tuple(self.scale(value) for value in PADDLE_SIZE)
+        self.paddle_y = height - self.scale(PADDLE_BOTTOM)
+        self.ball_size = max(2, self.scale(BALL_SIZE))
+        self.ball_start_y = height - self.scale(BALL_START_BOTTOM)
+
+        # Areas of the screen that respond to touch
+        mascot_size = MASCOT_SPRITE_SIZE * self.mascot_scale
+        self.mascot_rect = pygame.Rect(0, 0, mascot_size, mascot_size)
+        self.mascot_rect.center = self.mascot_center
+        self.hud_rect = self.get_hud_rect()
+        speech_bottom = self.mascot_center[1] - self.speech_bubble_offset_y
+        self.speech_rect = pygame.Rect(self.speech_bubble_margin, 0, width - 2 * self.speech_bubble_margin, speech_bottom)
+        paddle_zone_height = self.scale(PADDLE_ZONE_HEIGHT)
+        self.paddle_zone = pygame.Rect(0, height - paddle_zone_height, width, paddle_zone_height)
+
+    def get_hud_rect(self):
+        """Get the area of the HP bar and a full row of hearts, placed as UIController.draw_ui places them"""
+        hp_width, hp_height = (value * self.hp_bar_scale for value in HP_BAR_SPRITE_SIZE)
+        heart_width, heart_height = (value * self.heart_scale for value in HEART_SPRITE_SIZE)
+        hp_bar = pygame.Rect(self.mascot_center[0] - hp_width // 2, self.mascot_center[1] + self.hp_bar_offset_y,
+                             hp_width, hp_height)
+        heart_spacing = heart_width + self.heart_spacing_extra
+        hearts_x = hp_bar.centerx - (heart_spacing * 3) // 2 + self.heart_x_adjustment
+        hearts = pygame.Rect(hearts_x, hp_bar.top - heart_height - self.heart_offset_y, heart_spacing * 3, heart_height)
+        return hp_bar.union(hearts)
+
+    def scale(self, value):
+        """Scale a design distance to this canvas"""
+        return int(round(value * self.factor))
+
+    def scale_font(self, size):
+        """Scale a design font size to this canvas, at least 1 point"""
+        return max(1, self.scale(size))
+
+    def scale_sprite(self, scale):
+        """Scale a design sprite scale to this canvas, rounded to a whole number of at least 1"""
+        return max(1, int(round(scale * self.factor)))
+
+    def get_name(self):
+        """Get the resolution name used to key on-disk assets, e.g. '600x1024'"""
+        return f"{self.width}x{self.height}"
+
+    def get_sprite_scales(self):
+        """Get the sprite scales this layout draws with"""
+        return {'hp': self.hp_bar_scale, 'heart': self.heart_scale, 'mascot': self.mascot_scale}
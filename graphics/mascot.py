@@ -4,6 +4,7 @@ import json
 import time
 import random
 import math
+import bisect
 from enum import Enum
 from config import *
 
@@ -14,8 +15,30 @@ class MascotState(Enum):
     DEATH = "death"
     DRINKING = "drinking"  # Added drinking state
 
+# Keyframes per animation state: (sprite frame, seconds shown), played in a loop
+ANIMATION_KEYFRAMES = {
+    'idle': ((0, KEYFRAME_TIME), (1, KEYFRAME_TIME)),
+    'sad': ((0, KEYFRAME_TIME), (1, KEYFRAME_TIME)),
+    'drinking': ((0, KEYFRAME_TIME), (1, KEYFRAME_TIME)),
+    'dizzy': ((0, 1.0),),
+    'death': ((0, 1.0),)
+}
+
+def build_timeline(keyframes):
+    """Precompute a looped timeline: (end time of each keyframe, its sprite frame, loop length)"""
+    ends = []
+    end_time = 0.0
+    for _, duration in keyframes:
+        end_time += duration
+        ends.append(end_time)
+    return ends, [frame for frame, _ in keyframes], end_time
+
+ANIMATION_TIMELINES = {state: build_timeline(keyframes) for state, keyframes in ANIMATION_KEYFRAMES.items()}
+
 class Mascot:
-    def __init__(self, mascot_type='koi'):
+    def __init__(self, mascot_type='koi', clock=time.time):
+        # Wall clock for health decay and animation, replaceable to fast-forward time
+        self.clock = clock
         self.type = mascot_type
         self.config = MASCOTS[mascot_type]
         self.name = self.config['name']
@@ -25,26 +48,38 @@ class Mascot:
         self.health = self.config['base_health']
         self.max_health = self.config['base_health']
         self.hydration_level = 100
-        self.last_drink_time = time.time()
-        self.last_health_update = time.time()
+        self.last_drink_time = self.clock()
+        self.last_health_update = self.clock()
         
         # State management
         self.current_state = MascotState.IDLE
         self.state_timer = 0
-        self.animation_frame = 0
-        self.animation_speed = 0.1
+        self.animation_started = self.clock()
+        self.animation_time = 0.0  # seconds since animation_started, looked up in ANIMATION_TIMELINES
         
         # Emotions and reactions
         self.emotion = 'idle'
         self.reaction_timer = 0
         self.is_dizzy = False
         self.dizzy_timer = 0
+        self.dizzy_until = 0
+        
+        # Sprite effect timers (see get_sprite_effect)
+        # Timers are seconds left (time spent for death), derived from these clock times each update,
+        # so they read the same at any frame rate
+        self.hurt_timer = 0
+        self.appear_timer = 0
+        self.death_timer = 0
+        self.hurt_until = 0
+        self.appear_until = 0
+        self.death_started = None
 
         # Drinking state
         self.is_drinking = False
         self.drinking_amount_left = 0
         self.drinking_rate = 20  # units per second (adjust as needed)
         self.drinking_total = 0
+        self.drinking_started = 0
         
         # AI-generated features
         self.ai_features = []
@@ -57,7 +92,7 @@ class Mascot:
         
     def update(self, dt, water_drunk=0, is_shaking=False):
         """Update mascot state and animations"""
-        current_time = time.time()
+        current_time = self.clock()
 
         # Handle shaking (prioritize dizzy state)
         if is_shaking and not self.is_dizzy:
@@ -65,7 +100,9 @@ class Mascot:
 
         # Handle drinking (prioritize drinking state)
         if self.is_drinking:
-            drink_step = self.drinking_rate * dt
+            # What should have been drunk by now at drinking_rate, minus what already was
+            drunk = self.drinking_total - self.drinking_amount_left
+            drink_step = min(self.drinking_rate * (current_time - self.drinking_started), self.drinking_total) - drunk
             if self.drinking_amount_left > 0:
                 actual_drink = min(drink_step, self.drinking_amount_left)
                 self.health = min(self.max_health, self.health + actual_drink)
@@ -79,11 +116,12 @@ class Mascot:
 
         # Only allow state transitions if not dizzy or drinking
         if not self.is_dizzy and not self.is_drinking:
-            # Update health based on time
-            if current_time - self.last_health_update >= 2:  # Every 2 seconds
-                self.health -= self.config['health_decay_rate']
+            # Update health based on time, catching up on every step missed (e.g. while asleep)
+            decay_steps = int((current_time - self.last_health_update) // HEALTH_DECAY_INTERVAL)
+            if decay_steps > 0:
+                self.health -= self.config['health_decay_rate'] * decay_steps
                 self.health = max(0, self.health)
-                self.last_health_update = current_time
+                self.last_health_update += decay_steps * HEALTH_DECAY_INTERVAL
 
             if self.health == 0:
                 self.kill()
@@ -99,7 +137,16 @@ class Mascot:
         # Update state timers
         self.state_timer += dt
         self.reaction_timer -= dt
-        self.dizzy_timer -= dt
+        self.dizzy_timer = self.dizzy_until - current_time
+        self.hurt_timer = self.hurt_until - current_time
+        self.appear_timer = self.appear_until - current_time
+        if self.current_state == MascotState.DEATH:
+            if self.death_started is None:
+                self.death_started = current_time
+            self.death_timer = current_time - self.death_started
+        else:
+            self.death_started = None
+            self.death_timer = 0
 
         # Update animations
         self.update_animation(dt)
@@ -115,6 +162,7 @@ class Mascot:
         self.is_drinking = True
         self.drinking_amount_left = amount
         self.drinking_total = amount
+        self.drinking_started = self.clock()
         self.state_timer = 0
         self.current_state = MascotState.DRINKING
         
@@ -122,6 +170,9 @@ class Mascot:
         """Handle bottle shaking"""
         self.is_dizzy = True
         self.dizzy_timer = 1.0  # Dizzy for 1 second
+        self.dizzy_until = self.clock() + self.dizzy_timer
+        self.hurt_timer = HURT_FLASH_TIME
+        self.hurt_until = self.clock() + HURT_FLASH_TIME
         self.current_state = MascotState.DIZZY
         self.state_timer = 0
 
@@ -134,6 +185,8 @@ class Mascot:
 
         if self.current_state != MascotState.SAD:
             self.hearts = max(0, self.hearts - 1)
+            self.hurt_timer = HURT_FLASH_TIME
+            self.hurt_until = self.clock() + HURT_FLASH_TIME
 
         self.current_state = MascotState.SAD
     
@@ -141,16 +194,21 @@ class Mascot:
         """Make idle"""
         self.current_state = MascotState.IDLE
         
+    def appear(self):
+        """Dissolve the mascot in (new mascot, display waking up)"""
+        self.appear_timer = APPEAR_TIME
+        self.appear_until = self.clock() + APPEAR_TIME
+        
     def update_animation(self, dt):
         """Update animation frames and effects"""
-        self.animation_frame += self.animation_speed
+        self.animation_time = self.clock() - self.animation_started
         
         # Bouncing effect
-        self.bounce_offset = math.sin(time.time() * self.bounce_speed) * 5
+        self.bounce_offset = math.sin(self.clock() * self.bounce_speed) * 5
         
         # Dizzy rotation effect
         if self.is_dizzy and self.dizzy_timer > 0:
-            self.rotation = (time.time() * 360) % 360
+            self.rotation = (self.clock() * 360) % 360
         else:
             self.rotation = 0
             self.is_dizzy = False
@@ -195,10 +253,48 @@ class Mascot:
             
     def get_animation_frame(self):
         """Get current animation frame for UI to use"""
-        if self.current_state == MascotState.DEATH or self.current_state == MascotState.DIZZY:
-            return 0
-        else:
-            return int(self.animation_frame) % 2  # Assuming 2-frame animations
+        ends, frames, length = ANIMATION_TIMELINES[self.get_animation_state()]
+        return frames[bisect.bisect_right(ends, self.animation_time % length)]
+        
+    def get_next_keyframe_delay(self):
+        """Get the seconds until the animation shows its next keyframe"""
+        ends, _, length = ANIMATION_TIMELINES[self.get_animation_state()]
+        position = (self.clock() - self.animation_started) % length
+        return ends[bisect.bisect_right(ends, position)] - position
+        
+    def get_rotation_angle(self):
+        """Get the dizzy rotation snapped to one of DIZZY_ROTATION_STEPS pre-rendered angles"""
+        step = 360 / DIZZY_ROTATION_STEPS
+        return int(round(self.rotation / step) % DIZZY_ROTATION_STEPS * step)
+        
+    def get_sprite_effect(self):
+        """Get the (effect, step) to draw the sprite with, None for the plain sprite"""
+        if self.current_state == MascotState.DEATH:
+            # Fade out to DEATH_FADE_FLOOR and stay there
+            faded = int(self.death_timer / DEATH_FADE_TIME * EFFECT_STEPS)
+            return ('fade', max(DEATH_FADE_FLOOR, EFFECT_STEPS - faded))
+        if self.hurt_timer > 0:
+            # Blink between inverted and plain
+            return ('flash', 0) if int(self.hurt_timer * HURT_FLASH_RATE) % 2 == 0 else None
+        if self.appear_timer > 0:
+            return ('dither', int((1 - self.appear_timer / APPEAR_TIME) * EFFECT_STEPS))
+        if self.is_drinking:
+            return ('outline', 0)
+        return None
+        
+    def has_sprite_effect(self):
+        """Check if a sprite effect is still changing every frame"""
+        return (self.hurt_timer > 0 or self.appear_timer > 0
+                or (self.current_state == MascotState.DEATH and self.death_timer < DEATH_FADE_TIME))
+        
+    def get_sprite_version(self):
+        """Get a stamp that changes whenever the mascot sprite to draw changes"""
+        return (self.type, self.get_animation_state(), self.get_animation_frame(), self.get_rotation_angle(),
+                self.get_sprite_effect())
+        
+    def get_hud_version(self):
+        """Get a stamp that changes whenever the HP bar or hearts change"""
+        return (self.hearts, round(self.health / self.max_health * 100, 1))
         
     def save_state(self):
         """Save mascot state to file"""
@@ -223,7 +319,7 @@ class Mascot:
             self.health = state.get('health', self.max_health)
             self.hydration_level = state.get('hydration_level', 100)
             self.hearts = state.get('hearts', 0)
-            self.last_drink_time = state.get('last_drink_time', time.time())
+            self.last_drink_time = state.get('last_drink_time', self.clock())
             self.ai_features = state.get('ai_features', [])
             
         except FileNotFoundError:
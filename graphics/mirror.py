@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+Remote display mirror
+Streams the presented canvas to a viewer over a local TCP or Unix socket. Each
+frame is diffed against the last one sent in tiles, and only the changed tiles
+are zlib-compressed and sent. Diffing, compression and sending run on a
+background thread, capped in frame rate and bandwidth; the render thread only
+copies the canvas when the sender can use it.
+
+View a running bottle (address as in MIRROR_ADDRESS):
+    python -m graphics.mirror tcp:192.168.1.20:5900 [scale]
+"""
+
+import os
+import sys
+import time
+import zlib
+import socket
+import struct
+import threading
+import numpy
+import pygame
+from config import *
+
+# Sent once per connection: magic, canvas width and height, tile size, red/green/blue masks
+HELLO_FORMAT = '>4sHHHIII'
+HELLO_MAGIC = b'KOIH'
+# Sent per frame: magic, frame number, tile count, compressed payload length;
+# then (column, row) per tile and the tiles' pixels, one tile after another
+FRAME_FORMAT = '>4sIII'
+FRAME_MAGIC = b'KOIF'
+TILE_FORMAT = '>HH'
+
+def open_socket(address, listen=False):
+    """Open 'tcp:host:port' or 'unix:/path' as a listening server or a connected client"""
+    kind, _, target = address.partition(':')
+    if kind == 'tcp':
+        host, _, port = target.rpartition(':')
+        if listen:
+            sock = socket.create_server((host, int(port)))
+        else:
+            sock = socket.create_connection((host, int(port)))
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return sock
+    if kind == 'unix':
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if listen:
+            if os.path.exists(target):
+                os.unlink(target)  # Left behind by an earlier run
+            sock.bind(target)
+            sock.listen(1)
+        else:
+            sock.connect(target)
+        return sock
+    raise ValueError(f"mirror address must be tcp:host:port or unix:/path, got {address}")
+
+def receive_exact(sock, size):
+    """Read exactly size bytes, raise ConnectionError if the stream ends first"""
+    data = bytearray(size)
+    view = memoryview(data)
+    received = 0
+    while received < size:
+        count = sock.recv_into(view[received:])
+        if not count:
+            raise ConnectionError("mirror stream closed")
+        received += count
+    return data
+
+class MirrorServer:
+    def __init__(self, size, address=MIRROR_ADDRESS, tile_size=MIRROR_TILE_SIZE, max_fps=MIRROR_MAX_FPS,
+                 max_kbps=MIRROR_MAX_KBPS, compression=MIRROR_COMPRESSION):
+        """Serve one viewer at a time with the frames given to publish()"""
+        self.size = size
+        self.address = address
+        self.tile_size = tile_size
+        self.min_interval = 1.0 / max_fps
+        self.max_bytes_per_second = max_kbps * 1024
+        self.compression = compression
+
+        # Frames are compared on arrays padded to whole tiles
+        width, height = size
+        self.columns = -(-width // tile_size)
+        self.rows = -(-height // tile_size)
+        padded_shape = (self.rows * tile_size, self.columns * tile_size)
+        self.current = numpy.zeros(padded_shape, dtype=numpy.uint32)
+        self.previous = numpy.zeros(padded_shape, dtype=numpy.uint32)
+
+        # The render thread copies into the mailbox, the sender takes the latest from it;
+        # 32-bit whatever the display depth, as the sender reads it as one uint32 per pixel
+        self.mailbox = pygame.Surface(size, 0, 32)
+        self.lock = threading.Lock()
+        self.frame_ready = threading.Event()
+        self.last_publish = 0.0
+        self.unsent_change = False
+
+        self.client = None
+        self.keyframe_needed = False
+        self.running = True
+        self.server_socket = open_socket(address, listen=True)
+
+        # Statistics
+        self.frames_sent = 0
+        self.tiles_sent = 0
+        self.bytes_sent = 0
+        self.publish_count = 0
+        self.publish_time = 0.0
+        self.encode_time = 0.0
+
+        # Threads last, once everything they touch exists
+        self.accept_thread = threading.Thread(target=self.accept_loop, name="mirror-accept", daemon=True)
+        self.accept_thread.start()
+        self.send_thread = threading.Thread(target=self.send_loop, name="mirror-send", daemon=True)
+        self.send_thread.start()
+        print(f"📡 Mirroring {width}x{height} on {address}")
+
+    def publish(self, canvas, changed=True):
+        """Offer the presented canvas to the viewer; cheap when nobody watches or the frame is not due
+
+        Call once per frame with changed=False when nothing was presented, so a change
+        held back by the frame rate cap still goes out.
+        """
+        if self.client is None:
+            return
+        self.unsent_change = self.unsent_change or changed
+        now = time.perf_counter()
+        if not (self.unsent_change or self.keyframe_needed) or now - self.last_publish < self.min_interval:
+            return
+
+        with self.lock:
+            self.mailbox.blit(canvas, (0, 0))
+        self.last_publish = now
+        self.unsent_change = False
+        self.frame_ready.set()
+        self.publish_count += 1
+        self.publish_time += time.perf_counter() - now
+
+    def accept_loop(self):
+        """Take viewer connections; a new viewer replaces the old one and gets a full frame"""
+        while self.running:
+            try:
+                client, _ = self.server_socket.accept()
+            except OSError:
+                break
+            client.settimeout(MIRROR_SEND_TIMEOUT)  # A stalled viewer gets dropped rather than stalling the sender
+            width, height = self.size
+            masks = self.mailbox.get_masks()
+            try:
+                client.sendall(struct.pack(HELLO_FORMAT, HELLO_MAGIC, width, height, self.tile_size, *masks[:3]))
+            except OSError:
+                client.close()
+                continue
+            if self.client:
+                self.client.close()
+            # Flag first: a frame diffed for the old viewer must not reach the new one
+            self.keyframe_needed = True
+            self.client = client
+            print("📡 Mirror viewer connected")
+
+    def send_loop(self):
+        """Diff, compress and send the latest published frame, within the frame rate and bandwidth caps"""
+        width, height = self.size
+        tile = self.tile_size
+        while self.running:
+            if not self.frame_ready.wait(0.5):
+                continue
+            start_time = time.perf_counter()
+            client = self.client
+            with self.lock:
+                self.frame_ready.clear()
+                pixels = numpy.frombuffer(self.mailbox.get_view('1'), dtype=numpy.uint32)
+                self.current[:height, :width] = pixels.reshape(height, self.mailbox.get_pitch() // 4)[:, :width]
+                del pixels
+
+            # One flag per tile: did any pixel in it change
+            if self.keyframe_needed:
+                self.keyframe_needed = False
+                changed = numpy.ones((self.rows, self.columns), dtype=bool)
+            else:
+                difference = self.current != self.previous
+                changed = difference.reshape(self.rows, tile, self.columns, tile).any(axis=(1, 3))
+            tile_rows, tile_columns = numpy.nonzero(changed)
+            if not tile_rows.size:
+                continue
+
+            tiles = self.current.reshape(self.rows, tile, self.columns, tile)[tile_rows, :, tile_columns, :]
+            payload = zlib.compress(tiles.tobytes(), self.compression)
+            positions = numpy.empty((tile_rows.size, 2), dtype='>u2')
+            positions[:, 0] = tile_columns
+            positions[:, 1] = tile_rows
+            message = (struct.pack(FRAME_FORMAT, FRAME_MAGIC, self.frames_sent, tile_rows.size, len(payload))
+                       + positions.tobytes() + payload)
+            self.encode_time += time.perf_counter() - start_time
+
+            if client is None or client is not self.client:
+                # A viewer connected meanwhile, it starts from a full frame
+                self.keyframe_needed = True
+                continue
+            try:
+                client.sendall(message)
+            except OSError:
+                # Viewer went away; the next one starts from a full frame
+                if client is self.client:
+                    self.client = None
+                client.close()
+                continue
+
+            self.previous, self.current = self.current, self.previous
+            self.frames_sent += 1
+            self.tiles_sent += tile_rows.size
+            self.bytes_sent += len(message)
+
+            # Bandwidth cap: a big frame buys a longer pause before the next one
+            time.sleep(len(message) / self.max_bytes_per_second)
+
+    def close(self):
+        """Stop serving and close the sockets"""
+        self.running = False
+        self.frame_ready.set()
+        self.server_socket.close()
+        if self.client:
+            self.client.close()
+        self.send_thread.join()
+        if self.address.startswith('unix:'):
+            try:
+                os.unlink(self.address[len('unix:'):])
+            except OSError:
+                pass
+
+    def get_stats(self):
+        """Get frames, tiles and bytes sent and the time spent on each side"""
+        return {
+            'frames_sent': self.frames_sent,
+            'avg_tiles': self.tiles_sent / self.frames_sent if self.frames_sent else 0.0,
+            'kb_sent': self.bytes_sent / 1024,
+            'avg_publish_ms': self.publish_time / self.publish_count * 1000 if self.publish_count else 0.0,
+            'avg_encode_ms': self.encode_time / self.frames_sent * 1000 if self.frames_sent else 0.0
+        }
+
+class MirrorClient:
+    def __init__(self, address):
+        """Connect to a mirror server and rebuild its frames"""
+        self.sock = open_socket(address)
+        magic, width, height, tile_size, *masks = struct.unpack(
+            HELLO_FORMAT, receive_exact(self.sock, struct.calcsize(HELLO_FORMAT)))
+        if magic != HELLO_MAGIC:
+            raise ConnectionError("not a mirror server")
+        self.size = (width, height)
+        self.tile_size = tile_size
+        self.masks = tuple(masks) + (0,)
+        self.rows = -(-height // tile_size)
+        self.columns = -(-width // tile_size)
+        self.pixels = numpy.zeros((self.rows * tile_size, self.columns * tile_size), dtype=numpy.uint32)
+        self.frame = None
+
+    def receive_frame(self):
+        """Block for the next frame, apply its tiles and return its frame number"""
+        magic, frame, tile_count, payload_size = struct.unpack(
+            FRAME_FORMAT, receive_exact(self.sock, struct.calcsize(FRAME_FORMAT)))
+        if magic != FRAME_MAGIC:
+            raise ConnectionError("mirror stream out of sync")
+        positions = numpy.frombuffer(receive_exact(self.sock, tile_count * struct.calcsize(TILE_FORMAT)), dtype='>u2')
+        payload = zlib.decompress(receive_exact(self.sock, payload_size))
+
+        tile = self.tile_size
+        tiles = numpy.frombuffer(payload, dtype=numpy.uint32).reshape(tile_count, tile, tile)
+        grid = self.pixels.reshape(self.rows, tile, self.columns, tile)
+        grid[positions[1::2], :, positions[0::2], :] = tiles
+        self.frame = frame
+        return frame
+
+    def get_pixels(self):
+        """Get the current frame as a (height, width) array of pixels in the server's format"""
+        width, height = self.size
+        return self.pixels[:height, :width]
+
+    def draw(self, surface):
+        """Copy the current frame onto a surface of the frame's size"""
+        pygame.surfarray.pixels2d(surface)[...] = self.get_pixels().T
+
+    def close(self):
+        """Disconnect from the server"""
+        self.sock.close()
+
+def run_viewer(address, scale=1.0):
+    """Show a mirror stream in a window until it closes"""
+    pygame.init()
+    client = MirrorClient(address)
+    width, height = client.size
+    window = pygame.display.set_mode((int(width * scale), int(height * scale)))
+    pygame.display.set_caption(f"Bottle mirror - {address}")
+    frame_surface = pygame.Surface(client.size, 0, 32, client.masks)
+
+    # Frames arrive on their own thread so the window stays responsive between them.
+    # They are received and decoded into the client's own array; the lock is only
+    # held for the copy into frame_surface, so drawing never waits on the network
+    frame_lock = threading.Lock()
+    new_frame = threading.Event()
+    def receive():
+        try:
+            while True:
+                client.receive_frame()
+                with frame_lock:
+                    client.draw(frame_surface)
+                new_frame.set()
+        except (ConnectionError, OSError):
+            new_frame.set()
+            print("📡 Mirror stream ended")
+    threading.Thread(target=receive, name="mirror-receive", daemon=True).start()
+
+    running = True
+    while running:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+        if new_frame.wait(0.05):
+            new_frame.clear()
+            with frame_lock:
+                if scale == 1.0:
+                    window.blit(frame_surface, (0, 0))
+                else:
+                    pygame.transform.scale(frame_surface, window.get_size(), window)
+            pygame.display.flip()
+    client.close()
+    pygame.quit()
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    run_viewer(sys.argv[1], float(sys.argv[2]) if len(sys.argv) > 2 else 1.0)
@@ -0,0 +1,72 @@
+import pygame
+
+# Try to import numpy for surface conversion, fall back gracefully if not available
+try:
+    import numpy
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    print("numpy not available - 8-bit palette mode disabled")
+
+# ========================================
+# GRAYSCALE PALETTE - 8-BIT INDEXED SURFACES
+# The theme only uses grays, so one byte per pixel holds every color
+# ========================================
+
+# Index n is gray level n
+GRAYSCALE_PALETTE = [(level, level, level) for level in range(256)]
+
+# Gray level 1 is given up as the colorkey of transparent indexed surfaces
+TRANSPARENT_INDEX = 1
+
+def make_indexed_surface(size, transparent=False):
+    """Create an 8-bit grayscale surface, cleared to black or to the transparent index"""
+    surface = pygame.Surface(size, 0, 8)
+    surface.set_palette(GRAYSCALE_PALETTE)
+    if transparent:
+        surface.set_colorkey(TRANSPARENT_INDEX)
+        surface.fill(TRANSPARENT_INDEX)
+    else:
+        surface.fill(0)
+    return surface
+
+def get_indexed_level(color, coverage=1.0):
+    """Get the palette index for a color drawn over black with the given coverage (0-1)"""
+    red, green, blue = color[:3]
+    level = int((red * 77 + green * 150 + blue * 29) / 256 * coverage + 0.5)
+    # Never collide with the colorkey
+    return 0 if level == TRANSPARENT_INDEX else level
+
+def to_indexed(source, target, rect, opaque=False):
+    """Convert a rect of a 32-bit surface into an 8-bit grayscale surface
+
+    Partly transparent pixels are flattened over black; fully transparent ones
+    become TRANSPARENT_INDEX unless the target is opaque.
+    """
+    rect = pygame.Rect(rect).clip(source.get_rect()).clip(target.get_rect())
+    if not (rect.width and rect.height):
+        return
+
+    source_area = source.subsurface(rect)
+    rgb = pygame.surfarray.pixels3d(source_area)
+    level = rgb[..., 0] * numpy.uint16(77)
+    level += rgb[..., 1] * numpy.uint16(150)
+    level += rgb[..., 2] * numpy.uint16(29)
+    level >>= 8
+    del rgb
+
+    if source.get_flags() & pygame.SRCALPHA:
+        alpha = pygame.surfarray.pixels_alpha(source_area)
+        level *= alpha
+        level += 127
+        level //= 255
+        if not opaque:
+            level[level == TRANSPARENT_INDEX] = 0
+            level[alpha == 0] = TRANSPARENT_INDEX
+        del alpha
+    elif not opaque:
+        level[level == TRANSPARENT_INDEX] = 0
+
+    target_pixels = pygame.surfarray.pixels2d(target)
+    target_pixels[rect.left:rect.right, rect.top:rect.bottom] = level
+    del target_pixels
@@ -0,0 +1,167 @@
+import numpy
+import pygame
+from config import *
+from graphics.palette import make_indexed_surface, get_indexed_level
+
+# ========================================
+# PARTICLE SYSTEM - STRUCT OF ARRAYS
+# Particles live in preallocated numpy arrays and update in bulk
+# ========================================
+
+# Particle shapes
+PARTICLE_CIRCLE = 0
+PARTICLE_HEART = 1
+
+# Heart outline around the particle position
+HEART_POINTS = [(0, -5), (-3, -8), (-5, -3), (-5, 2), (0, 5), (5, 2), (5, -3)]
+
+# Pre-rendered alpha levels per stamp, particles fade out as life runs down
+PARTICLE_FADE_STEPS = 8
+
+class ParticleSystem:
+    def __init__(self, capacity=MAX_PARTICLES, radius=3, indexed=False):
+        """Fixed-capacity particle pool, alive particles are always packed at the front
+
+        indexed stamps are 8-bit grayscale for drawing on 8-bit surfaces; they fade
+        toward black instead of toward transparent.
+        """
+        self.capacity = capacity
+        self.radius = radius
+        self.indexed = indexed
+        self.count = 0
+        # Particles at the front that existed at the last update; newer ones start moving at the next
+        self.moving = 0
+
+        self.x = numpy.zeros(capacity, dtype=numpy.float32)
+        self.y = numpy.zeros(capacity, dtype=numpy.float32)
+        self.vx = numpy.zeros(capacity, dtype=numpy.float32)
+        self.vy = numpy.zeros(capacity, dtype=numpy.float32)
+        self.life = numpy.zeros(capacity, dtype=numpy.float32)
+        self.max_life = numpy.ones(capacity, dtype=numpy.float32)
+        self.stamp_set = numpy.zeros(capacity, dtype=numpy.int32)
+        self.arrays = [self.x, self.y, self.vx, self.vy, self.life, self.max_life, self.stamp_set]
+
+        # Pre-rendered particle images: one set of fade steps per (shape, color)
+        self.stamp_sets = {}
+        self.stamps = numpy.empty(0, dtype=object)
+        self.stamp_offsets = numpy.zeros((0, 2), dtype=numpy.int32)
+        self.stamp_sizes = numpy.zeros((0, 2), dtype=numpy.int32)
+
+    def __len__(self):
+        return self.count
+
+    def emit(self, x, y, count, color, shape=PARTICLE_CIRCLE, spread=20,
+             vx_range=(-60, 60), vy_range=(-90, -30), life=PARTICLE_LIFETIME):
+        """Add up to count particles around (x, y), return how many fitted
+
+        Velocities are in pixels per second and life in seconds.
+        """
+        count = min(count, self.capacity - self.count)
+        if count <= 0:
+            return 0
+
+        new = slice(self.count, self.count + count)
+        self.x[new] = x + numpy.random.uniform(-spread, spread, count)
+        self.y[new] = y + numpy.random.uniform(-spread, spread, count)
+        self.vx[new] = numpy.random.uniform(vx_range[0], vx_range[1], count)
+        self.vy[new] = numpy.random.uniform(vy_range[0], vy_range[1], count)
+        self.life[new] = life
+        self.max_life[new] = life
+        self.stamp_set[new] = self.get_stamp_set(shape, color)
+        self.count += count
+        return count
+
+    def get_stamp_set(self, shape, color):
+        """Get the stamp set index for a shape and color, rendering its fade steps the first time"""
+        key = (shape, tuple(color))
+        if key in self.stamp_sets:
+            return self.stamp_sets[key]
+
+        if shape == PARTICLE_HEART:
+            size = (11, 14)
+            anchor = (5, 8)
+        else:
+            size = (self.radius * 2 + 1, self.radius * 2 + 1)
+            anchor = (self.radius, self.radius)
+
+        stamps = []
+        for step in range(1, PARTICLE_FADE_STEPS + 1):
+            if self.indexed:
+                stamp = make_indexed_surface(size, transparent=True)
+                stamp_color = get_indexed_level(color, step / PARTICLE_FADE_STEPS)
+            else:
+                stamp = pygame.Surface(size, pygame.SRCALPHA)
+                stamp_color = (*color[:3], 255 * step // PARTICLE_FADE_STEPS)
+            if shape == PARTICLE_HEART:
+                pygame.draw.polygon(stamp, stamp_color, [(anchor[0] + dx, anchor[1] + dy) for dx, dy in HEART_POINTS])
+            else:
+                pygame.draw.circle(stamp, stamp_color, anchor, self.radius)
+            stamps.append(stamp if self.indexed else stamp.convert_alpha())
+
+        stamp_set = len(self.stamp_sets)
+        self.stamp_sets[key] = stamp_set
+        new_stamps = numpy.empty(len(stamps), dtype=object)
+        for i, stamp in enumerate(stamps):
+            new_stamps[i] = stamp
+        self.stamps = numpy.concatenate([self.stamps, new_stamps])
+        self.stamp_offsets = numpy.vstack([self.stamp_offsets, [anchor]])
+        self.stamp_sizes = numpy.vstack([self.stamp_sizes, [size]])
+        return stamp_set
+
+    def update(self, dt):
+        """Advance particles by dt seconds and drop the dead ones
+
+        Particles emitted since the last update stay put this once: dt is time
+        that passed before they existed.
+        """
+        if not self.count:
+            return
+        moving = slice(0, self.moving)
+        self.x[moving] += self.vx[moving] * dt
+        self.y[moving] += self.vy[moving] * dt
+        self.life[moving] -= dt
+        self.compact()
+        self.moving = self.count
+
+    def compact(self):
+        """Swap-remove dead particles so the alive ones stay packed at the front"""
+        dead = numpy.flatnonzero(self.life[:self.count] <= 0)
+        if not dead.size:
+            return
+
+        alive_count = self.count - dead.size
+        # Dead slots in the front get refilled from alive particles past the new end
+        holes = dead[dead < alive_count]
+        movers = alive_count + numpy.flatnonzero(self.life[alive_count:self.count] > 0)
+        for array in self.arrays:
+            array[holes] = array[movers]
+        self.count = alive_count
+
+    def clear(self):
+        """Remove every particle"""
+        self.count = 0
+        self.moving = 0
+
+    def draw(self, surface):
+        """Draw every alive particle with one batched blit, return the rect covering them"""
+        if not self.count:
+            return None
+        alive = slice(0, self.count)
+        stamp_set = self.stamp_set[alive]
+
+        # Fade step from remaining life, same as alpha = life / max_life
+        step = numpy.ceil(self.life[alive] / self.max_life[alive] * PARTICLE_FADE_STEPS).astype(numpy.int32)
+        numpy.clip(step, 1, PARTICLE_FADE_STEPS, out=step)
+        stamps = self.stamps[stamp_set * PARTICLE_FADE_STEPS + step - 1]
+
+        offsets = self.stamp_offsets[stamp_set]
+        left = self.x[alive].astype(numpy.int32) - offsets[:, 0]
+        top = self.y[alive].astype(numpy.int32) - offsets[:, 1]
+        surface.blits(zip(stamps, zip(left.tolist(), top.tolist())), doreturn=False)
+
+        sizes = self.stamp_sizes[stamp_set]
+        bounds_left = int(left.min())
+        bounds_top = int(top.min())
+        return pygame.Rect(bounds_left, bounds_top,
+                           int((left + sizes[:, 0]).max()) - bounds_left,
+                           int((top + sizes[:, 1]).max()) - bounds_top)
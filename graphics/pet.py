@@ -1,9 +1,14 @@
 import pygame
-import os
+from collections import OrderedDict
+from config import *
+from graphics.text_cache import render_text
+from graphics.fonts import get_font
+from graphics.layout import Layout
 
 class Pet:
-    def __init__(self):
+    def __init__(self, layout=None):
         """Pet class - handles textbox appearance when mascot is pet"""
+        self.layout = layout or Layout()
         self.speaking = False
         self.speech_text = ""
         self.speech_timer = 0
@@ -13,25 +18,28 @@ class Pet:
         self.custom_font = None
         self.load_custom_font()
         
+        # Rendered bubbles for recent lines, so repeated lines cost nothing
+        self.bubble_cache = OrderedDict()
+        self.bubble_surface = None
+        self.tail_surface = self.build_tail_surface()
+        
     def load_custom_font(self):
-        """Load the custom TTF font from assets/fonts"""
-        try:
-            font_path = os.path.join("assets", "fonts", "Delicatus-e9OLl.ttf")
-            if os.path.exists(font_path):
-                self.custom_font = pygame.font.Font(font_path, 20)
-                print(f"✅ Loaded custom font: {font_path}")
-            else:
-                print(f"⚠️  Custom font not found: {font_path}")
-                self.custom_font = pygame.font.Font(None, 20)  # Fallback to default
-        except Exception as e:
-            print(f"❌ Error loading custom font: {e}")
-            self.custom_font = pygame.font.Font(None, 20)  # Fallback to default
+        """Get the custom TTF font from the shared font registry"""
+        self.custom_font = get_font(self.layout.scale_font(20))
         
     def start_speaking(self, text):
         """Start showing a speech bubble with the given text"""
         self.speaking = True
         self.speech_text = text
         self.speech_timer = self.speech_duration
+        
+        # Lay out and render the bubble now so drawing it is a single blit
+        self.bubble_surface = self.get_bubble_surface(text)
+
+    def stop_speaking(self):
+        """Hide the speech bubble now"""
+        self.speaking = False
+        self.speech_timer = 0
 
     def update(self, dt):
         """Update speech timer"""
@@ -39,23 +47,22 @@ class Pet:
         if self.speech_timer <= 0:
             self.speaking = False
             
-    def draw_speech_bubble(self, offscreen, mascot_x, mascot_y):
-        """Draw speech bubble when mascot is speaking"""
+    def get_bubble_version(self):
+        """Get a stamp that changes whenever the speech bubble changes, None when hidden"""
         if not self.speaking or not self.speech_text:
-            return
+            return None
+        return self.speech_text
             
-        # Use custom font if available, otherwise fallback to default
-        font = self.custom_font if self.custom_font else pygame.font.Font(None, 20)
-        
-        # Calculate bubble size based on text
-        words = self.speech_text.split()
+    def layout_speech_text(self, font, text):
+        """Word-wrap text to the bubble width, return the lines and the widest line's width"""
+        words = text.split()
         lines = []
         current_line = ""
         max_width = 0
         
         for word in words:
             test_line = current_line + " " + word if current_line else word
-            if font.size(test_line)[0] < 200:  # Smaller for vertical layout
+            if font.size(test_line)[0] < self.layout.speech_wrap_width:
                 current_line = test_line
             else:
                 lines.append(current_line)
@@ -63,41 +70,77 @@ class Pet:
                 current_line = word
         lines.append(current_line)
         max_width = max(max_width, font.size(current_line)[0])
+        return lines, max_width
+    
+    def get_bubble_surface(self, text):
+        """Get the rendered bubble (box and text, no tail) for text, from the LRU when possible"""
+        bubble_surface = self.bubble_cache.get(text)
+        if bubble_surface is not None:
+            self.bubble_cache.move_to_end(text)
+            return bubble_surface
         
-        # Draw speech bubble
-        bubble_width = max_width + 30
-        bubble_height = len(lines) * 25 + 15
-        bubble_x = mascot_x - bubble_width // 2  # Center relative to mascot
-        bubble_y = mascot_y - bubble_height - 150  # Position above mascot
+        # Use custom font if available, otherwise fallback to default
+        font = self.custom_font if self.custom_font else pygame.font.Font(None, self.layout.scale_font(20))
+        lines, max_width = self.layout_speech_text(font, text)
         
-        # Keep bubble on screen
-        if bubble_x < 10:
-            bubble_x = 10
-        elif bubble_x + bubble_width > 600 - 10:  # DEVICE_WIDTH
-            bubble_x = 600 - bubble_width - 10
-            
-        bubble_rect = pygame.Rect(bubble_x, bubble_y, bubble_width, bubble_height)
+        # Calculate bubble size based on text
+        padding = self.layout.speech_bubble_padding
+        bubble_width = max_width + 2 * padding
+        bubble_height = len(lines) * self.layout.speech_bubble_line_height + padding
+        bubble_surface = pygame.Surface((bubble_width, bubble_height), pygame.SRCALPHA)
+        bubble_rect = bubble_surface.get_rect()
         
         # Bubble background
-        pygame.draw.rect(offscreen, (255, 255, 255), bubble_rect)
-        pygame.draw.rect(offscreen, (0, 0, 0), bubble_rect, 2)
-        
-        # Draw speech bubble tail
-        tail_x = mascot_x
-        tail_y = bubble_y + bubble_height
-        tail_points = [
-            (tail_x, tail_y),
-            (tail_x - 10, tail_y + 15),
-            (tail_x + 10, tail_y + 15)
-        ]
-        pygame.draw.polygon(offscreen, (255, 255, 255), tail_points)
-        pygame.draw.polygon(offscreen, (0, 0, 0), tail_points, 2)
+        pygame.draw.rect(bubble_surface, (255, 255, 255), bubble_rect)
+        pygame.draw.rect(bubble_surface, (0, 0, 0), bubble_rect, 2)
         
         # Draw text using custom font
+        text_x, text_y = self.layout.speech_text_inset
         for i, line in enumerate(lines):
-            text = font.render(line, True, (0, 0, 0))
-            text_x = bubble_x + 15
-            text_y = bubble_y + 12 + i * 20
-            offscreen.blit(text, (text_x, text_y))
+            text_surface = render_text(font, line, (0, 0, 0))
+            bubble_surface.blit(text_surface, (text_x, text_y + i * self.layout.speech_text_line_height))
+        bubble_surface = bubble_surface.convert_alpha()
+        
+        self.bubble_cache[text] = bubble_surface
+        if len(self.bubble_cache) > SPEECH_BUBBLE_CACHE_SIZE:
+            self.bubble_cache.popitem(last=False)
+        return bubble_surface
+    
+    def build_tail_surface(self):
+        """Render the speech bubble tail once, tip at (half width, 0)"""
+        half_width, height = self.layout.speech_tail_size
+        tail_surface = pygame.Surface((half_width * 2 + 2, height + 2), pygame.SRCALPHA)
+        tail_points = [
+            (half_width, 0),
+            (0, height),
+            (half_width * 2, height)
+        ]
+        pygame.draw.polygon(tail_surface, (255, 255, 255), tail_points)
+        pygame.draw.polygon(tail_surface, (0, 0, 0), tail_points, 2)
+        return tail_surface.convert_alpha()
             
-        
\ No newline at end of file
+    def draw_speech_bubble(self, offscreen, mascot_x, mascot_y):
+        """Draw speech bubble when mascot is speaking, return the rect drawn"""
+        if not self.speaking or not self.speech_text:
+            return None
+        
+        if self.bubble_surface is None:
+            self.bubble_surface = self.get_bubble_surface(self.speech_text)
+        bubble_width, bubble_height = self.bubble_surface.get_size()
+        
+        bubble_x = mascot_x - bubble_width // 2  # Center relative to mascot
+        bubble_y = mascot_y - bubble_height - self.layout.speech_bubble_offset_y  # Position above mascot
+        
+        # Keep bubble on screen
+        margin = self.layout.speech_bubble_margin
+        if bubble_x < margin:
+            bubble_x = margin
+        elif bubble_x + bubble_width > self.layout.width - margin:
+            bubble_x = self.layout.width - bubble_width - margin
+        
+        bubble_rect = offscreen.blit(self.bubble_surface, (bubble_x, bubble_y))
+        
+        # Draw speech bubble tail below the bubble, pointing at the mascot
+        tail_rect = offscreen.blit(self.tail_surface, (mascot_x - self.layout.speech_tail_size[0], bubble_y + bubble_height))
+        
+        return bubble_rect.union(tail_rect)
@@ -0,0 +1,150 @@
+import os
+import sys
+import json
+import time
+import zlib
+import queue
+import struct
+import threading
+import numpy
+import pygame
+from config import *
+
+# ========================================
+# FRAME RECORDER - NON-BLOCKING SCREEN CAPTURE
+# Presented frames are copied into a fixed pool of buffers and written by a
+# background thread; when the pool runs dry frames are dropped, never waited on
+# ========================================
+
+# 'png' writes frame_000000.png..., 'raw' writes frames.rgb (rgb24, one frame after another).
+# Either way index.json holds the size and each frame's timestamp. A raw recording
+# plays with: ffplay -f rawvideo -pixel_format rgb24 -video_size WxH frames.rgb
+RECORD_MODES = ('png', 'raw')
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+def png_chunk(chunk_type, data):
+    """Build a PNG chunk with its length and CRC"""
+    return struct.pack('>I', len(data)) + chunk_type + data + struct.pack('>I', zlib.crc32(chunk_type + data))
+
+class FrameRecorder:
+    def __init__(self, size, directory, mode='png', pool_size=RECORD_POOL_SIZE, compression=RECORD_PNG_COMPRESSION):
+        """Record frames of a canvas size into directory on a background thread
+
+        pygame.image.save is not used for PNGs: it holds the GIL while encoding,
+        zlib releases it, so the render loop keeps running during compression.
+        """
+        if mode not in RECORD_MODES:
+            raise ValueError(f"unknown record mode: {mode}")
+        self.size = size
+        self.directory = directory
+        self.mode = mode
+        self.compression = compression
+        os.makedirs(directory, exist_ok=True)
+
+        # 32-bit buffers, whatever the display depth, as write_frame reads 4 bytes per pixel;
+        # the encoder reorders channels
+        width, height = size
+        self.free_buffers = queue.Queue()
+        for _ in range(pool_size):
+            self.free_buffers.put(pygame.Surface(size, 0, 32))
+        self.pending = queue.Queue()
+
+        # Byte offset of red, green and blue within a buffer pixel
+        mask_bytes = [mask.bit_length() // 8 - 1 for mask in self.free_buffers.queue[0].get_masks()[:3]]
+        self.channel_bytes = mask_bytes if sys.byteorder == 'little' else [3 - offset for offset in mask_bytes]
+
+        # Encoder scratch: the frame as rgb24, and PNG rows (filter type byte 0, then the row's pixels)
+        self.rgb = numpy.zeros((height, width, 3), dtype=numpy.uint8)
+        self.png_rows = numpy.zeros((height, 1 + width * 3), dtype=numpy.uint8)
+        self.raw_file = open(os.path.join(directory, 'frames.rgb'), 'wb') if mode == 'raw' else None
+
+        self.start_time = time.perf_counter()
+        self.timestamps = []
+
+        # Statistics
+        self.captured = 0
+        self.written = 0
+        self.dropped = 0
+        self.capture_time = 0.0
+        self.encode_time = 0.0
+
+        self.thread = threading.Thread(target=self.encode_loop, name="frame-recorder", daemon=True)
+        self.thread.start()
+        print(f"🎥 Recording {width}x{height} {mode} frames to {directory}")
+
+    def capture(self, canvas):
+        """Copy the presented canvas into a free buffer for the encoder, drop it if none is free"""
+        start_time = time.perf_counter()
+        try:
+            buffer = self.free_buffers.get_nowait()
+        except queue.Empty:
+            # The encoder is behind; stalling here would stall the display
+            self.dropped += 1
+            return False
+
+        buffer.blit(canvas, (0, 0))
+        self.pending.put((self.captured, start_time - self.start_time, buffer))
+        self.captured += 1
+        self.capture_time += time.perf_counter() - start_time
+        return True
+
+    def encode_loop(self):
+        """Write queued frames until stop() queues None"""
+        while True:
+            item = self.pending.get()
+            if item is None:
+                break
+            frame, timestamp, buffer = item
+            start_time = time.perf_counter()
+            self.write_frame(frame, buffer)
+            self.free_buffers.put(buffer)
+            self.timestamps.append(round(timestamp, 4))
+            self.written += 1
+            self.encode_time += time.perf_counter() - start_time
+
+    def write_frame(self, frame, buffer):
+        """Write one buffer as the next frame of the recording"""
+        width, height = self.size
+        pixels = numpy.frombuffer(buffer.get_view('1'), dtype=numpy.uint8)
+        pixels = pixels.reshape(height, buffer.get_pitch())[:, :width * 4].reshape(height, width, 4)
+        # One plane at a time; numpy is several times slower gathering all three at once
+        for channel, offset in enumerate(self.channel_bytes):
+            self.rgb[..., channel] = pixels[..., offset]
+        del pixels
+
+        if self.mode == 'raw':
+            self.raw_file.write(self.rgb.data)
+            return
+
+        self.png_rows[:, 1:] = self.rgb.reshape(height, width * 3)
+        header = struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0)  # 8-bit RGB
+        data = zlib.compress(self.png_rows.data, self.compression)
+        with open(os.path.join(self.directory, f"frame_{frame:06d}.png"), 'wb') as f:
+            f.write(PNG_SIGNATURE + png_chunk(b'IHDR', header) + png_chunk(b'IDAT', data) + png_chunk(b'IEND', b''))
+
+    def stop(self):
+        """Finish writing queued frames and write the index"""
+        self.pending.put(None)
+        self.thread.join()
+        if self.raw_file:
+            self.raw_file.close()
+
+        index = {
+            'mode': self.mode,
+            'size': list(self.size),
+            'timestamps': self.timestamps,
+            'dropped': self.dropped
+        }
+        with open(os.path.join(self.directory, 'index.json'), 'w') as f:
+            json.dump(index, f)
+
+    def get_stats(self):
+        """Get captured, written and dropped frame counts and the time spent on each side"""
+        return {
+            'captured': self.captured,
+            'written': self.written,
+            'dropped': self.dropped,
+            'avg_capture_ms': self.capture_time / self.captured * 1000 if self.captured else 0.0,
+            'avg_encode_ms': self.encode_time / self.written * 1000 if self.written else 0.0
+        }
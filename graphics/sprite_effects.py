@@ -0,0 +1,159 @@
+import time
+from collections import OrderedDict
+import numpy
+import pygame
+from config import *
+
+# ========================================
+# SPRITE EFFECTS - PRE-RENDERED VARIANTS
+# Fades, inverted flashes, outlines and dissolves are built once with surfarray,
+# so playing an effect is a plain blit of a cached surface
+# ========================================
+
+EFFECT_FADE = 'fade'  # alpha scaled to step / EFFECT_STEPS
+EFFECT_FLASH = 'flash'  # colors inverted
+EFFECT_OUTLINE = 'outline'  # one pixel ring around the sprite
+EFFECT_DITHER = 'dither'  # ordered dissolve, step / EFFECT_STEPS of the pixels kept
+
+# Effects with an opacity step; the others ignore it
+STEPPED_EFFECTS = (EFFECT_FADE, EFFECT_DITHER)
+
+OUTLINE_COLOR = WHITE
+
+# 4x4 ordered dither thresholds (0-15)
+BAYER_4X4 = numpy.array([[0, 8, 2, 10],
+                         [12, 4, 14, 6],
+                         [3, 11, 1, 9],
+                         [15, 7, 13, 5]], dtype=numpy.uint8)
+
+def make_fade(sprite, step):
+    """Copy the sprite with its alpha scaled to step / EFFECT_STEPS"""
+    variant = sprite.copy()
+    alpha = pygame.surfarray.pixels_alpha(variant)
+    alpha[...] = alpha * numpy.uint16(step) // EFFECT_STEPS
+    del alpha
+    return variant
+
+def make_flash(sprite):
+    """Copy the sprite with its colors inverted, alpha kept"""
+    variant = sprite.copy()
+    rgb = pygame.surfarray.pixels3d(variant)
+    numpy.invert(rgb, out=rgb)
+    del rgb
+    return variant
+
+def make_outline(sprite, color=OUTLINE_COLOR):
+    """Copy the sprite onto a surface one pixel larger on each side, ringed in color"""
+    width, height = sprite.get_size()
+    variant = pygame.Surface((width + 2, height + 2), pygame.SRCALPHA, sprite)
+
+    solid = numpy.zeros((width + 2, height + 2), dtype=bool)
+    solid[1:-1, 1:-1] = pygame.surfarray.array_alpha(sprite) > 0
+    # Pixels next to the sprite (4-neighbour dilation) that aren't part of it
+    ring = numpy.zeros_like(solid)
+    ring[1:, :] |= solid[:-1, :]
+    ring[:-1, :] |= solid[1:, :]
+    ring[:, 1:] |= solid[:, :-1]
+    ring[:, :-1] |= solid[:, 1:]
+    ring &= ~solid
+
+    rgb = pygame.surfarray.pixels3d(variant)
+    rgb[ring] = color[:3]
+    del rgb
+    alpha = pygame.surfarray.pixels_alpha(variant)
+    alpha[ring] = 255
+    del alpha
+
+    variant.blit(sprite, (1, 1))
+    return variant
+
+def make_dither(sprite, step):
+    """Copy the sprite keeping step / EFFECT_STEPS of its pixels in an ordered dither pattern"""
+    variant = sprite.copy()
+    width, height = sprite.get_size()
+    thresholds = BAYER_4X4[numpy.arange(width)[:, None] % 4, numpy.arange(height)[None, :] % 4]
+    alpha = pygame.surfarray.pixels_alpha(variant)
+    alpha[thresholds >= step * 16 // EFFECT_STEPS] = 0
+    del alpha
+    return variant
+
+def make_variant(sprite, effect, step=0):
+    """Build one effect variant of a sprite"""
+    if effect == EFFECT_FADE:
+        return make_fade(sprite, step)
+    if effect == EFFECT_FLASH:
+        return make_flash(sprite)
+    if effect == EFFECT_OUTLINE:
+        return make_outline(sprite)
+    if effect == EFFECT_DITHER:
+        return make_dither(sprite, step)
+    raise ValueError(f"unknown sprite effect: {effect}")
+
+class SpriteEffects:
+    def __init__(self, max_kb=SPRITE_EFFECT_CACHE_KB):
+        """Memory-bounded LRU cache of sprite effect variants"""
+        self.max_bytes = max_kb * 1024
+        self.variants = OrderedDict()
+        self.bytes = 0
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.build_time = 0.0
+
+    def get_variant(self, key, sprite, effect, step=0):
+        """Get a sprite with an effect applied, building it the first time
+
+        key names the sprite (e.g. its scaled asset cache key). Stepped effects at
+        step >= EFFECT_STEPS are the sprite itself. The returned surface is shared.
+        """
+        if effect in STEPPED_EFFECTS:
+            if step >= EFFECT_STEPS:
+                return sprite
+        else:
+            step = 0
+
+        variant_key = (key, effect, step)
+        variant = self.variants.get(variant_key)
+        if variant is not None:
+            self.variants.move_to_end(variant_key)
+            self.hits += 1
+            return variant
+
+        start_time = time.perf_counter()
+        variant = make_variant(sprite, effect, step)
+        self.build_time += time.perf_counter() - start_time
+        self.misses += 1
+
+        self.variants[variant_key] = variant
+        self.bytes += variant.get_pitch() * variant.get_height()
+        while self.bytes > self.max_bytes and len(self.variants) > 1:
+            _, evicted = self.variants.popitem(last=False)
+            self.bytes -= evicted.get_pitch() * evicted.get_height()
+            self.evictions += 1
+        return variant
+
+    def prebuild(self, sprites):
+        """Build every effect variant of (key, sprite) pairs ahead of time, return the count built"""
+        built = self.misses
+        for key, sprite in sprites:
+            for effect in (EFFECT_FLASH, EFFECT_OUTLINE):
+                self.get_variant(key, sprite, effect)
+            for effect in STEPPED_EFFECTS:
+                for step in range(EFFECT_STEPS):
+                    self.get_variant(key, sprite, effect, step)
+        return self.misses - built
+
+    def get_stats(self):
+        """Get cache size, hit rate and time spent building variants"""
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self.variants),
+            'kb': self.bytes / 1024,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'build_ms': self.build_time * 1000
+        }
@@ -0,0 +1,66 @@
+import time
+from collections import OrderedDict
+from config import *
+
+# ========================================
+# TEXT CACHE - SHARED RENDERED STRINGS
+# Keeps recently rendered text surfaces so repeated strings are free
+# ========================================
+
+class TextCache:
+    def __init__(self, max_entries=TEXT_CACHE_SIZE):
+        """Bounded LRU cache of rendered text surfaces"""
+        self.max_entries = max_entries
+        self.surfaces = OrderedDict()
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.render_time = 0.0  # Seconds spent rendering on misses
+
+    def render(self, font, text, color, antialias=True):
+        """Render text with a font, reusing the surface if it was rendered recently
+
+        The returned surface is shared - blit it, don't draw on it.
+        """
+        # A font object is one face at one size
+        key = (font, text, tuple(color), antialias)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        start_time = time.perf_counter()
+        surface = font.render(text, antialias, color)
+        self.render_time += time.perf_counter() - start_time
+        self.misses += 1
+
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_entries:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        """Drop every cached surface"""
+        self.surfaces.clear()
+
+    def get_stats(self):
+        """Get cache hit rate and the render time it saved"""
+        lookups = self.hits + self.misses
+        avg_render_time = self.render_time / self.misses if self.misses else 0.0
+        return {
+            'entries': len(self.surfaces),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'render_ms': self.render_time * 1000,
+            'saved_ms': self.hits * avg_render_time * 1000
+        }
+
+# Shared by all rendering code
+text_cache = TextCache()
+
+def render_text(font, text, color, antialias=True):
+    """Render text through the shared text cache"""
+    return text_cache.render(font, text, color, antialias)
@@ -1,165 +1,287 @@
 from PIL import Image
 from PIL import ImageDraw
+import time
 import pygame
+from graphics.asset_pack import AssetPack, write_asset_pack
+from graphics.sprite_effects import SpriteEffects
+from graphics.layout import Layout
 
 # ========================================
 # UI CONTROLLER - CENTRAL POSITIONING SYSTEM
 # Controls all UI elements positioning and appearance
+# Positions and scales come from the Layout for the canvas resolution
 # ========================================
 
-# Screen dimensions (locked)
-DEVICE_WIDTH = 600
-DEVICE_HEIGHT = 1024
-MARGIN_X = 6
-MARGIN_Y = 6
-
-# Scaling factors (locked)
-HP_BAR_SCALE = 3
-HEART_SCALE = 3
-MASCOT_SCALE = 4
-
-# Mascot positioning (locked) - UI controls this
-MASCOT_CENTER_X = (DEVICE_WIDTH // 2) + 12
-MASCOT_CENTER_Y = (DEVICE_HEIGHT // 2) - 35
-
-# HP Bar positioning (locked)
-HP_BAR_OFFSET_Y = 180  # Distance below mascot center
+# HP bar health area (sprite pixels, before scaling)
 HP_BAR_HEALTH_WIDTH = 94  # Width of health bar area within sprite
 HP_BAR_HEALTH_HEIGHT = 6  # Height of health bar area within sprite
 HP_BAR_HEALTH_X_OFFSET = 12  # X offset within HP bar sprite
 HP_BAR_HEALTH_Y_OFFSET = 2  # Y offset within HP bar sprite
 
-# Heart positioning (locked)
-HEART_SPACING_EXTRA = 15  # Extra spacing between hearts
-HEART_OFFSET_Y = 10  # Distance above HP bar
-HEART_X_ADJUSTMENT = 110  # Fine-tune horizontal positioning
+# Mascot sprite files per animation state (assets/<type>/<type>_<name>.png)
+MASCOT_TYPES = ['koi', 'soy', 'joy']
+MASCOT_SPRITE_NAMES = {
+    "idle": ["idle0", "idle1"],
+    "sad": ["sad0", "sad1"],
+    "dizzy": ["confused"],
+    "death": ["death"]
+}
 
 class UIController:
-    def __init__(self):
+    def __init__(self, layout=None, use_asset_pack=True):
+        self.layout = layout or Layout()
         self.mascot_images = {}
         self.hp_bar_image = None
         self.heart_image = None
+        
+        # Unscaled images by asset name, and their scaled versions by (asset, scale, rotation)
+        self.source_images = {}
+        self.scaled_cache = {}
+        
+        # Fade, flash, outline and dither variants of the mascot sprites
+        self.sprite_effects = SpriteEffects()
+        
+        # Pre-baked sprite pack (see graphics/asset_pack.py), PNGs are the fallback
+        self.use_asset_pack = use_asset_pack
+        self.asset_pack = None
+        self.source_paths = self.get_source_paths()
+        
         self.load_ui_assets()
     
+    def get_source_paths(self):
+        """Get the PNG path of every UI asset by asset name"""
+        source_paths = {
+            'hp': "./assets/hp.png",
+            'heart': "./assets/heart.png"
+        }
+        for mascot_type in MASCOT_TYPES:
+            for names in MASCOT_SPRITE_NAMES.values():
+                for name in names:
+                    source_paths[f"{mascot_type}_{name}"] = f"./assets/{mascot_type}/{mascot_type}_{name}.png"
+        return source_paths
+    
     def load_ui_assets(self):
         """Load all UI assets including mascot sprites"""
+        start_time = time.perf_counter()
+        
+        if self.use_asset_pack and self.load_asset_pack():
+            source = "asset pack"
+        else:
+            source = "PNG files"
+            try:
+                # Load HP bar
+                self.hp_bar_image = pygame.image.load(self.source_paths['hp']).convert_alpha()
+                self.source_images['hp'] = self.hp_bar_image
+                
+                # Load heart sprite
+                self.heart_image = pygame.image.load(self.source_paths['heart']).convert_alpha()
+                self.source_images['heart'] = self.heart_image
+                
+                # Load mascot sprites for all types
+                for mascot_type in MASCOT_TYPES:
+                    self.load_mascot_sprites(mascot_type)
+                
+            except pygame.error as e:
+                print(f"Error loading UI assets: {e}")
+        
+        # Scale everything the UI draws once, up front
+        self.build_scaled_cache()
+        
+        # First boot at this resolution: keep the scaled set on disk for the next one
+        if self.use_asset_pack and not self.asset_pack:
+            self.save_asset_pack()
+        
+        elapsed = (time.perf_counter() - start_time) * 1000
+        print(f"🖼️  Loaded UI assets from {source} in {elapsed:.1f} ms")
+    
+    def load_asset_pack(self):
+        """Load sprites from the memory-mapped asset pack, return False if it is missing or stale"""
+        pack = AssetPack(self.layout)
+        if not pack.is_fresh(self.source_paths.values()):
+            print(f"⚠️  Asset pack for {self.layout.get_name()} not used ({pack.stale_reason}) - building it from PNG files")
+            return False
+        
         try:
-            # Load HP bar
-            self.hp_bar_image = pygame.image.load("./assets/hp.png").convert_alpha()
-            
-            # Load heart sprite
-            self.heart_image = pygame.image.load("./assets/heart.png").convert_alpha()
-            
-            # Load mascot sprites for both types
-            self.load_mascot_sprites('koi')
-            self.load_mascot_sprites('soy')
-            self.load_mascot_sprites('joy')
-            
-        except pygame.error as e:
-            print(f"Error loading UI assets: {e}")
+            surfaces = pack.load()
+        except (OSError, ValueError, KeyError, pygame.error) as e:
+            print(f"❌ Error loading asset pack: {e}")
+            return False
+        
+        for (asset_name, scale, rotation), surface in surfaces.items():
+            if scale == 1:
+                self.source_images[asset_name] = surface
+            else:
+                self.scaled_cache[(asset_name, scale, rotation)] = surface
+        
+        # Surfaces point into the mapping, so it has to live as long as they do
+        self.asset_pack = pack
+        self.hp_bar_image = self.source_images.get('hp')
+        self.heart_image = self.source_images.get('heart')
+        return True
+    
+    def save_asset_pack(self):
+        """Write the loaded sprites as the asset pack for this resolution"""
+        try:
+            write_asset_pack(self)
+        except (OSError, pygame.error) as e:
+            print(f"❌ Error writing asset pack: {e}")
     
     def load_mascot_sprites(self, mascot_type):
-        """Load and scale mascot sprites"""
+        """Load mascot sprites"""
+        if mascot_type not in MASCOT_TYPES:
+            return
+        
         try:
-            if mascot_type == 'koi':
-                idle0 = pygame.image.load("./assets/koi/koi_idle0.png").convert_alpha()
-                idle1 = pygame.image.load("./assets/koi/koi_idle1.png").convert_alpha()
-                sad0 = pygame.image.load("./assets/koi/koi_sad0.png").convert_alpha()
-                sad1 = pygame.image.load("./assets/koi/koi_sad1.png").convert_alpha()
-                dizzy = pygame.image.load("./assets/koi/koi_confused.png").convert_alpha()
-                death = pygame.image.load("./assets/koi/koi_death.png").convert_alpha()
-            elif mascot_type == 'soy':
-                idle0 = pygame.image.load("./assets/soy/soy_idle0.png").convert_alpha()
-                idle1 = pygame.image.load("./assets/soy/soy_idle1.png").convert_alpha()
-                sad0 = pygame.image.load("./assets/soy/soy_sad0.png").convert_alpha()
-                sad1 = pygame.image.load("./assets/soy/soy_sad1.png").convert_alpha()
-                dizzy = pygame.image.load("./assets/soy/soy_confused.png").convert_alpha()
-                death = pygame.image.load("./assets/soy/soy_death.png").convert_alpha()
-            elif mascot_type == 'joy':
-                idle0 = pygame.image.load("./assets/joy/joy_idle0.png").convert_alpha()
-                idle1 = pygame.image.load("./assets/joy/joy_idle1.png").convert_alpha()
-                sad0 = pygame.image.load("./assets/joy/joy_sad0.png").convert_alpha()
-                sad1 = pygame.image.load("./assets/joy/joy_sad1.png").convert_alpha()
-                dizzy = pygame.image.load("./assets/joy/joy_confused.png").convert_alpha()
-                death = pygame.image.load("./assets/joy/joy_death.png").convert_alpha()
-            else:
-                return
-
-            # Scale up the sprites
-            scaled_idle0 = pygame.transform.scale(idle0, 
-                (idle0.get_width() * MASCOT_SCALE, idle0.get_height() * MASCOT_SCALE))
-            scaled_idle1 = pygame.transform.scale(idle1, 
-                (idle1.get_width() * MASCOT_SCALE, idle1.get_height() * MASCOT_SCALE))
-            scaled_sad0 = pygame.transform.scale(sad0, 
-                (idle1.get_width() * MASCOT_SCALE, sad0.get_height() * MASCOT_SCALE))
-            scaled_sad1 = pygame.transform.scale(sad1, 
-                (idle1.get_width() * MASCOT_SCALE, sad1.get_height() * MASCOT_SCALE))
-            scaled_dizzy = pygame.transform.scale(dizzy, 
-                (idle1.get_width() * MASCOT_SCALE, dizzy.get_height() * MASCOT_SCALE))
-            scaled_death = pygame.transform.scale(death, 
-                (idle1.get_width() * MASCOT_SCALE, death.get_height() * MASCOT_SCALE))
-
-            self.mascot_images[mascot_type] = {
-                "idle": [scaled_idle0, scaled_idle1],
-                "sad": [scaled_sad0, scaled_sad1],
-                "dizzy": [scaled_dizzy],
-                "death": [scaled_death]
-            }
+            for names in MASCOT_SPRITE_NAMES.values():
+                for name in names:
+                    asset_name = f"{mascot_type}_{name}"
+                    self.source_images[asset_name] = pygame.image.load(self.source_paths[asset_name]).convert_alpha()
             
         except pygame.error as e:
             print(f"Error loading mascot sprites for {mascot_type}: {e}")
     
+    def build_scaled_cache(self):
+        """Scale the HP bar, heart and mascot sprites into the cache"""
+        if self.hp_bar_image:
+            self.get_scaled_asset('hp', self.layout.hp_bar_scale)
+        if self.heart_image:
+            self.get_scaled_asset('heart', self.layout.heart_scale)
+        
+        for mascot_type in MASCOT_TYPES:
+            sprites = {}
+            for state, names in MASCOT_SPRITE_NAMES.items():
+                frames = [self.get_scaled_asset(f"{mascot_type}_{name}", self.layout.mascot_scale) for name in names]
+                if None in frames:
+                    break
+                sprites[state] = frames
+            else:
+                self.mascot_images[mascot_type] = sprites
+        
+        print(f"🗂️  Scaled asset cache: {len(self.scaled_cache)} surfaces, {self.get_cache_memory() / 1024:.0f} KB")
+    
+    def get_scaled_asset(self, asset_name, scale, rotation=0):
+        """Get an asset rotated and scaled by an integer factor, building it only once"""
+        key = (asset_name, scale, rotation)
+        surface = self.scaled_cache.get(key)
+        if surface is None:
+            source = self.source_images.get(asset_name)
+            if source is None:
+                return None
+            
+            # Rotate at native size so the scaled result keeps square pixel-art pixels
+            if rotation:
+                source = pygame.transform.rotate(source, rotation)
+                # Trim the empty corners rotation adds, keeping the sprite centered
+                content = source.get_bounding_rect()
+                center_x, center_y = source.get_rect().center
+                half_width = max(center_x - content.left, content.right - center_x)
+                half_height = max(center_y - content.top, content.bottom - center_y)
+                crop = pygame.Rect(center_x - half_width, center_y - half_height, half_width * 2, half_height * 2)
+                # Padded rather than clipped so the frame stays even-sized and centered
+                cropped = pygame.Surface(crop.size, pygame.SRCALPHA, source)
+                cropped.blit(source, (-crop.x, -crop.y), special_flags=pygame.BLEND_RGBA_MAX)
+                source = cropped
+            width, height = source.get_size()
+            surface = pygame.transform.scale(source, (width * scale, height * scale))
+            self.scaled_cache[key] = surface
+        return surface
+    
+    def get_cache_memory(self):
+        """Get the memory held by the scaled asset cache in bytes"""
+        return sum(surface.get_pitch() * surface.get_height() for surface in self.scaled_cache.values())
+    
     def get_mascot_position(self):
         """Get the mascot's position (UI controls this)"""
-        return MASCOT_CENTER_X, MASCOT_CENTER_Y
+        return self.layout.mascot_center
     
     def get_mascot_sprites(self, mascot_type):
         """Get mascot sprites for the specified type"""
         return self.mascot_images.get(mascot_type, self.mascot_images.get('koi', {}))
     
-    def draw_mascot(self, offscreen, mascot_type, animation_state="idle", current_frame=0):
-        """Draw the mascot sprite at the UI-controlled position"""
+    def get_low_res_scale(self, factor):
+        """Get the low-resolution factor the mascot can be drawn at, 1 if it doesn't divide the mascot scale"""
+        return factor if factor > 1 and self.layout.mascot_scale % factor == 0 else 1
+    
+    def get_low_res_offset(self, pixel_scale):
+        """Get the shift that lines a 1/pixel_scale canvas up with the full-size mascot position"""
+        center_x, center_y = self.layout.mascot_center
+        return center_x % pixel_scale, center_y % pixel_scale
+    
+    def get_mascot_sprite(self, mascot_type, animation_state="idle", current_frame=0, rotation=0, pixel_scale=1):
+        """Get (key, sprite) for a mascot frame at a rotation and pixel scale, None if there is no sprite"""
         sprites = self.get_mascot_sprites(mascot_type)
         if animation_state not in sprites:
             animation_state = "idle"
-            
-        if sprites[animation_state]:
-            sprite_to_draw = sprites[animation_state][current_frame]
+        if not sprites.get(animation_state):
+            return None
+        
+        sprite = sprites[animation_state][current_frame]
+        scale = self.layout.mascot_scale // pixel_scale
+        if (rotation or pixel_scale > 1) and mascot_type in MASCOT_TYPES:
+            asset_name = f"{mascot_type}_{MASCOT_SPRITE_NAMES[animation_state][current_frame]}"
+            sprite = self.get_scaled_asset(asset_name, scale, rotation) or sprite
+        return (mascot_type, animation_state, current_frame, scale, rotation), sprite
+    
+    def prebuild_effects(self, mascot_type, pixel_scale=1):
+        """Build the effect variants of a mascot's unrotated sprites ahead of time"""
+        start_time = time.perf_counter()
+        sprites = []
+        for animation_state, frames in self.get_mascot_sprites(mascot_type).items():
+            for current_frame in range(len(frames)):
+                sprites.append(self.get_mascot_sprite(mascot_type, animation_state, current_frame, 0, pixel_scale))
+        built = self.sprite_effects.prebuild(sprites)
+        
+        elapsed = (time.perf_counter() - start_time) * 1000
+        print(f"✨ Built {built} sprite effect variants for {mascot_type} in {elapsed:.1f} ms")
+    
+    def draw_mascot(self, offscreen, mascot_type, animation_state="idle", current_frame=0, rotation=0, pixel_scale=1,
+                    effect=None):
+        """Draw the mascot sprite at the UI-controlled position, return the rect drawn
+
+        rotation should come from a fixed set of angles (see Mascot.get_rotation_angle),
+        each angle is rendered once and then served from the scaled asset cache.
+        pixel_scale > 1 draws on a canvas that many times smaller (see get_low_res_offset).
+        effect is an (effect, step) pair from graphics/sprite_effects.py, served from its cache.
+        """
+        mascot_sprite = self.get_mascot_sprite(mascot_type, animation_state, current_frame, rotation, pixel_scale)
+        if mascot_sprite:
+            key, sprite_to_draw = mascot_sprite
+            if effect:
+                sprite_to_draw = self.sprite_effects.get_variant(key, sprite_to_draw, *effect)
             # Center the sprite at UI-controlled position
-            sprite_rect = sprite_to_draw.get_rect(center=(MASCOT_CENTER_X, MASCOT_CENTER_Y))
-            offscreen.blit(sprite_to_draw, sprite_rect)
+            center_x, center_y = self.layout.mascot_center
+            center = (center_x // pixel_scale, center_y // pixel_scale)
+            sprite_rect = sprite_to_draw.get_rect(center=center)
+            return offscreen.blit(sprite_to_draw, sprite_rect)
+        return None
     
     def draw_ui(self, offscreen, num_hearts, health_percentage=100):
-        """Draw the UI elements with locked positioning system"""
+        """Draw the UI elements with locked positioning system, return the rect drawn"""
         try:
             if not self.hp_bar_image or not self.heart_image:
-                self.draw_fallback_ui(offscreen, num_hearts, health_percentage)
-                return
+                return self.draw_fallback_ui(offscreen, num_hearts, health_percentage)
             
-            # Scale up the HP bar (locked scale)
-            hp_width, hp_height = self.hp_bar_image.get_size()
-            scaled_hp_bar = pygame.transform.scale(self.hp_bar_image, 
-                (hp_width * HP_BAR_SCALE, hp_height * HP_BAR_SCALE))
+            # Pre-scaled HP bar (locked scale)
+            layout = self.layout
+            scaled_hp_bar = self.get_scaled_asset('hp', layout.hp_bar_scale)
             scaled_hp_width, scaled_hp_height = scaled_hp_bar.get_size()
 
-            # Scale up the heart (locked scale)
-            heart_width, heart_height = self.heart_image.get_size()
-            scaled_heart = pygame.transform.scale(self.heart_image, 
-                (heart_width * HEART_SCALE, heart_height * HEART_SCALE))
+            # Pre-scaled heart (locked scale)
+            scaled_heart = self.get_scaled_asset('heart', layout.heart_scale)
             scaled_heart_width, scaled_heart_height = scaled_heart.get_size()
 
             # Calculate HP bar position (locked positioning)
-            hp_x = MASCOT_CENTER_X - scaled_hp_width // 2
-            hp_y = MASCOT_CENTER_Y + HP_BAR_OFFSET_Y
+            hp_x = layout.mascot_center[0] - scaled_hp_width // 2
+            hp_y = layout.mascot_center[1] + layout.hp_bar_offset_y
             
             # Draw HP bar background
-            offscreen.blit(scaled_hp_bar, (hp_x, hp_y))
+            drawn_rect = offscreen.blit(scaled_hp_bar, (hp_x, hp_y))
 
             # Draw health bar fill (locked positioning)
-            health_bar_width = int(HP_BAR_HEALTH_WIDTH * HP_BAR_SCALE)
-            health_bar_height = int(HP_BAR_HEALTH_HEIGHT * HP_BAR_SCALE)
-            health_bar_x = hp_x + int(HP_BAR_HEALTH_X_OFFSET * HP_BAR_SCALE)
-            health_bar_y = hp_y + int(HP_BAR_HEALTH_Y_OFFSET * HP_BAR_SCALE)
+            health_bar_width = int(HP_BAR_HEALTH_WIDTH * layout.hp_bar_scale)
+            health_bar_height = int(HP_BAR_HEALTH_HEIGHT * layout.hp_bar_scale)
+            health_bar_x = hp_x + int(HP_BAR_HEALTH_X_OFFSET * layout.hp_bar_scale)
+            health_bar_y = hp_y + int(HP_BAR_HEALTH_Y_OFFSET * layout.hp_bar_scale)
             
             # Calculate current health width based on percentage
             current_health_width = int(health_bar_width * (health_percentage / 100))
@@ -170,47 +292,53 @@ class UIController:
                 pygame.draw.rect(offscreen, (255, 255, 255), health_rect)  # White fill
 
             # Draw hearts (locked positioning)
-            heart_spacing = scaled_heart_width + HEART_SPACING_EXTRA
-            heart_x_start = hp_x + (scaled_hp_width // 2) - ((heart_spacing * num_hearts) // 2) + HEART_X_ADJUSTMENT
-            heart_y = hp_y - scaled_heart_height - HEART_OFFSET_Y
+            heart_spacing = scaled_heart_width + layout.heart_spacing_extra
+            heart_x_start = hp_x + (scaled_hp_width // 2) - ((heart_spacing * num_hearts) // 2) + layout.heart_x_adjustment
+            heart_y = hp_y - scaled_heart_height - layout.heart_offset_y
             
             for i in range(num_hearts):
                 heart_x = heart_x_start + (i * heart_spacing)
-                offscreen.blit(scaled_heart, (heart_x, heart_y))
+                drawn_rect.union_ip(offscreen.blit(scaled_heart, (heart_x, heart_y)))
+            
+            return drawn_rect
                 
         except pygame.error as e:
             print(f"Error drawing UI: {e}")
-            self.draw_fallback_ui(offscreen, num_hearts, health_percentage)
+            return self.draw_fallback_ui(offscreen, num_hearts, health_percentage)
 
     def draw_fallback_ui(self, offscreen, num_hearts, health_percentage):
         """Fallback UI drawing with locked positioning"""
         # Use same locked positioning system
-        hp_bar_width = 100 * HP_BAR_SCALE
-        hp_bar_height = 20 * HP_BAR_SCALE
-        hp_x = MASCOT_CENTER_X - hp_bar_width // 2
-        hp_y = MASCOT_CENTER_Y + HP_BAR_OFFSET_Y
+        layout = self.layout
+        hp_bar_scale = layout.hp_bar_scale
+        hp_bar_width = 100 * hp_bar_scale
+        hp_bar_height = 20 * hp_bar_scale
+        hp_x = layout.mascot_center[0] - hp_bar_width // 2
+        hp_y = layout.mascot_center[1] + layout.hp_bar_offset_y
         
         hp_bar_rect = pygame.Rect(hp_x, hp_y, hp_bar_width, hp_bar_height)
-        pygame.draw.rect(offscreen, (128, 128, 128), hp_bar_rect)
+        drawn_rect = pygame.draw.rect(offscreen, (128, 128, 128), hp_bar_rect)
         pygame.draw.rect(offscreen, (255, 255, 255), hp_bar_rect, 2)
         
         # Draw health fill that fits the HP bar width
-        health_width = int(90 * HP_BAR_SCALE * (health_percentage / 100))
+        health_width = int(90 * hp_bar_scale * (health_percentage / 100))
         if health_width > 0:
-            health_rect = pygame.Rect(hp_x + 5 * HP_BAR_SCALE, 
-                                     hp_y + 3 * HP_BAR_SCALE, 
-                                     health_width, 14 * HP_BAR_SCALE)
+            health_rect = pygame.Rect(hp_x + 5 * hp_bar_scale, 
+                                     hp_y + 3 * hp_bar_scale, 
+                                     health_width, 14 * hp_bar_scale)
             pygame.draw.rect(offscreen, (255, 255, 255), health_rect)
         
         # Draw simple hearts with locked positioning
-        heart_size = 20 * 2
-        heart_spacing = heart_size + 10
+        heart_size = layout.scale(20 * 2)
+        heart_spacing = heart_size + layout.scale(10)
         heart_x_start = hp_x + (hp_bar_width // 2) - ((heart_spacing * num_hearts) // 2)
-        heart_y = hp_y - heart_size - 20
+        heart_y = hp_y - heart_size - layout.scale(20)
         
         for i in range(num_hearts):
             heart_x = heart_x_start + (i * heart_spacing)
-            self.draw_simple_heart(offscreen, heart_x + heart_size//2, heart_y + heart_size//2, heart_size)
+            drawn_rect.union_ip(self.draw_simple_heart(offscreen, heart_x + heart_size//2, heart_y + heart_size//2, heart_size))
+        
+        return drawn_rect
 
     def draw_simple_heart(self, offscreen, x, y, size):
         """Draw a simple heart shape"""
@@ -222,10 +350,14 @@ class UIController:
             (x + size//2, y - size//2),
             (x + size//2, y),
         ]
-        pygame.draw.polygon(offscreen, (255, 255, 255), points)
+        return pygame.draw.polygon(offscreen, (255, 255, 255), points)
 
 # Legacy function for backward compatibility
+_legacy_ui_controller = None
+
 def draw_ui(offscreen, num_hearts, health_percentage=100):
     """Legacy function - use UIController instead"""
-    ui_controller = UIController()
-    ui_controller.draw_ui(offscreen, num_hearts, health_percentage)
\ No newline at end of file
+    global _legacy_ui_controller
+    if _legacy_ui_controller is None:
+        _legacy_ui_controller = UIController()
+    return _legacy_ui_controller.draw_ui(offscreen, num_hearts, health_percentage)
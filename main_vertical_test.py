@@ -2,7 +2,6 @@ import pygame
 import sys
 import time
 import math
-import random
 import os
 from config import *  # Use the vertical dimensions
 from graphics.mascot import Mascot, MascotState
@@ -10,7 +9,18 @@ from ai_manager import AIManager
 from sensor_manager import SensorManager
 from graphics.brick_game import BrickGame
 from graphics.ui import UIController
+from graphics.layout import Layout
 from graphics.pet import Pet
+from graphics.display import DisplayPresenter, TexturePresenter, FramebufferPresenter, SDL2_VIDEO_AVAILABLE, NUMPY_AVAILABLE, set_backlight
+from graphics.compositor import LayerCompositor
+from graphics.text_cache import render_text, text_cache
+from graphics.fonts import font_registry, get_font
+from graphics.particles import ParticleSystem, PARTICLE_CIRCLE, PARTICLE_HEART
+from graphics.palette import make_indexed_surface
+from graphics.recorder import FrameRecorder
+from graphics.mirror import MirrorServer
+from frame_governor import FrameGovernor, FramePacer, DisplaySleep, BUTTON_EVENT, INPUT_EVENTS, RELEASE_EVENTS
+from touch_input import TouchInput, GESTURE_TAP, GESTURE_LONG_PRESS, GESTURE_SWIPE, GESTURE_DRAG
 
 # GPIO fallback for testing
 GPIO_AVAILABLE = True
@@ -19,47 +29,133 @@ print("   Press 'A' for yellow button (pet), 'D' for blue button (game)")
 
 class TamagotchiWaterBottle:
     def __init__(self):
+        if DISPLAY_BACKEND == 'framebuffer':
+            # Frames go straight to the framebuffer, SDL only needs a display for convert()
+            os.environ['SDL_VIDEODRIVER'] = 'dummy'
         pygame.init()
+        # No sound is played; an open audio device keeps SDL's mixer thread waking up
+        pygame.mixer.quit()
         
         # Detect if running on Raspberry Pi
         import platform
         is_raspberry_pi = platform.system() == "Linux" and os.path.exists("/proc/cpuinfo")
         
         # Set up display with vertical orientation for testing or fullscreen for Pi
-        self.DEVICE_WIDTH = 1024   # Physical screen width
-        self.DEVICE_HEIGHT = 600   # Physical screen height
-        self.APP_WIDTH = 600       # App width (will be rotated)
-        self.APP_HEIGHT = 1024     # App height (will be rotated)
+        self.APP_WIDTH = SCREEN_WIDTH     # App width (will be rotated)
+        self.APP_HEIGHT = SCREEN_HEIGHT   # App height (will be rotated)
+        self.DEVICE_WIDTH = SCREEN_HEIGHT   # Physical screen width
+        self.DEVICE_HEIGHT = SCREEN_WIDTH   # Physical screen height
+        # Anchors, sprite scales and font sizes for this canvas size
+        self.layout = Layout(self.APP_WIDTH, self.APP_HEIGHT)
         
-        if is_raspberry_pi:
+        # Load fonts in the background while the rest of startup runs
+        font_registry.preload([self.layout.scale_font(size) for size in FONT_PRELOAD_SIZES])
+        
+        if is_raspberry_pi and DISPLAY_BACKEND != 'framebuffer':
             os.environ['SDL_VIDEODRIVER'] = 'fbcon'
             os.environ['SDL_FBDEV'] = '/dev/fb0'
             os.environ['SDL_NOMOUSE'] = '1'
-            self.screen = pygame.display.set_mode((self.DEVICE_WIDTH, self.DEVICE_HEIGHT), pygame.FULLSCREEN)
             print("🔧 Raspberry Pi detected - Using fullscreen mode")
         else:
-            self.screen = pygame.display.set_mode((self.DEVICE_WIDTH, self.DEVICE_HEIGHT))
             print("💻 Desktop mode detected")
         
-        # Create the offscreen canvas for drawing
-        self.offscreen = pygame.Surface((self.APP_WIDTH, self.APP_HEIGHT))
+        # Presenter rotates the canvas onto the screen once per frame
+        self.presenter = None
+        if DISPLAY_BACKEND == 'renderer' and SDL2_VIDEO_AVAILABLE:
+            # The renderer owns its own window; the hidden display mode is only there for convert()
+            self.screen = pygame.display.set_mode((1, 1), pygame.HIDDEN)
+            self.offscreen = pygame.Surface((self.APP_WIDTH, self.APP_HEIGHT)).convert()
+            try:
+                self.presenter = TexturePresenter(self.offscreen, (self.DEVICE_WIDTH, self.DEVICE_HEIGHT),
+                                                  rotation=270, fullscreen=is_raspberry_pi)
+            except Exception as e:
+                print(f"❌ Renderer backend failed, using surface presentation: {e}")
+        elif DISPLAY_BACKEND == 'framebuffer' and NUMPY_AVAILABLE:
+            self.screen = pygame.display.set_mode((1, 1))
+            # XRGB8888 canvas, the framebuffer's own layout at 32 bpp
+            self.offscreen = pygame.Surface((self.APP_WIDTH, self.APP_HEIGHT), 0, 32,
+                                            (0xff0000, 0xff00, 0xff, 0))
+            try:
+                self.presenter = FramebufferPresenter(self.offscreen, FRAMEBUFFER_DEVICE,
+                                                      size=(self.DEVICE_WIDTH, self.DEVICE_HEIGHT), rotation=270)
+            except Exception as e:
+                print(f"❌ Framebuffer backend failed, using surface presentation: {e}")
+        
+        if self.presenter is None:
+            flags = pygame.FULLSCREEN if is_raspberry_pi else 0
+            self.screen = pygame.display.set_mode((self.DEVICE_WIDTH, self.DEVICE_HEIGHT), flags)
+            # Create the offscreen canvas for drawing (in the screen's pixel format)
+            self.offscreen = pygame.Surface((self.APP_WIDTH, self.APP_HEIGHT)).convert()
+            self.presenter = DisplayPresenter(self.screen, self.offscreen, rotation=270)
+        
+        # The mascot screen can composite on an 8-bit grayscale canvas; the brick game keeps the full-color one
+        self.mascot_canvas = self.offscreen
+        self.mascot_presenter = self.presenter
+        if PALETTE_MODE:
+            if isinstance(self.presenter, DisplayPresenter) and NUMPY_AVAILABLE:
+                self.mascot_canvas = make_indexed_surface((self.APP_WIDTH, self.APP_HEIGHT))
+                self.mascot_presenter = DisplayPresenter(self.screen, self.mascot_canvas, rotation=270)
+                print("🎨 Mascot screen using an 8-bit grayscale canvas")
+            else:
+                print("⚠️  8-bit palette mode needs the surface display backend and numpy")
+        
+        self.ui_controller = UIController(self.layout)  # New UI controller
+        
+        # Optional recording of every presented frame, for bug reports and demos
+        self.recorder = None
+        if RECORD_MODE:
+            record_dir = os.path.join(RECORD_DIR, time.strftime('%Y%m%d-%H%M%S'))
+            try:
+                self.recorder = FrameRecorder((self.APP_WIDTH, self.APP_HEIGHT), record_dir, RECORD_MODE)
+            except (OSError, ValueError) as e:
+                print(f"❌ Recording failed, running without it: {e}")
+        
+        # Optional live view of the display on another machine
+        self.mirror = None
+        if MIRROR_ADDRESS:
+            try:
+                self.mirror = MirrorServer((self.APP_WIDTH, self.APP_HEIGHT), MIRROR_ADDRESS)
+            except (OSError, ValueError) as e:
+                print(f"❌ Mirror failed on {MIRROR_ADDRESS}, running without it: {e}")
+        
+        # Mascot screen layers, bottom first; only the parts that changed get pushed to the display
+        self.compositor = LayerCompositor(self.mascot_canvas)
+        self.compositor.add_layer('background', self.render_background_layer, opaque=True)
+        # Pixel-art mascot renders at low resolution and is upscaled once; text and particles stay full size
+        self.mascot_pixel_scale = self.ui_controller.get_low_res_scale(LOW_RES_FACTOR)
+        self.compositor.add_layer('mascot', self.render_mascot_layer, pixel_scale=self.mascot_pixel_scale,
+                                  pixel_offset=self.ui_controller.get_low_res_offset(self.mascot_pixel_scale))
+        self.compositor.add_layer('effects', self.draw_particles_offscreen, draws_indexed=True)
+        self.compositor.add_layer('overlay', self.render_overlay_layer)
         
         print(f"🔧 Testing vertical orientation: {self.APP_WIDTH}x{self.APP_HEIGHT} canvas on {self.DEVICE_WIDTH}x{self.DEVICE_HEIGHT} screen")
             
         pygame.display.set_caption("Tamagotchi Water Bottle - Vertical Test")
-        self.clock = pygame.time.Clock()
+        # Full frame rate while something moves, a low rate when idle, frames paced to even intervals
+        vsync = VSYNC and isinstance(self.presenter, TexturePresenter)
+        self.governor = FrameGovernor(pacer=FramePacer(vsync=vsync))
+        # Blank the display after SLEEP_AFTER seconds without a button press or drink
+        self.display_sleep = DisplaySleep()
+        self.wake_started = None
+        # A press that wakes the display only wakes it; its input is dropped up to its release
+        self.swallow_press = False
+        # Touches arrive in screen coordinates and are mapped back through the rotation
+        self.touch_input = TouchInput((self.APP_WIDTH, self.APP_HEIGHT), (self.DEVICE_WIDTH, self.DEVICE_HEIGHT), rotation=270)
+        self.touch_input.set_layout(self.layout)
         
         # Initialize components
         self.sensor_manager = SensorManager()
         self.sensor_manager.shake_threshold = 0.5  # Lower threshold for more sensitive shake detection
         self.ai_manager = AIManager()
-        self.ui_controller = UIController()  # New UI controller
         
         # Fallback to keyboard for testing
         if (GPIO_AVAILABLE):
             from gpiozero import Button
             self.yellow_button = Button(17)
             self.blue_button = Button(27)
+            # Callbacks run on gpiozero's thread; they queue an event and wake an idle frame wait
+            self.yellow_button.when_released = lambda: self.post_button_event('yellow')
+            self.blue_button.when_released = lambda: self.post_button_event('blue')
         else:
             self.yellow_button = None
             self.blue_button = None
@@ -78,9 +174,10 @@ class TamagotchiWaterBottle:
         self.current_mascot.hearts = 0  # Hearts for mascot affection
         if self.current_mascot.health == 0:
             self.current_mascot.health = 100
+        self.ui_controller.prebuild_effects(self.current_mascot.type, self.mascot_pixel_scale)
         
         # Pet system (now only handles speech bubbles)
-        self.pet = Pet()
+        self.pet = Pet(self.layout)
         
         # Game state
         self.running = True
@@ -108,9 +205,11 @@ class TamagotchiWaterBottle:
         self.streak_days = 0
         self.last_drink_date = None
         self.session_water = 0  # Water consumed in current session
+        self.next_autosave = time.monotonic() + 30
         
         # Effects
-        self.particles = []
+        self.particles = ParticleSystem(MAX_PARTICLES, radius=3, indexed=self.compositor.indexed)
+        self.particle_updates = 0
         self.achievement_popup = None
         self.achievement_timer = 0
         
@@ -123,40 +222,101 @@ class TamagotchiWaterBottle:
         mascot_x, mascot_y = self.ui_controller.get_mascot_position()
         print(f"📍 Mascot positioned at ({mascot_x}, {mascot_y})")
 
+        font_registry.wait_for_preload()
         self.load_custom_font()
 
     def load_custom_font(self):
-        """Load the custom TTF font from assets/fonts"""
-        try:
-            font_path = os.path.join("assets", "fonts", "Delicatus-e9OLl.ttf")
-            if os.path.exists(font_path):
-                self.custom_font = pygame.font.Font(font_path, 24)
-                self.custom_font_small = pygame.font.Font(font_path, 18)
-                print(f"✅ Loaded custom font for brick game: {font_path}")
-            else:
-                print(f"⚠️  Custom font not found: {font_path}")
-                self.custom_font = pygame.font.Font(None, 24)  # Fallback to default
-                self.custom_font_small = pygame.font.Font(None, 18)  # Fallback to default
-        except Exception as e:
-            print(f"❌ Error loading custom font: {e}")
-            self.custom_font = pygame.font.Font(None, 24)  # Fallback to default
-            self.custom_font_small = pygame.font.Font(None, 18)  # Fallback to default
+        """Get the custom TTF fonts from the shared font registry"""
+        self.custom_font = get_font(self.layout.scale_font(24))
+        self.custom_font_small = get_font(self.layout.scale_font(18))
+        self.achievement_title_font = get_font(self.layout.scale_font(28))
+        self.achievement_body_font = get_font(self.layout.scale_font(20))
+        
+    def post_button_event(self, button):
+        """Queue a GPIO button release for handle_events (called from gpiozero's thread)"""
+        pygame.event.post(pygame.event.Event(BUTTON_EVENT, button=button))
         
     def handle_events(self):
         # Check for pygame quit event
         for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+            # The renderer backend's window sends WINDOWCLOSE, the hidden display keeps QUIT from coming
+            if event.type in (pygame.QUIT, pygame.WINDOWCLOSE):
                 self.running = False
                 return
+            if event.type in INPUT_EVENTS:
+                self.governor.note_activity()
+                self.display_sleep.note_activity()
+            if self.swallow_press:
+                if event.type in RELEASE_EVENTS:
+                    self.swallow_press = False
+                continue
+            # The brick game gets its input from here; draining the queue itself would lose
+            # button events posted or put back after this loop
+            if self.brick_game:
+                self.brick_game.handle_event(event)
+            for gesture in self.touch_input.handle_event(event, self.state):
+                self.handle_gesture(gesture)
             if (GPIO_AVAILABLE):
-                self.yellow_button.when_released = lambda: setattr(self, 'yellow_button_up', True)
-                self.blue_button.when_released = lambda: setattr(self, 'blue_button_up', True)
+                if event.type == BUTTON_EVENT:
+                    if event.button == 'yellow':
+                        self.yellow_button_up = True
+                    if event.button == 'blue':
+                        self.blue_button_up = True
             else:
                 if event.type == pygame.KEYUP:
                     if event.key == pygame.K_a:
                         self.yellow_button_up = True
                     if event.key == pygame.K_d:
                         self.blue_button_up = True
+        
+        # A held finger keeps the full frame rate so a long press fires on time
+        if self.touch_input.is_touching():
+            self.governor.note_activity()
+            for gesture in self.touch_input.update():
+                self.handle_gesture(gesture)
+                
+    def handle_gesture(self, gesture):
+        """React to a touch gesture on the current screen"""
+        handled = True
+        if self.state == "selection":
+            if gesture.kind == GESTURE_TAP and gesture.region == 'mascot':
+                self.switch_mascot()
+            elif gesture.kind == GESTURE_LONG_PRESS and gesture.region == 'mascot':
+                self.state = "pet"
+            else:
+                handled = False
+        elif self.state == "pet":
+            if gesture.kind == GESTURE_TAP and gesture.region == 'mascot':
+                self.pet_mascot()
+            elif gesture.kind == GESTURE_TAP and gesture.region == 'hud':
+                health = round(self.current_mascot.health / self.current_mascot.max_health * 100)
+                self.pet.start_speaking(f"I'm {health}% full!")
+            elif gesture.kind == GESTURE_TAP and gesture.region == 'speech' and self.pet.speaking:
+                self.pet.stop_speaking()
+            elif gesture.kind == GESTURE_LONG_PRESS and gesture.region == 'mascot':
+                self.state = "selection"
+            elif gesture.kind == GESTURE_SWIPE and gesture.direction == 'up':
+                self.state = "brick_game"
+                self.start_brick_game()
+            else:
+                handled = False
+        elif self.state == "brick_game" and self.brick_game:
+            if gesture.kind == GESTURE_DRAG:
+                self.brick_game.move_paddle_to(gesture.position[0])
+            elif gesture.kind == GESTURE_TAP:
+                self.brick_game.launch_ball()
+            elif gesture.kind == GESTURE_SWIPE and gesture.direction == 'down':
+                self.state = "pet"
+                self.exit_brick_game()
+            else:
+                handled = False
+        else:
+            handled = False
+        
+        if handled:
+            self.governor.note_activity()
+            self.display_sleep.note_activity()
+            self.touch_input.note_reaction(gesture)
                 
     def switch_mascot(self):
         """Switch between different mascots"""
@@ -175,6 +335,8 @@ class TamagotchiWaterBottle:
         self.current_mascot = Mascot(new_type)
         self.ai_manager.current_pet = new_type
         self.current_mascot.load_state()
+        self.ui_controller.prebuild_effects(new_type, self.mascot_pixel_scale)
+        self.current_mascot.appear()
         
         # Mascot speaks about the switch
         self.pet.start_speaking(f"Hi! I'm {self.current_mascot.name}! Nice to meet you!")
@@ -223,7 +385,8 @@ class TamagotchiWaterBottle:
             self.button_mode = BUTTON_MODE_BRICK
             # Pass the offscreen canvas and correct dimensions for vertical orientation
             # Set test_mode=True for keyboard controls
-            self.brick_game = BrickGame(self.offscreen, self.sensor_manager, self.APP_WIDTH, self.APP_HEIGHT, test_mode=True)
+            self.brick_game = BrickGame(self.offscreen, self.sensor_manager, self.APP_WIDTH, self.APP_HEIGHT, test_mode=True,
+                                        layout=self.layout)
             
             # Mascot speaks about the game
             self.pet.start_speaking(self.ai_manager.generate_random_feature("", "", 100))
@@ -271,38 +434,20 @@ class TamagotchiWaterBottle:
             self.pet.start_speaking(self.ai_manager.generate_conversation("", "", "User just petted me!"))
             
     def add_particles(self, x, y, particle_type):
-        """Add particle effects (limited for performance)"""
-        # Limit particles for better performance
-        if len(self.particles) > 20:
-            return
-            
+        """Add particle effects"""
         colors = {
             'heart': WHITE,
             'sparkle': WHITE,
             'water': LIGHT_GRAY
         }
-        
-        for _ in range(5):
-            particle = {
-                'x': x + random.uniform(-20, 20),
-                'y': y + random.uniform(-20, 20),
-                'vx': random.uniform(-2, 2),
-                'vy': random.uniform(-3, -1),
-                'life': 60,
-                'color': colors.get(particle_type, WHITE),
-                'type': particle_type
-            }
-            self.particles.append(particle)
+        shape = PARTICLE_HEART if particle_type == 'heart' else PARTICLE_CIRCLE
+        self.particles.emit(x, y, 5, colors.get(particle_type, WHITE), shape)
             
-    def update_particles(self):
+    def update_particles(self, dt):
         """Update particle effects"""
-        for particle in self.particles[:]:
-            particle['x'] += particle['vx']
-            particle['y'] += particle['vy']
-            particle['life'] -= 1
-            
-            if particle['life'] <= 0:
-                self.particles.remove(particle)
+        if self.particles:
+            self.particle_updates += 1
+        self.particles.update(dt)
                 
     def update_sensor_data(self):
         """Update sensor data and handle drinking detection"""
@@ -331,6 +476,7 @@ class TamagotchiWaterBottle:
         
     def handle_drinking(self, water_amount):
         """Handle water drinking event"""
+        self.display_sleep.note_activity()
         self.session_water += water_amount
         self.total_water_drunk += water_amount
         
@@ -364,7 +510,7 @@ class TamagotchiWaterBottle:
         self.pet.update(dt)
         
         # Update particles
-        self.update_particles()
+        self.update_particles(dt)
         
         # Update timers
         self.achievement_timer -= dt
@@ -376,10 +522,17 @@ class TamagotchiWaterBottle:
         if current_time - self.last_right_press_time > self.button_combo_timeout:
             self.right_button_press_count = 0
         
-        # Auto-save every 30 seconds
-        if int(time.time()) % 30 == 0:
+        # Auto-save every 30 seconds (once, however many frames that second has)
+        if time.monotonic() >= self.next_autosave:
             self.current_mascot.save_state()
+            self.next_autosave = time.monotonic() + 30
             
+    def is_animating(self):
+        """Check if anything on screen moves every frame (keyframe animation and timers don't count)"""
+        return (self.playing_brick or len(self.particles) > 0 or self.current_mascot.is_dizzy
+                or self.current_mascot.is_drinking or self.current_mascot.has_sprite_effect()
+                or self.sensor_manager.is_currently_drinking())
+        
     def draw(self):
         """Draw everything to offscreen canvas, rotate, then display"""
         if self.playing_brick:
@@ -387,160 +540,190 @@ class TamagotchiWaterBottle:
             if self.brick_game:
                 self.brick_game.draw()
                 
-                # Rotate the offscreen canvas 270 degrees (3x 90-degree rotations)
-                rotated = pygame.transform.rotate(self.offscreen, 90)
-                rotated = pygame.transform.rotate(rotated, 90)
-                rotated = pygame.transform.rotate(rotated, 90)
+                # Rotate the offscreen canvas 270 degrees onto the screen and flip
+                self.presenter.present()
+                self.governor.note_present()
+                self.touch_input.note_presented()
+                if self.recorder:
+                    self.recorder.capture(self.offscreen)
+                if self.mirror:
+                    self.mirror.publish(self.offscreen)
                 
-                # Clear the visible screen
-                self.screen.fill(BLACK)
-                
-                # Center the rotated canvas on the screen
-                rotated_rect = rotated.get_rect()
-                rotated_rect.center = (self.DEVICE_WIDTH // 2, self.DEVICE_HEIGHT // 2)
-                
-                # Blit the rotated canvas to the visible screen
-                self.screen.blit(rotated, rotated_rect)
-                
-                pygame.display.flip()
+                # The mascot screen must be composited in full when we come back
+                self.compositor.invalidate()
             return
-            
-        # Clear offscreen canvas
-        self.offscreen.fill(BLACK)
         
-        # Get mascot position and animation info
-        mascot_x, mascot_y = self.ui_controller.get_mascot_position()
-        animation_state = self.current_mascot.get_animation_state()
-        animation_frame = self.current_mascot.get_animation_frame()
+        # Re-render only the layers whose state changed and composite the changed areas
+        dirty_rects = self.compositor.compose(self.get_layer_versions())
+        
+        # Rotate the changed parts of the offscreen canvas onto the screen and update display
+        if dirty_rects:
+            self.mascot_presenter.present(dirty_rects)
+            self.governor.note_present()
+            self.touch_input.note_presented()
+            if self.recorder:
+                self.recorder.capture(self.mascot_canvas)
+        if self.mirror:
+            # Also called on unchanged frames to send a change the mirror's frame rate cap held back
+            self.mirror.publish(self.mascot_canvas, changed=bool(dirty_rects))
+        
+    def get_layer_versions(self):
+        """Get the version stamp of every mascot screen layer, None hides a layer"""
+        if self.state == "selection":
+            background_version = "selection"
+            effects_version = None
+            overlay_version = None
+        else:
+            background_version = self.current_mascot.get_hud_version()
+            # Particles move every update
+            effects_version = self.particle_updates if self.particles else None
+            achievement = self.achievement_popup if self.achievement_timer > 0 else None
+            bubble_version = self.pet.get_bubble_version()
+            overlay_version = (bubble_version, achievement) if bubble_version or achievement else None
+        
+        return {
+            'background': background_version,
+            'mascot': self.current_mascot.get_sprite_version(),
+            'effects': effects_version,
+            'overlay': overlay_version
+        }
+        
+    def render_background_layer(self, surface):
+        """Render the background with the selection instructions or HP bar and hearts"""
+        surface.fill(BLACK)
         
-        # Draw mascot using UI controller
-        self.ui_controller.draw_mascot(self.offscreen, self.current_mascot.type, animation_state, animation_frame)
-
         if self.state == "selection":
             # Draw selection instructions at the top of the screen
-            font = self.custom_font if self.custom_font else pygame.font.Font(None, 24)
+            font = self.custom_font if self.custom_font else pygame.font.Font(None, self.layout.scale_font(24))
             instruction_text_1 = "Press YELLOW (A) to change mascot"
             instruction_text_2 = "Press BLUE (D) to confirm"
-            text_surface_1 = font.render(instruction_text_1, True, WHITE)
-            text_surface_2 = font.render(instruction_text_2, True, WHITE)
-            text_rect_1 = text_surface_1.get_rect(center=(self.APP_WIDTH // 2, 100))
-            text_rect_2 = text_surface_2.get_rect(center=(self.APP_WIDTH // 2, 130))
-            self.offscreen.blit(text_surface_1, text_rect_1)
-            self.offscreen.blit(text_surface_2, text_rect_2)
-        
-        if self.state != "selection":
-            # Draw UI elements using UI controller
-            health_percentage = (self.current_mascot.health / self.current_mascot.max_health) * 100
-            self.ui_controller.draw_ui(self.offscreen, self.current_mascot.hearts, health_percentage)
-        
-            # Draw particles on offscreen canvas
-            self.draw_particles_offscreen()
-            
-            # Draw mascot speech bubble on offscreen canvas
-            if self.pet.speaking:
-                self.pet.draw_speech_bubble(self.offscreen, mascot_x, mascot_y)
-            
-            # Draw particles on offscreen canvas
-            self.draw_particles_offscreen()
-            
-            # Draw mascot speech bubble on offscreen canvas
-            if self.pet.speaking:
-                self.pet.draw_speech_bubble(self.offscreen, mascot_x, mascot_y)
-                
-            # Draw achievement popup on offscreen canvas
-            if self.achievement_timer > 0:
-                self.draw_achievement_offscreen()
-        
-        # Rotate the entire offscreen canvas 270 degrees (3x 90-degree rotations)
-        rotated = pygame.transform.rotate(self.offscreen, 90)
-        rotated = pygame.transform.rotate(rotated, 90)
-        rotated = pygame.transform.rotate(rotated, 90)
-        
-        # Clear the visible screen
-        self.screen.fill(BLACK)
-        
-        # Center the rotated canvas on the screen
-        rotated_rect = rotated.get_rect()
-        rotated_rect.center = (self.DEVICE_WIDTH // 2, self.DEVICE_HEIGHT // 2)
-        
-        # Blit the rotated canvas to the visible screen
-        self.screen.blit(rotated, rotated_rect)
-        
-        # Update display
-        pygame.display.flip()
-        
-    def draw_particles_offscreen(self):
-        """Draw particle effects on offscreen canvas"""
-        for particle in self.particles:
-            alpha = particle['life'] / 60.0
-            color = particle['color']
+            text_surface_1 = render_text(font, instruction_text_1, WHITE)
+            text_surface_2 = render_text(font, instruction_text_2, WHITE)
+            text_y_1, text_y_2 = self.layout.selection_text_y
+            text_rect_1 = text_surface_1.get_rect(center=(self.APP_WIDTH // 2, text_y_1))
+            text_rect_2 = text_surface_2.get_rect(center=(self.APP_WIDTH // 2, text_y_2))
+            surface.blit(text_surface_1, text_rect_1)
+            surface.blit(text_surface_2, text_rect_2)
+            return text_rect_1.union(text_rect_2)
+        
+        # Draw UI elements using UI controller
+        health_percentage = (self.current_mascot.health / self.current_mascot.max_health) * 100
+        return self.ui_controller.draw_ui(surface, self.current_mascot.hearts, health_percentage)
+        
+    def render_mascot_layer(self, surface):
+        """Render the mascot sprite using the UI controller"""
+        animation_state = self.current_mascot.get_animation_state()
+        animation_frame = self.current_mascot.get_animation_frame()
+        rotation = self.current_mascot.get_rotation_angle()
+        effect = self.current_mascot.get_sprite_effect()
+        return self.ui_controller.draw_mascot(surface, self.current_mascot.type, animation_state, animation_frame,
+                                              rotation, self.mascot_pixel_scale, effect)
+        
+    def render_overlay_layer(self, surface):
+        """Render the speech bubble and achievement popup"""
+        drawn_rect = None
+        
+        # Draw mascot speech bubble
+        if self.pet.speaking:
+            mascot_x, mascot_y = self.ui_controller.get_mascot_position()
+            drawn_rect = self.pet.draw_speech_bubble(surface, mascot_x, mascot_y)
             
-            if particle['type'] == 'heart':
-                # Draw heart shape
-                points = [
-                    (particle['x'], particle['y'] - 5),
-                    (particle['x'] - 3, particle['y'] - 8),
-                    (particle['x'] - 5, particle['y'] - 3),
-                    (particle['x'] - 5, particle['y'] + 2),
-                    (particle['x'], particle['y'] + 5),
-                    (particle['x'] + 5, particle['y'] + 2),
-                    (particle['x'] + 5, particle['y'] - 3),
-                ]
-                pygame.draw.polygon(self.offscreen, color, points)
-            else:
-                # Draw simple circle
-                pygame.draw.circle(self.offscreen, color, 
-                                 (int(particle['x']), int(particle['y'])), 3)
+        # Draw achievement popup
+        if self.achievement_timer > 0:
+            achievement_rect = self.draw_achievement_offscreen(surface)
+            drawn_rect = achievement_rect if drawn_rect is None else drawn_rect.union(achievement_rect)
+        return drawn_rect
+        
+    def draw_particles_offscreen(self, surface):
+        """Draw particle effects, return the rect drawn"""
+        return self.particles.draw(surface)
                                  
-    def draw_achievement_offscreen(self):
-        """Draw achievement popup on offscreen canvas with pixel-art style"""
+    def draw_achievement_offscreen(self, surface):
+        """Draw achievement popup with pixel-art style, return the rect drawn"""
         if not self.achievement_popup:
-            return
+            return None
         
         # Draw achievement box with pixel-art style
-        box_width = 300  # Smaller for vertical layout
-        box_height = 100
-        box_x = self.APP_WIDTH // 2 - box_width // 2
-        box_y = 80
-        
-        box_rect = pygame.Rect(box_x, box_y, box_width, box_height)
+        box_rect = self.layout.achievement_box
+        box_x, box_y, box_width, box_height = box_rect
         
         # Box background
-        pygame.draw.rect(self.offscreen, WHITE, box_rect)
-        pygame.draw.rect(self.offscreen, BLACK, box_rect, BORDER_THICKNESS)
+        pygame.draw.rect(surface, WHITE, box_rect)
+        pygame.draw.rect(surface, BLACK, box_rect, BORDER_THICKNESS)
         
         # Draw pixel-art border effect
         highlight_rect = pygame.Rect(box_x + 3, box_y + 3, box_width - 6, box_height - 6)
-        pygame.draw.rect(self.offscreen, LIGHT_GRAY, highlight_rect, 1)
+        pygame.draw.rect(surface, LIGHT_GRAY, highlight_rect, 1)
         
         # Draw title with custom font
-        font_path = os.path.join("assets", "fonts", "Delicatus-e9OLl.ttf")
-        try:
-            title_font = pygame.font.Font(font_path, 28)
-        except Exception as e:
-            print(f"Error loading custom font: {e}")
-            title_font = pygame.font.Font(None, 28)
-        text = title_font.render("ACHIEVEMENT!", True, BLACK)
-        text_rect = text.get_rect(center=(box_rect.centerx, box_rect.y + 20))
-        self.offscreen.blit(text, text_rect)
+        text = render_text(self.achievement_title_font, "ACHIEVEMENT!", BLACK)
+        text_rect = text.get_rect(center=(box_rect.centerx, box_rect.y + self.layout.achievement_title_y))
+        surface.blit(text, text_rect)
         
         # Draw achievement text with custom font
-        try:
-            body_font = pygame.font.Font(font_path, 20)
-        except Exception as e:
-            print(f"Error loading custom font: {e}")
-            body_font = pygame.font.Font(None, 20)
-        text = body_font.render(self.achievement_popup, True, BLACK)
-        text_rect = text.get_rect(center=(box_rect.centerx, box_rect.y + 50))
-        self.offscreen.blit(text, text_rect)
+        text = render_text(self.achievement_body_font, self.achievement_popup, BLACK)
+        text_rect = text.get_rect(center=(box_rect.centerx, box_rect.y + self.layout.achievement_text_y))
+        surface.blit(text, text_rect)
+        
+        # Long achievement text can spill past the box
+        return box_rect.union(text_rect)
+            
+    def go_to_sleep(self):
+        """Blank the display and stop rendering until the bottle is picked up or a button is pressed"""
+        self.current_mascot.save_state()
+        self.particles.clear()
+        self.mascot_canvas.fill(BLACK)
+        self.mascot_presenter.present()
+        if self.recorder:
+            self.recorder.capture(self.mascot_canvas)
+        if self.mirror:
+            self.mirror.publish(self.mascot_canvas)
+        set_backlight(False)
+        # The blank canvas gets composited over in full on the first frame back
+        self.compositor.invalidate()
+        self.sensor_manager.reset_motion()
+        self.display_sleep.enter()
+        print("😴 Display asleep, pick up the bottle or press a button to wake it")
+        
+    def sleep_step(self):
+        """While asleep only check for motion, at SLEEP_SENSOR_RATE; motion or input wakes the display"""
+        woken = self.governor.wait_until(time.monotonic() + 1.0 / SLEEP_SENSOR_RATE)
+        if self.mirror:
+            # The blank frame may have been held back by the mirror's frame rate cap
+            self.mirror.publish(self.mascot_canvas, changed=False)
+        if woken:
+            self.wake_up(by_press=True)
+        elif self.sensor_manager.detect_motion():
+            self.wake_up()
+            
+    def wake_up(self, by_press=False):
+        """Switch the display back on; the next frame catches the mascot up and redraws everything
+
+        by_press drops the waking press's input so it doesn't also act on the screen it woke.
+        """
+        self.wake_started = time.perf_counter()
+        self.swallow_press = by_press
+        slept = self.display_sleep.exit()
+        set_backlight(True)
+        self.current_mascot.appear()
+        self.governor.note_activity()
+        print(f"🌅 Display awake after {slept:.0f} s asleep")
             
     def run(self):
         """Main game loop"""
         while self.running:
+            if self.display_sleep.sleeping:
+                self.sleep_step()
+                continue
+            if self.state != "brick_game" and self.display_sleep.should_sleep():
+                self.go_to_sleep()
+                continue
+            if self.is_animating():
+                self.governor.note_activity()
             if self.state == "brick_game":
-                dt = self.clock.tick(BRICK_GAME_FPS) / 1000.0
+                dt = self.governor.tick(BRICK_GAME_FPS)
             else:
-                dt = self.clock.tick(MASCOT_FPS) / 1000.0
+                dt = self.governor.tick(MASCOT_FPS, self.current_mascot.get_next_keyframe_delay())
             if (self.state == "selection"):
                 self.pet_selection_loop()
             elif (self.state == "pet"):
@@ -550,8 +733,34 @@ class TamagotchiWaterBottle:
             self.handle_events()
             self.update(dt)
             self.draw()
+            if self.wake_started:
+                self.display_sleep.record_wake_time(time.perf_counter() - self.wake_started)
+                self.wake_started = None
             
         # Cleanup
+        text_stats = text_cache.get_stats()
+        print(f"📝 Text cache: {text_stats['hit_rate']:.0%} hit rate, {text_stats['saved_ms']:.0f} ms of rendering saved")
+        font_stats = font_registry.get_stats()
+        print(f"🔤 Fonts: {font_stats['load_count']} loads, {font_stats['load_ms']:.1f} ms spent loading")
+        effect_stats = self.ui_controller.sprite_effects.get_stats()
+        print(f"✨ Sprite effects: {effect_stats['entries']} variants, {effect_stats['kb']:.0f} KB, {effect_stats['hit_rate']:.0%} hit rate")
+        governor_stats = self.governor.get_stats()
+        print(f"💤 Idle rate for {governor_stats['idle_seconds']:.0f} s ({governor_stats['idle_frames']} of {governor_stats['frames']} frames)")
+        pacer_stats = self.governor.pacer.get_stats()
+        print(f"⏱️  Frame pacing ({pacer_stats['mode']}): jitter p50 {pacer_stats['jitter_p50_ms']:.2f} ms, p95 {pacer_stats['jitter_p95_ms']:.2f} ms, {pacer_stats['missed']} missed deadlines")
+        if self.recorder:
+            self.recorder.stop()
+            record_stats = self.recorder.get_stats()
+            print(f"🎥 Recorded {record_stats['written']} frames, dropped {record_stats['dropped']}")
+        if self.mirror:
+            self.mirror.close()
+            mirror_stats = self.mirror.get_stats()
+            print(f"📡 Mirrored {mirror_stats['frames_sent']} frames, {mirror_stats['kb_sent']:.0f} KB, {mirror_stats['avg_tiles']:.1f} tiles per frame")
+        touch_stats = self.touch_input.get_stats()
+        if touch_stats['gestures']:
+            print(f"👆 Touch: {touch_stats['gestures']}, latency p50 {touch_stats['latency_p50_ms']:.1f} ms, p95 {touch_stats['latency_p95_ms']:.1f} ms")
+        sleep_stats = self.display_sleep.get_stats()
+        print(f"😴 Display slept {sleep_stats['sleep_count']} times for {sleep_stats['sleep_seconds']:.0f} s")
         self.current_mascot.save_state()
         self.sensor_manager.disconnect()
         pygame.quit()
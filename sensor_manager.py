@@ -21,6 +21,7 @@ import time
 import math
 from datetime import datetime
 from collections import deque
+from config import MOTION_WAKE_THRESHOLD, SHAKE_WINDOW, SHAKE_DURATION, DRINK_STABLE_TIME
 
 # Try to import smbus, fall back gracefully if not available
 try:
@@ -71,8 +72,8 @@ class SensorManager:
         
         # Movement detection
         self.last_tilt_y = 0.0
-        self.stable_readings = 0
-        self.required_stable_readings = 5   # Reduced to 5 stable readings (0.25 seconds) for quicker detection
+        self.stable_since = 0.0  # time of the last significant movement
+        self.required_stable_time = DRINK_STABLE_TIME
         
         # Drinking session variables
         self.is_drinking = False
@@ -93,9 +94,13 @@ class SensorManager:
         
         # Shake detection
         self.shake_threshold = 1.5
-        self.shake_window_size = 5
-        self.accel_history = []
+        self.accel_history = deque()  # (time, acceleration magnitude) over the last SHAKE_WINDOW seconds
+        self.last_shake_check = None
         self._shake_printed = False
+        self.last_simulated_time = None
+        
+        # Motion wake (display asleep)
+        self.last_motion_reading = None
         
         # Initialize I2C bus
         self.bus = None
@@ -270,13 +275,11 @@ class SensorManager:
 
         if tilt_change > self.NOISE_THRESHOLD:
             # Significant movement detected
-            self.stable_readings = 0
-        else:
-            # Movement is stable
-            self.stable_readings += 1
+            self.stable_since = current_time
 
-        # Only trigger if we have stable readings above threshold and within upper bound
-        if (self.TILT_THRESHOLD < total_tilt < self.TILT_UPPER_BOUND) and self.stable_readings >= self.required_stable_readings:
+        # Only trigger once the tilt has held steady long enough, above threshold and within upper bound
+        stable = current_time - self.stable_since >= self.required_stable_time
+        if (self.TILT_THRESHOLD < total_tilt < self.TILT_UPPER_BOUND) and stable:
             # Bottle is tilted enough to be drinking
             if not self.is_drinking:
                 # Start a new drinking session
@@ -347,34 +350,39 @@ class SensorManager:
         self.session_water_consumed = 0.0
         self.water_amount = 0
     
-    def detect_shake(self, shake_threshold=1.2, window_size=5):
+    def detect_shake(self, current_time, shake_threshold=1.2, window=SHAKE_WINDOW):
         """
         Detect if the bottle is being shaken based on rapid changes in acceleration.
+        current_time: time of this reading (time.monotonic)
         shake_threshold: minimum change in acceleration (g) to consider as shaking
-        window_size: number of samples to consider for shake detection
+        window: seconds of readings to consider for shake detection
         """
-        # Store the current acceleration vector magnitude
+        elapsed = current_time - self.last_shake_check if self.last_shake_check is not None else 0.0
+        self.last_shake_check = current_time
+        
+        # Store the current acceleration vector magnitude, keep the last window seconds
         accel_mag = math.sqrt(self.accel_x**2 + self.accel_y**2 + self.accel_z**2)
-        self.accel_history.append(accel_mag)
-        if len(self.accel_history) > window_size:
-            self.accel_history.pop(0)
-        # Only check for shake if we have enough samples
-        if len(self.accel_history) == window_size:
+        self.accel_history.append((current_time, accel_mag))
+        while current_time - self.accel_history[0][0] > window:
+            self.accel_history.popleft()
+        # Only check for shake once there is something to compare
+        if len(self.accel_history) > 1:
             # Calculate the max difference in the window
-            max_diff = max(self.accel_history) - min(self.accel_history)
+            magnitudes = [magnitude for _, magnitude in self.accel_history]
+            max_diff = max(magnitudes) - min(magnitudes)
             if max_diff > shake_threshold:
                 if not self._shake_printed:
                     print("Shake detected! (max accel diff: {:.2f}g)".format(max_diff))
                     self._shake_printed = True
                 self.is_shaking = True
-                self.shake_timer = 3.0  # Shake effect lasts 3 seconds
+                self.shake_timer = SHAKE_DURATION
                 return True
             else:
                 self._shake_printed = False
         
-        # Update shake timer
+        # Update shake timer by the time that really passed
         if self.is_shaking:
-            self.shake_timer -= 0.05  # Assuming 20Hz update rate
+            self.shake_timer -= elapsed
             if self.shake_timer <= 0:
                 self.is_shaking = False
                 
@@ -409,7 +417,7 @@ class SensorManager:
     
     def update(self):
         """Update sensor readings and detection - main interface for game"""
-        current_time = time.time()
+        current_time = time.monotonic()
         
         # Read sensor data
         self.read_accelerometer()
@@ -417,7 +425,7 @@ class SensorManager:
         
         # Detect drinking and shaking
         drinking_detected = self.detect_drinking(current_time)
-        shaking_detected = self.detect_shake()
+        shaking_detected = self.detect_shake(current_time)
         
         return {
             'drinking_detected': drinking_detected,
@@ -428,10 +436,29 @@ class SensorManager:
             'last_session_amount': self.last_session_amount
         }
     
+    def detect_motion(self, threshold=MOTION_WAKE_THRESHOLD):
+        """Cheap check used while the display sleeps: read only the accelerometer and report a pickup"""
+        self.read_accelerometer()
+        reading = (self.accel_x, self.accel_y, self.accel_z)
+        last_reading = self.last_motion_reading
+        self.last_motion_reading = reading
+        if last_reading is None:
+            return False
+        return math.dist(reading, last_reading) > threshold
+    
+    def reset_motion(self):
+        """Forget the last motion reading so the next check starts fresh"""
+        self.last_motion_reading = None
+    
     def generate_simulated_data(self):
         """Generate simulated sensor data for testing without hardware"""
         import random
         
+        # Event chances below are per second, whatever the update rate
+        now = time.monotonic()
+        elapsed = now - self.last_simulated_time if self.last_simulated_time is not None else 0.0
+        self.last_simulated_time = now
+        
         # Simulate random sensor readings
         self.accel_x = random.uniform(-0.1, 0.1)
         self.accel_y = random.uniform(-0.1, 0.1)
@@ -441,11 +468,11 @@ class SensorManager:
             self.calibrate_sensor()
             
         # Simulate occasional drinking (for testing)
-        if random.random() < 0.01:  # 1% chance per update
+        if random.random() < 0.2 * elapsed:  # About once every 5 seconds
             self.accel_y = random.uniform(0.5, 1.0)  # Simulate tilt
             
         # Simulate occasional shaking
-        if random.random() < 0.005:  # 0.5% chance per update
+        if random.random() < 0.1 * elapsed:  # About once every 10 seconds
             self.accel_x = random.uniform(-0.5, 0.5)
             self.accel_y = random.uniform(-0.5, 0.5)
             
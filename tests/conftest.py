@@ -0,0 +1,56 @@
+import os
+import sys
+import pytest
+
+# Headless SDL; set before pygame opens a display
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+# Modules import each other from the repo root, as when main_vertical_test.py runs
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pygame
+
+@pytest.fixture(autouse=True)
+def repo_root(monkeypatch):
+    """Run every test from the repo root, where assets are loaded from"""
+    monkeypatch.chdir(ROOT)
+
+@pytest.fixture
+def display():
+    """A 1x1 pygame display, enough for convert() and convert_alpha()
+
+    pygame stays initialised between tests: the shared font registry keeps its fonts.
+    """
+    pygame.init()
+    return pygame.display.set_mode((1, 1))
+
+class FakeClock:
+    """A clock that only moves when told to, for fast-forwarding through hours in a test"""
+
+    def __init__(self, start=1000.0):
+        self.now = start
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+@pytest.fixture
+def app(monkeypatch, tmp_path):
+    """The whole app on a desktop window of the dummy driver, saving to a temp file"""
+    import platform
+    import graphics.mascot
+    # Desktop mode even on a Linux box, so SDL keeps the dummy driver
+    monkeypatch.setattr(platform, 'system', lambda: 'Darwin')
+    monkeypatch.setattr(graphics.mascot, 'SAVE_FILE', str(tmp_path / 'mascot_save.json'))
+    import main_vertical_test
+    # Keyboard buttons; tests that need GPIO events switch it back on after startup
+    monkeypatch.setattr(main_vertical_test, 'GPIO_AVAILABLE', False)
+    return main_vertical_test.TamagotchiWaterBottle()
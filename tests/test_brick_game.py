@@ -0,0 +1,37 @@
+import pygame
+import main_vertical_test
+from frame_governor import BUTTON_EVENT
+
+def start_game(app, monkeypatch):
+    """Put the app in the brick game with GPIO buttons, and empty its event queue"""
+    monkeypatch.setattr(main_vertical_test, 'GPIO_AVAILABLE', True)
+    app.state = "brick_game"
+    app.start_brick_game()
+    app.brick_game.auto_launch_timer = 60.0
+    app.handle_events()
+
+def run_frame(app):
+    """One pass of the main loop for the brick game"""
+    app.game_loop()
+    app.handle_events()
+    app.update(1 / 30)
+    app.draw()
+
+def test_button_posted_before_draw_reaches_the_game(app, monkeypatch):
+    start_game(app, monkeypatch)
+    # gpiozero's thread posts the release between the app reading events and drawing
+    app.post_button_event('blue')
+    app.draw()
+    run_frame(app)
+    run_frame(app)
+    assert app.brick_game.ball_launched
+
+def test_game_keys_come_from_the_app(app, monkeypatch):
+    start_game(app, monkeypatch)
+    pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE, mod=0, unicode=' ', scancode=0))
+    app.handle_events()
+    assert app.brick_game.ball_launched
+    # Drawing leaves the queue to the app
+    app.post_button_event('yellow')
+    app.draw()
+    assert [event.type for event in pygame.event.get()] == [BUTTON_EVENT]
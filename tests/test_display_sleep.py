@@ -0,0 +1,154 @@
+import pygame
+import pytest
+import main_vertical_test
+from config import HEALTH_DECAY_INTERVAL, APPEAR_TIME, SLEEP_AFTER
+from frame_governor import DisplaySleep
+from graphics.mascot import Mascot, MascotState
+
+FRAME_TIME = 1 / 30
+
+def run_awake(mascot, clock, seconds):
+    """Update the mascot every frame for a while, as the awake display does"""
+    for _ in range(round(seconds / FRAME_TIME)):
+        clock.advance(FRAME_TIME)
+        mascot.update(FRAME_TIME)
+
+def test_sleeps_after_sleep_after_seconds_unused(clock):
+    display_sleep = DisplaySleep(clock=clock)
+    clock.advance(SLEEP_AFTER - 1)
+    assert not display_sleep.should_sleep()
+    display_sleep.note_activity()
+    clock.advance(SLEEP_AFTER - 1)
+    assert not display_sleep.should_sleep()
+    clock.advance(1)
+    assert display_sleep.should_sleep()
+
+    display_sleep.enter()
+    clock.advance(3600)
+    assert not display_sleep.should_sleep()
+    assert display_sleep.exit() == 3600
+    # Waking counts as activity, the full timeout runs again
+    clock.advance(SLEEP_AFTER - 1)
+    assert not display_sleep.should_sleep()
+
+def test_health_catches_up_over_sleep_wake_cycles(clock):
+    # One clock for the mascot and the sleep timer, fast-forwarded through each sleep
+    reference_clock = type(clock)(clock.now)
+    mascot = Mascot('koi', clock=clock)
+    reference = Mascot('koi', clock=reference_clock)
+    for each in (mascot, reference):
+        each.health = each.max_health = 100000
+    display_sleep = DisplaySleep(sleep_after=30, clock=clock)
+
+    # Odd lengths so sleeps end part way through a decay step
+    for awake, asleep in ((31.0, 7.3), (30.5, 3600.9), (45.2, 61.1)):
+        run_awake(mascot, clock, awake)
+        assert display_sleep.should_sleep()
+        display_sleep.enter()
+        clock.advance(asleep)  # No updates while the display sleeps
+        assert display_sleep.exit() == pytest.approx(asleep)
+        mascot.appear()
+        clock.advance(FRAME_TIME)
+        mascot.update(FRAME_TIME)
+
+        # The reference stayed awake the whole time
+        run_awake(reference, reference_clock, awake + asleep + FRAME_TIME)
+        assert mascot.health == reference.health
+        assert mascot.last_health_update == reference.last_health_update
+
+    assert display_sleep.get_stats()['sleep_count'] == 3
+    decay_steps = (reference_clock.now - 1000.0) // HEALTH_DECAY_INTERVAL
+    assert mascot.health == 100000 - mascot.config['health_decay_rate'] * decay_steps
+
+def test_wake_fades_in_then_settles(clock):
+    mascot = Mascot('koi', clock=clock)
+    clock.advance(APPEAR_TIME + 1)
+    mascot.update(FRAME_TIME)
+    assert not mascot.has_sprite_effect()
+
+    mascot.appear()
+    clock.advance(FRAME_TIME)
+    mascot.update(FRAME_TIME)
+    assert mascot.has_sprite_effect()
+    clock.advance(APPEAR_TIME)
+    mascot.update(FRAME_TIME)
+    assert not mascot.has_sprite_effect()
+
+def test_timers_and_death_settle_over_a_long_sleep(clock):
+    mascot = Mascot('koi', clock=clock)
+    mascot.make_dizzy()
+    mascot.update(FRAME_TIME)
+    assert mascot.is_dizzy
+
+    # Long enough for the dizzy spell to end and the health to run out
+    clock.advance(3600)
+    mascot.update(FRAME_TIME)
+    mascot.update(FRAME_TIME)
+    assert not mascot.is_dizzy
+    assert mascot.health == 0
+    assert mascot.current_state == MascotState.DEATH
+
+def post(event_type, **attributes):
+    pygame.event.post(pygame.event.Event(event_type, **attributes))
+
+def test_waking_key_press_only_wakes(app):
+    app.state = 'pet'
+    app.go_to_sleep()
+    post(pygame.KEYDOWN, key=pygame.K_a)
+    app.sleep_step()
+    assert not app.display_sleep.sleeping
+
+    post(pygame.KEYUP, key=pygame.K_a)
+    app.handle_events()
+    assert not app.yellow_button_up
+
+    # The next press acts as usual
+    post(pygame.KEYDOWN, key=pygame.K_a)
+    post(pygame.KEYUP, key=pygame.K_a)
+    app.handle_events()
+    assert app.yellow_button_up
+
+def test_waking_gpio_button_only_wakes(app, monkeypatch):
+    monkeypatch.setattr(main_vertical_test, 'GPIO_AVAILABLE', True)
+    app.state = 'pet'
+    app.go_to_sleep()
+    # GPIO buttons report the release only, so that one event is the whole press
+    app.post_button_event('yellow')
+    app.sleep_step()
+    assert not app.display_sleep.sleeping
+    app.handle_events()
+    assert not app.yellow_button_up
+
+    app.post_button_event('yellow')
+    app.handle_events()
+    assert app.yellow_button_up
+
+def test_waking_tap_only_wakes(app):
+    app.state = 'pet'
+    app.go_to_sleep()
+    # Click on the mascot; mouse events are in screen coordinates
+    mascot = app.layout.mascot_rect.center
+    screen_point = app.presenter.canvas_to_screen_rect((*mascot, 1, 1)).topleft
+    post(pygame.MOUSEBUTTONDOWN, pos=screen_point, button=1, touch=False)
+    app.sleep_step()
+    assert not app.display_sleep.sleeping
+    post(pygame.MOUSEBUTTONUP, pos=screen_point, button=1, touch=False)
+    app.handle_events()
+    assert app.touch_input.get_stats()['gestures'] == {}
+
+    post(pygame.MOUSEBUTTONDOWN, pos=screen_point, button=1, touch=False)
+    post(pygame.MOUSEBUTTONUP, pos=screen_point, button=1, touch=False)
+    app.handle_events()
+    assert app.touch_input.get_stats()['gestures'] == {'tap': 1}
+
+def test_pickup_wake_keeps_the_next_press(app, monkeypatch):
+    app.state = 'pet'
+    app.go_to_sleep()
+    monkeypatch.setattr(app.sensor_manager, 'detect_motion', lambda *args: True)
+    app.sleep_step()
+    assert not app.display_sleep.sleeping
+
+    post(pygame.KEYDOWN, key=pygame.K_d)
+    post(pygame.KEYUP, key=pygame.K_d)
+    app.handle_events()
+    assert app.blue_button_up
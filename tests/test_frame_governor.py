@@ -0,0 +1,89 @@
+import time
+import threading
+import pygame
+import pytest
+from frame_governor import FrameGovernor, FramePacer, BUTTON_EVENT
+from conftest import FakeClock
+
+def make_idle_governor():
+    """A governor that has been idle long enough to wait between frames"""
+    governor = FrameGovernor(idle_fps=10, idle_after=0.0)
+    governor.tick(30)
+    pygame.event.clear()
+    return governor
+
+def test_input_ends_idle_wait_at_once(display):
+    governor = make_idle_governor()
+    posted = []
+    def press():
+        time.sleep(0.03)
+        posted.append(time.monotonic())
+        pygame.event.post(pygame.event.Event(BUTTON_EVENT, button='blue'))
+    threading.Thread(target=press).start()
+
+    governor.tick(30)
+    assert time.monotonic() - posted[0] < 0.01
+    assert governor.get_stats()['early_wakeups'] == 1
+
+def test_idle_wait_leaves_events_queued_in_order(display):
+    governor = make_idle_governor()
+    pygame.event.post(pygame.event.Event(pygame.MOUSEMOTION, pos=(1, 1), rel=(0, 0), buttons=(0, 0, 0), touch=False))
+    pygame.event.post(pygame.event.Event(pygame.KEYUP, key=pygame.K_a))
+    pygame.event.post(pygame.event.Event(pygame.KEYUP, key=pygame.K_d))
+
+    assert governor.wait_until(time.monotonic() + 1.0)
+    events = pygame.event.get()
+    assert [event.type for event in events] == [pygame.MOUSEMOTION, pygame.KEYUP, pygame.KEYUP]
+    assert [event.key for event in events[1:]] == [pygame.K_a, pygame.K_d]
+
+def test_idle_frame_lands_on_next_keyframe(display):
+    governor = make_idle_governor()
+    start = time.monotonic()
+    governor.tick(30, next_keyframe=0.04)
+    assert 0.04 <= time.monotonic() - start < 0.06
+
+def test_idle_frame_waits_for_sensor_poll_before_distant_keyframe(display):
+    governor = make_idle_governor()
+    start = governor.last_frame_time
+    governor.tick(30, next_keyframe=5.0)
+    assert 0.1 <= time.monotonic() - start < 0.12
+
+class SteppingClock(FakeClock):
+    """A fake clock that creeps forward a microsecond per reading, so the pacer's spin ends"""
+
+    def __call__(self):
+        self.now += 1e-6
+        return self.now
+
+def run_frames(pacer, clock, fps, render_times):
+    """Present one frame per render time, each that long after its deadline"""
+    period = 1.0 / fps
+    for render_time in render_times:
+        pacer.wait(fps)
+        clock.advance(render_time)
+        pacer.note_present()
+        clock.advance(period - render_time)
+
+def test_jitter_is_measured_from_each_rate_period(display):
+    clock = SteppingClock()
+    pacer = FramePacer(mode='hybrid', clock=clock)
+    # Presents alternate 1 ms early and late around each rate's period
+    run_frames(pacer, clock, 60, [0.002, 0.004] * 20)
+    run_frames(pacer, clock, 30, [0.002, 0.004] * 20)
+
+    stats = pacer.get_stats()
+    assert stats['jitter_p50_ms'] == pytest.approx(2.0, abs=0.1)
+    assert stats['jitter_p99_ms'] == pytest.approx(2.0, abs=0.1)
+    assert stats['start_jitter_p99_ms'] < 0.1
+
+def test_reset_drops_the_interval_across_a_wait(display):
+    clock = SteppingClock()
+    pacer = FramePacer(mode='hybrid', clock=clock)
+    run_frames(pacer, clock, 30, [0.002] * 3)
+    assert len(pacer.intervals) == 2
+
+    # An idle wait times the next frame; its present must not count as a paced interval
+    pacer.reset()
+    clock.advance(1.0)
+    run_frames(pacer, clock, 30, [0.002])
+    assert len(pacer.intervals) == 2
@@ -0,0 +1,112 @@
+import random
+import numpy
+import pytest
+from config import PARTICLE_LIFETIME, SHAKE_DURATION
+from graphics.mascot import Mascot
+from sensor_manager import SensorManager
+
+RATES = (10, 30, 60)
+SECONDS = 6.0
+SAMPLE_INTERVAL = 0.1  # every frame at 10 fps
+
+# Scripted events, in seconds from the start; the ones that emit particles are listed too
+PET_TIME = 0.5
+DIZZY_TIME = 1.0
+DRINK_TIME = 2.0
+APPEAR_TIME = 3.5
+EMIT_TIMES = (PET_TIME, DRINK_TIME)
+
+NO_SENSOR_DATA = {'drinking_detected': False, 'shaking_detected': False, 'water_amount': 0,
+                  'just_ended_drinking': False, 'last_session_amount': 0}
+
+def run_script(app, clock, fps):
+    """Run the scripted session at fps on the virtual clock, sampling the simulation every SAMPLE_INTERVAL"""
+    random.seed(7)
+    numpy.random.seed(7)
+    start = 1000.0
+    clock.now = start
+    mascot = Mascot('koi', clock=clock)
+    mascot.health = 80
+    mascot.hearts = 1
+    app.current_mascot = mascot
+    app.particles.clear()
+    app.state = 'pet'
+    app.pet.stop_speaking()
+
+    step = round(fps * SAMPLE_INTERVAL)
+    events = {round(PET_TIME * fps): app.pet_mascot, round(DIZZY_TIME * fps): mascot.make_dizzy,
+              round(DRINK_TIME * fps): lambda: app.handle_drinking(20), round(APPEAR_TIME * fps): mascot.appear}
+    samples = []
+    for frame in range(int(SECONDS * fps) + 1):
+        clock.now = start + frame / fps
+        if frame in events:
+            events[frame]()
+        app.update(1 / fps)
+        if frame % step == 0:
+            count = len(app.particles)
+            samples.append({
+                'time': round(frame / fps, 2),
+                'health': mascot.health,
+                'hurt_timer': mascot.hurt_timer,
+                'appear_timer': mascot.appear_timer,
+                'dizzy_timer': mascot.dizzy_timer,
+                'state': mascot.get_animation_state(),
+                'sprite': mascot.get_sprite_version(),
+                'particles': count,
+                'particle_x': float(app.particles.x[:count].mean()) if count else 0.0,
+                'particle_y': float(app.particles.y[:count].mean()) if count else 0.0
+            })
+    return samples
+
+def test_mascot_screen_runs_the_same_at_any_frame_rate(app, clock, monkeypatch):
+    monkeypatch.setattr(app.sensor_manager, 'update', lambda: NO_SENSOR_DATA)
+    runs = {fps: run_script(app, clock, fps) for fps in RATES}
+
+    reference = runs[60]
+    # A particle dies on the first frame at or after its lifetime ends, so counts
+    # may differ by a frame right at the end of a lifetime
+    expiries = [round(time + PARTICLE_LIFETIME, 2) for time in EMIT_TIMES]
+    for fps in (10, 30):
+        assert len(runs[fps]) == len(reference)
+        for sample, expected in zip(runs[fps], reference):
+            assert sample['time'] == expected['time']
+            assert sample['health'] == pytest.approx(expected['health'], abs=0.01), sample['time']
+            for timer in ('hurt_timer', 'appear_timer', 'dizzy_timer'):
+                assert sample[timer] == pytest.approx(expected[timer], abs=1e-6), (sample['time'], timer)
+            assert sample['state'] == expected['state'], sample['time']
+            assert sample['sprite'] == expected['sprite'], sample['time']
+            if sample['time'] in expiries:
+                continue
+            assert sample['particles'] == expected['particles'], sample['time']
+            assert sample['particle_x'] == pytest.approx(expected['particle_x'], abs=0.05), sample['time']
+            assert sample['particle_y'] == pytest.approx(expected['particle_y'], abs=0.05), sample['time']
+
+    # The script did exercise each part
+    samples = reference
+    assert max(sample['particles'] for sample in samples) > 0
+    assert any(sample['state'] == 'dizzy' for sample in samples)
+    assert any(sample['state'] == 'drinking' for sample in samples)
+    assert max(sample['health'] for sample in samples) > samples[0]['health']
+
+def shake_end(hz, spike_time=0.1, seconds=5.0):
+    """Feed one acceleration spike at hz readings per second, return when the shake stops"""
+    sensor = SensorManager()
+    end = None
+    detected = False
+    for reading in range(int(seconds * hz)):
+        time = reading / hz
+        spike = reading == round(spike_time * hz)
+        sensor.accel_x, sensor.accel_y, sensor.accel_z = (2.5, 0.0, 1.0) if spike else (0.0, 0.0, 1.0)
+        shaking = sensor.detect_shake(time)
+        detected = detected or shaking
+        if detected and not shaking and end is None:
+            end = time
+    assert detected
+    return end
+
+def test_shake_lasts_the_same_at_any_reading_rate(display):
+    ends = [shake_end(hz) for hz in RATES]
+    # Ends within a reading of each other, SHAKE_DURATION after the spike left the window
+    assert max(ends) - min(ends) <= 1 / min(RATES) + 1e-9
+    for end in ends:
+        assert SHAKE_DURATION < end < SHAKE_DURATION + 0.5
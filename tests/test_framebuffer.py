@@ -0,0 +1,90 @@
+import numpy
+import pygame
+import pytest
+from graphics.display import FramebufferPresenter
+
+CANVAS_SIZE = (60, 100)
+# Wider and taller than the rotated canvas, so it is centered with a border
+FRAMEBUFFER_SIZE = (120, 80)
+
+# 32 bpp with the canvas already XRGB8888, 32 bpp from a BGR canvas, and RGB565
+FORMATS = [
+    (32, (0xff0000, 0x00ff00, 0x0000ff, 0)),
+    (32, (0x0000ff, 0x00ff00, 0xff0000, 0)),
+    (16, (0xff0000, 0x00ff00, 0x0000ff, 0)),
+]
+
+def make_canvas(masks, seed):
+    """A 32-bit canvas of random pixels with the given channel masks"""
+    canvas = pygame.Surface(CANVAS_SIZE, 0, 32, masks)
+    rgb = numpy.random.default_rng(seed).integers(0, 256, CANVAS_SIZE + (3,), dtype=numpy.uint8)
+    pygame.surfarray.blit_array(canvas, rgb)
+    return canvas
+
+def pack(rgb, bits_per_pixel):
+    """Pack [row, column, channel] RGB into XRGB8888 or RGB565 values"""
+    red, green, blue = (rgb[..., channel].astype(numpy.uint32) for channel in range(3))
+    if bits_per_pixel == 16:
+        return (red >> 3) << 11 | (green >> 2) << 5 | blue >> 3
+    return red << 16 | green << 8 | blue
+
+def expected_framebuffer(screen, bits_per_pixel):
+    """Pack a reference screen surface the way the framebuffer should hold it"""
+    return pack(pygame.surfarray.array3d(screen).transpose(1, 0, 2), bits_per_pixel)
+
+def rotated_screen(canvas):
+    """The reference: pygame's own rotation of the canvas, centered on a black screen"""
+    screen = pygame.Surface(FRAMEBUFFER_SIZE, 0, 32)
+    rotated = pygame.transform.rotate(canvas, 270)
+    screen.blit(rotated, rotated.get_rect(center=screen.get_rect().center))
+    return screen
+
+def read_framebuffer(path, bits_per_pixel, stride):
+    """Read the visible pixels back from the file standing in for the device"""
+    width, height = FRAMEBUFFER_SIZE
+    dtype = numpy.uint16 if bits_per_pixel == 16 else numpy.uint32
+    with open(path, 'rb') as f:
+        rows = numpy.frombuffer(f.read(), dtype=dtype).reshape(height, stride // (bits_per_pixel // 8))
+    pixels = rows[:, :width].astype(numpy.uint32)
+    return pixels & 0xffffff if bits_per_pixel == 32 else pixels
+
+def make_presenter(tmp_path, canvas, bits_per_pixel):
+    """A presenter on a temp file, with row padding past the visible width"""
+    stride = (FRAMEBUFFER_SIZE[0] + 8) * bits_per_pixel // 8
+    path = str(tmp_path / 'framebuffer.bin')
+    presenter = FramebufferPresenter(canvas, path, size=FRAMEBUFFER_SIZE, bits_per_pixel=bits_per_pixel, stride=stride)
+    return presenter, path, stride
+
+@pytest.mark.parametrize('bits_per_pixel, masks', FORMATS)
+def test_full_frame_matches_pygame_rotation(tmp_path, bits_per_pixel, masks):
+    canvas = make_canvas(masks, seed=1)
+    presenter, path, stride = make_presenter(tmp_path, canvas, bits_per_pixel)
+    assert presenter.direct_copy == (bits_per_pixel == 32 and masks[0] == 0xff0000)
+
+    presenter.present()
+    presenter.close()
+
+    expected = expected_framebuffer(rotated_screen(canvas), bits_per_pixel)
+    numpy.testing.assert_array_equal(read_framebuffer(path, bits_per_pixel, stride), expected)
+
+@pytest.mark.parametrize('bits_per_pixel, masks', FORMATS)
+def test_dirty_rects_write_only_their_area(tmp_path, bits_per_pixel, masks):
+    canvas = make_canvas(masks, seed=2)
+    presenter, path, stride = make_presenter(tmp_path, canvas, bits_per_pixel)
+    presenter.present()
+    before = rotated_screen(canvas)
+
+    # Change two areas but only report one of them as dirty
+    dirty = pygame.Rect(5, 10, 20, 30)
+    canvas.fill((10, 200, 90), dirty)
+    canvas.fill((250, 0, 120), (40, 70, 10, 10))
+    presenter.present([dirty])
+    presenter.close()
+
+    # Only the dirty area shows the new frame, the rest still holds the first one
+    expected_screen = before.copy()
+    screen_rect = presenter.canvas_to_screen_rect(dirty)
+    expected_screen.blit(rotated_screen(canvas), screen_rect, screen_rect)
+    expected = expected_framebuffer(expected_screen, bits_per_pixel)
+    numpy.testing.assert_array_equal(read_framebuffer(path, bits_per_pixel, stride), expected)
+    assert presenter.get_stats()['frames'] == 2
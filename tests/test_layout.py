@@ -0,0 +1,36 @@
+import pygame
+import pytest
+from graphics.layout import Layout
+from graphics.brick_game import BrickGame
+
+SIZES = [(600, 1024), (480, 800), (768, 1366), (800, 1024), (1080, 1920), (400, 1024)]
+
+@pytest.mark.parametrize('width,height', SIZES)
+def test_brick_game_fits_the_canvas(display, width, height):
+    layout = Layout(width, height)
+    game = BrickGame(pygame.Surface((width, height)), None, width, height, test_mode=True, layout=layout)
+
+    left = min(brick['x'] for brick in game.bricks)
+    right = max(brick['x'] + brick['width'] for brick in game.bricks)
+    assert left >= 0 and right <= width
+    # Centered, give or take the odd pixel
+    assert abs(left - (width - right)) <= 1
+    assert game.paddle_y + game.paddle_height <= height
+    assert 0 <= game.ball_y < game.paddle_y
+
+def test_design_canvas_keeps_design_metrics():
+    layout = Layout(600, 1024)
+    assert layout.brick_columns == 10
+    assert layout.brick_size == (50, 18)
+    assert layout.paddle_size == (80, 15)
+    assert layout.speech_wrap_width == 200
+    assert layout.scale_font(20) == 20
+
+def test_small_canvas_scales_metrics_down():
+    layout = Layout(480, 800)
+    assert layout.brick_size[0] < 50
+    assert layout.paddle_size[0] < 80
+    assert layout.speech_wrap_width < 200
+    assert layout.speech_bubble_line_height < 25
+    assert layout.scale_font(20) < 20
+    assert layout.achievement_text_y < 50
@@ -0,0 +1,95 @@
+import time
+import socket
+import numpy
+import pygame
+import pytest
+from graphics.mirror import MirrorServer, MirrorClient
+
+SIZE = (100, 70)
+TILE = 16
+
+def as_pixels(canvas):
+    """The canvas as (height, width) pixels in the server's 32-bit format"""
+    surface = pygame.Surface(SIZE, 0, 32)
+    surface.blit(canvas, (0, 0))
+    return pygame.surfarray.array2d(surface).T
+
+@pytest.fixture
+def mirror(display, tmp_path):
+    """A mirror server on a unix socket with a viewer connected to it"""
+    address = f"unix:{tmp_path / 'mirror.sock'}"
+    server = MirrorServer(SIZE, address, tile_size=TILE, max_fps=1000, max_kbps=1024 * 1024)
+    client = MirrorClient(address)
+    deadline = time.monotonic() + 2.0
+    while server.client is None and time.monotonic() < deadline:
+        time.sleep(0.005)
+    yield server, client
+    client.close()
+    server.close()
+
+def send(server, client, canvas):
+    """Publish a frame and wait for the viewer to have it"""
+    server.last_publish = 0.0
+    server.publish(canvas)
+    client.sock.settimeout(2.0)
+    return client.receive_frame()
+
+@pytest.mark.parametrize('depth', [8, 32])
+def test_viewer_rebuilds_frames(mirror, depth):
+    server, client = mirror
+    canvas = pygame.Surface(SIZE, 0, depth)
+    if depth == 8:
+        canvas.set_palette([(i, i, i) for i in range(256)])
+    for x in range(SIZE[0]):
+        canvas.fill((x * 2, 255 - x * 2, x), (x, 0, 1, SIZE[1]))
+
+    assert send(server, client, canvas) == 0
+    assert numpy.array_equal(client.get_pixels(), as_pixels(canvas))
+
+    # A small change only sends the tiles it touches, and the rest is kept
+    canvas.fill((255, 255, 255), (40, 40, 5, 5))
+    assert send(server, client, canvas) == 1
+    assert numpy.array_equal(client.get_pixels(), as_pixels(canvas))
+    # The sender counts a frame once it is sent, which the viewer can see first
+    deadline = time.monotonic() + 2.0
+    while server.frames_sent < 2 and time.monotonic() < deadline:
+        time.sleep(0.005)
+    assert server.get_stats()['avg_tiles'] == (server.columns * server.rows + 1) / 2
+
+def test_draw_copies_frame_to_surface(mirror):
+    server, client = mirror
+    canvas = pygame.Surface(SIZE, 0, 32)
+    canvas.fill((10, 200, 30))
+    canvas.fill((250, 0, 120), (5, 60, 90, 10))
+    send(server, client, canvas)
+
+    surface = pygame.Surface(SIZE, 0, 32, client.masks)
+    client.draw(surface)
+    assert surface.get_at((0, 0))[:3] == (10, 200, 30)
+    assert surface.get_at((50, 65))[:3] == (250, 0, 120)
+
+def test_unusable_address_runs_without_mirror(monkeypatch, request, capsys):
+    import main_vertical_test
+    monkeypatch.setattr(main_vertical_test, 'MIRROR_ADDRESS', 'serial:/dev/ttyS0')
+    app = request.getfixturevalue('app')
+    assert app.mirror is None
+    # The server was handed this address, not another default
+    assert "got serial:/dev/ttyS0" in capsys.readouterr().out
+
+def test_port_in_use_runs_without_mirror(monkeypatch, request):
+    import main_vertical_test
+    with socket.create_server(('127.0.0.1', 0)) as taken:
+        monkeypatch.setattr(main_vertical_test, 'MIRROR_ADDRESS', f"tcp:127.0.0.1:{taken.getsockname()[1]}")
+        app = request.getfixturevalue('app')
+        assert app.mirror is None
+
+def test_app_serves_its_mirror_address(monkeypatch, tmp_path, request):
+    import main_vertical_test
+    address = f"unix:{tmp_path / 'app-mirror.sock'}"
+    monkeypatch.setattr(main_vertical_test, 'MIRROR_ADDRESS', address)
+    app = request.getfixturevalue('app')
+    assert app.mirror is not None
+    assert app.mirror.address == address
+
+    app.mirror.close()
+    assert not (tmp_path / 'app-mirror.sock').exists()
@@ -0,0 +1,41 @@
+import os
+import numpy
+import pygame
+import pytest
+from graphics.recorder import FrameRecorder
+
+SIZE = (30, 20)
+
+def make_canvas(depth):
+    """A canvas of depth bits with a different colour in every pixel row and column"""
+    canvas = pygame.Surface(SIZE, 0, depth)
+    if depth == 8:
+        canvas.set_palette([(i, 255 - i, (i * 7) % 256) for i in range(256)])
+    for x in range(SIZE[0]):
+        for y in range(SIZE[1]):
+            canvas.set_at((x, y), (x * 8, y * 12, (x + y) * 5))
+    return canvas
+
+@pytest.mark.parametrize('depth', [8, 16, 24, 32])
+def test_raw_recording_matches_canvas(display, tmp_path, depth):
+    canvas = make_canvas(depth)
+    recorder = FrameRecorder(SIZE, str(tmp_path), 'raw', pool_size=2)
+    assert all(buffer.get_bitsize() == 32 for buffer in recorder.free_buffers.queue)
+
+    assert recorder.capture(canvas)
+    recorder.stop()
+
+    width, height = SIZE
+    frames = numpy.fromfile(os.path.join(tmp_path, 'frames.rgb'), dtype=numpy.uint8)
+    # SDL's own expansion of the canvas to 24-bit colour
+    reference = pygame.Surface(SIZE, 0, 32)
+    reference.blit(canvas, (0, 0))
+    expected = pygame.surfarray.array3d(reference).transpose(1, 0, 2)
+    assert numpy.array_equal(frames.reshape(height, width, 3), expected)
+
+def test_unknown_record_mode_runs_without_recording(monkeypatch, tmp_path, request):
+    import main_vertical_test
+    monkeypatch.setattr(main_vertical_test, 'RECORD_MODE', 'mp4')
+    monkeypatch.setattr(main_vertical_test, 'RECORD_DIR', str(tmp_path))
+    app = request.getfixturevalue('app')
+    assert app.recorder is None
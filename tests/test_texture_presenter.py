@@ -0,0 +1,48 @@
+import numpy
+import pygame
+import pytest
+from graphics.display import TexturePresenter
+
+CANVAS_SIZE = (60, 100)
+WINDOW_SIZE = (100, 60)
+
+def make_canvas(seed):
+    """A 32-bit canvas of random pixels, so any misplaced pixel shows"""
+    canvas = pygame.Surface(CANVAS_SIZE, 0, 32)
+    rgb = numpy.random.default_rng(seed).integers(0, 256, CANVAS_SIZE + (3,), dtype=numpy.uint8)
+    pygame.surfarray.blit_array(canvas, rgb)
+    return canvas
+
+def assert_shows(presenter, canvas):
+    """The renderer's output matches pygame's own rotation of the canvas, pixel for pixel"""
+    screen = presenter.read_screen()
+    expected = pygame.transform.rotate(canvas, 270)
+    assert screen.get_size() == expected.get_size()
+    assert numpy.array_equal(pygame.surfarray.array3d(screen), pygame.surfarray.array3d(expected))
+
+@pytest.fixture
+def presenter(display):
+    """A texture presenter on the dummy driver, which only has the software renderer"""
+    canvas = make_canvas(1)
+    texture_presenter = TexturePresenter(canvas, WINDOW_SIZE, rotation=270, vsync=False)
+    yield texture_presenter
+    texture_presenter.window.destroy()
+
+def test_presents_rotated_canvas(presenter):
+    assert presenter.driver == 'software'
+    presenter.present()
+    assert_shows(presenter, presenter.canvas)
+    assert presenter.get_stats()['frames'] == 1
+
+def test_dirty_rects_update_only_their_area(presenter):
+    presenter.present()
+    before = presenter.canvas.copy()
+
+    # Change the whole canvas but only report one rect; the rest keeps the old texture
+    presenter.canvas.blit(make_canvas(2), (0, 0))
+    dirty = pygame.Rect(10, 20, 15, 30)
+    presenter.present([dirty])
+
+    expected = before.copy()
+    expected.blit(presenter.canvas, dirty, dirty)
+    assert_shows(presenter, expected)
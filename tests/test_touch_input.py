@@ -0,0 +1,40 @@
+import pygame
+import pytest
+from graphics.layout import Layout
+from touch_input import TouchInput, GESTURE_TAP
+
+SIZE = (600, 1024)
+
+@pytest.fixture
+def touch(clock):
+    """Touch input on an unrotated screen the canvas's size, so events are in canvas pixels"""
+    touch_input = TouchInput(SIZE, SIZE, rotation=0, clock=clock)
+    touch_input.set_layout(Layout(*SIZE))
+    return touch_input
+
+def finger(kind, finger_id, point):
+    """A finger event at a canvas point"""
+    return pygame.event.Event(kind, touch_id=0, finger_id=finger_id, x=point[0] / SIZE[0], y=point[1] / SIZE[1],
+                              dx=0.0, dy=0.0, pressure=1.0)
+
+@pytest.mark.parametrize('second_finger', [1, 2])
+def test_down_without_lift_does_not_block_touches(touch, clock, second_finger):
+    mascot = touch.layout.mascot_rect.center
+    # The first touch's lift never arrives
+    assert touch.handle_event(finger(pygame.FINGERDOWN, 1, mascot), 'pet') == []
+    clock.advance(0.1)
+
+    assert touch.handle_event(finger(pygame.FINGERDOWN, second_finger, mascot), 'pet') == []
+    clock.advance(0.1)
+    gestures = touch.handle_event(finger(pygame.FINGERUP, second_finger, mascot), 'pet')
+
+    assert [(gesture.kind, gesture.region) for gesture in gestures] == [(GESTURE_TAP, 'mascot')]
+    assert not touch.is_touching()
+    assert touch.get_stats()['stale_touches'] == 1
+
+def test_lift_of_a_replaced_touch_is_ignored(touch, clock):
+    mascot = touch.layout.mascot_rect.center
+    touch.handle_event(finger(pygame.FINGERDOWN, 1, mascot), 'pet')
+    touch.handle_event(finger(pygame.FINGERDOWN, 2, mascot), 'pet')
+    assert touch.handle_event(finger(pygame.FINGERUP, 1, mascot), 'pet') == []
+    assert touch.is_touching()
@@ -0,0 +1,242 @@
+import time
+from collections import deque
+import pygame
+from config import *
+from graphics.display import map_screen_point
+from frame_governor import percentile
+
+# ========================================
+# TOUCH INPUT - GESTURES ON SCREEN REGIONS
+# Touches are mapped through the display rotation onto the canvas, hit-tested
+# against a grid of interactive regions and turned into taps, long presses,
+# swipes and drags
+# ========================================
+
+GESTURE_TAP = 'tap'
+GESTURE_LONG_PRESS = 'long_press'
+GESTURE_SWIPE = 'swipe'
+GESTURE_DRAG = 'drag'  # finger down or moving in a region that tracks it (the paddle zone)
+
+# Regions that follow the finger instead of waiting for a gesture to finish
+DRAG_REGIONS = ('paddle',)
+
+class Gesture:
+    def __init__(self, kind, region, position, timestamp, direction=None):
+        """A recognised gesture; position is in canvas pixels, timestamp is when its input event was read"""
+        self.kind = kind
+        self.region = region
+        self.position = position
+        self.timestamp = timestamp
+        self.direction = direction  # 'left', 'right', 'up' or 'down' for swipes
+
+    def __repr__(self):
+        return f"Gesture({self.kind}, {self.region}, {self.position}, {self.direction})"
+
+class RegionGrid:
+    def __init__(self, size, cell_size=TOUCH_GRID_CELL):
+        """Uniform grid over the canvas, each cell listing the regions that overlap it"""
+        self.cell_size = cell_size
+        self.columns = -(-size[0] // cell_size)
+        self.rows = -(-size[1] // cell_size)
+        self.clear()
+
+    def clear(self):
+        """Remove every region"""
+        self.cells = [[] for _ in range(self.columns * self.rows)]
+        self.region_count = 0
+
+    def add(self, name, rect, screens):
+        """Add a region active on the given screens (app states); later regions are on top"""
+        rect = pygame.Rect(rect)
+        first_column = max(0, rect.left // self.cell_size)
+        last_column = min(self.columns - 1, (rect.right - 1) // self.cell_size)
+        first_row = max(0, rect.top // self.cell_size)
+        last_row = min(self.rows - 1, (rect.bottom - 1) // self.cell_size)
+        region = (self.region_count, name, rect, screens)
+        for row in range(first_row, last_row + 1):
+            for column in range(first_column, last_column + 1):
+                self.cells[row * self.columns + column].append(region)
+        self.region_count += 1
+
+    def hit_test(self, point, screen):
+        """Get the name of the topmost region under a canvas point on a screen, None if there is none"""
+        column = point[0] // self.cell_size
+        row = point[1] // self.cell_size
+        if not (0 <= column < self.columns and 0 <= row < self.rows):
+            return None
+        hit = None
+        for region in self.cells[row * self.columns + column]:
+            _, name, rect, screens = region
+            if screen in screens and rect.collidepoint(point) and (hit is None or region[0] > hit[0]):
+                hit = region
+        return hit[1] if hit else None
+
+class TouchInput:
+    def __init__(self, canvas_size, screen_size, rotation=270, clock=time.perf_counter):
+        """Turn touch and mouse events on the rotated screen into gestures on the canvas"""
+        self.canvas_size = canvas_size
+        self.screen_size = screen_size
+        self.rotation = rotation
+        self.clock = clock
+        self.grid = RegionGrid(canvas_size)
+        self.layout = None
+
+        # Thresholds follow the layout's scale
+        self.tap_slop = TOUCH_TAP_SLOP
+        self.swipe_distance = TOUCH_SWIPE_DISTANCE
+
+        # The touch in progress; a new down replaces it, in case its lift was never seen
+        self.finger = None
+        self.down_position = None
+        self.down_region = None
+        self.down_time = 0.0
+        self.moved = False
+        self.long_pressed = False
+
+        # Gestures reacted to and waiting for the frame that shows the reaction
+        self.awaiting_present = []
+        self.latencies = deque(maxlen=TOUCH_LATENCY_SAMPLES)
+
+        # Statistics
+        self.gesture_counts = {}
+        self.index_builds = 0
+        self.stale_touches = 0
+
+    def set_layout(self, layout):
+        """Rebuild the hit-test grid for a layout; a no-op when the layout has not changed"""
+        if layout is self.layout:
+            return
+        self.layout = layout
+        self.tap_slop = layout.scale(TOUCH_TAP_SLOP)
+        self.swipe_distance = layout.scale(TOUCH_SWIPE_DISTANCE)
+
+        self.grid.clear()
+        self.grid.add('paddle', layout.paddle_zone, ('brick_game',))
+        self.grid.add('speech', layout.speech_rect, ('pet',))
+        self.grid.add('hud', layout.hud_rect, ('pet',))
+        self.grid.add('mascot', layout.mascot_rect, ('selection', 'pet'))
+        self.index_builds += 1
+
+    def get_canvas_point(self, event):
+        """Get the canvas point of a touch or mouse event, None if it is off the canvas"""
+        if event.type in (pygame.FINGERDOWN, pygame.FINGERUP, pygame.FINGERMOTION):
+            # Finger positions are normalised to the touch surface
+            screen_width, screen_height = self.screen_size
+            point = (event.x * screen_width, event.y * screen_height)
+        else:
+            point = event.pos
+        return map_screen_point(point, self.canvas_size, self.screen_size, self.rotation)
+
+    def handle_event(self, event, screen):
+        """Feed one pygame event, return the gestures it completes on a screen (app state)"""
+        if event.type in (pygame.FINGERDOWN, pygame.FINGERUP, pygame.FINGERMOTION):
+            finger = event.finger_id
+        elif event.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION):
+            # SDL also reports touches as mouse events; those are handled as fingers
+            if getattr(event, 'touch', False):
+                return []
+            if event.type == pygame.MOUSEMOTION:
+                if not event.buttons[0]:
+                    return []
+            elif event.button != 1:
+                return []
+            finger = 'mouse'
+        else:
+            return []
+
+        now = self.clock()
+        point = self.get_canvas_point(event)
+
+        if event.type in (pygame.FINGERDOWN, pygame.MOUSEBUTTONDOWN):
+            if point is None:
+                return []
+            if self.finger is not None:
+                # A down while a touch is tracked means its lift went missing; holding
+                # on to it would block every touch and keep the full frame rate
+                self.stale_touches += 1
+            self.finger = finger
+            self.down_position = point
+            self.down_region = self.grid.hit_test(point, screen)
+            self.down_time = now
+            self.moved = False
+            self.long_pressed = False
+            if self.down_region in DRAG_REGIONS:
+                return [self.make_gesture(GESTURE_DRAG, point, now)]
+            return []
+
+        if finger != self.finger:
+            return []
+
+        if event.type in (pygame.FINGERMOTION, pygame.MOUSEMOTION):
+            if point is None:
+                return []
+            if not self.moved and self.get_distance(point) > self.tap_slop:
+                self.moved = True
+            if self.down_region in DRAG_REGIONS:
+                return [self.make_gesture(GESTURE_DRAG, point, now)]
+            return []
+
+        # Finger lifted
+        self.finger = None
+        if self.long_pressed or self.down_region in DRAG_REGIONS:
+            return []
+        if point is not None and self.get_distance(point) >= self.swipe_distance:
+            return [self.make_gesture(GESTURE_SWIPE, self.down_position, now, self.get_direction(point))]
+        if not self.moved:
+            return [self.make_gesture(GESTURE_TAP, self.down_position, now)]
+        return []
+
+    def update(self):
+        """Get a long press once a touch has been held in place long enough; call every frame"""
+        now = self.clock()
+        if (self.finger is None or self.moved or self.long_pressed or self.down_region in DRAG_REGIONS
+                or now - self.down_time < TOUCH_LONG_PRESS_TIME):
+            return []
+        self.long_pressed = True
+        return [self.make_gesture(GESTURE_LONG_PRESS, self.down_position, now)]
+
+    def is_touching(self):
+        """Check if a finger is down, so a long press can be timed"""
+        return self.finger is not None
+
+    def make_gesture(self, kind, position, timestamp, direction=None):
+        """Build a gesture on the region the touch began in and count it"""
+        self.gesture_counts[kind] = self.gesture_counts.get(kind, 0) + 1
+        return Gesture(kind, self.down_region, position, timestamp, direction)
+
+    def get_distance(self, point):
+        """Get how far a point is from where the touch began"""
+        return max(abs(point[0] - self.down_position[0]), abs(point[1] - self.down_position[1]))
+
+    def get_direction(self, point):
+        """Get the main direction from where the touch began to a point"""
+        dx = point[0] - self.down_position[0]
+        dy = point[1] - self.down_position[1]
+        if abs(dx) > abs(dy):
+            return 'right' if dx > 0 else 'left'
+        return 'down' if dy > 0 else 'up'
+
+    def note_reaction(self, gesture):
+        """The app acted on a gesture; its latency is taken when the next frame is presented"""
+        self.awaiting_present.append(gesture.timestamp)
+
+    def note_presented(self):
+        """A frame reached the screen, record the latency of every reaction it shows"""
+        if not self.awaiting_present:
+            return
+        now = self.clock()
+        for timestamp in self.awaiting_present:
+            self.latencies.append(now - timestamp)
+        self.awaiting_present.clear()
+
+    def get_stats(self):
+        """Get gesture counts, grid rebuilds and touch-to-screen latency percentiles"""
+        latencies = sorted(self.latencies)
+        return {
+            'gestures': dict(self.gesture_counts),
+            'index_builds': self.index_builds,
+            'stale_touches': self.stale_touches,
+            'latency_p50_ms': percentile(latencies, 0.5) * 1000,
+            'latency_p95_ms': percentile(latencies, 0.95) * 1000,
+            'latency_max_ms': latencies[-1] * 1000 if latencies else 0.0
+        }